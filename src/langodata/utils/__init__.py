@@ -1,36 +1,72 @@
 # utils/__init__.py
-from .data_reader import read_data, read_profile
-from .msp_data import read_msp_data
-from .macroeconomics_data import read_macroeconomics_data
-from .itrs_data import read_itrs_data
-from .database import DatabaseConnection
-from .logger import Logger
-from .decryption import decrypt, encrypt
-from .license_manager import encrypt_value, decrypt_value, validate_license, check_license_status, generate_license
-from .auth_token import generate_token, verify_token, perform_domain_login, authenticate_user
-from .profile_reader import read_fsp_profile
-from .submission_manager import read_submissions
+#
+# Submodules are imported on first attribute access so that `import langodata.utils`
+# does not pull in pandas, oracledb, cryptography, requests or jwt up front.
+import importlib
 
 
-__all__ = [
-    "read_data",
-    "read_profile",
-    "read_msp_data",
-    "read_macroeconomics_data",
-    "read_itrs_data",
-    "DatabaseConnection",
-    "Logger",
-    "decrypt",
-    "encrypt",
-    "encrypt_value",
-    "decrypt_value",
-    "validate_license",
-    "check_license_status",
-    "generate_license",
-    "generate_token",
-    "verify_token",
-    "perform_domain_login",
-    "authenticate_user",
-    "read_fsp_profile",
-    "read_submissions",
-]
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "read_data": "data_reader",
+    "read_profile": "data_reader",
+    "read_data_async": "data_reader",
+    "read_profile_async": "data_reader",
+    "read_many": "data_reader",
+    "read_msp_data": "msp_data",
+    "read_macroeconomics_data": "macroeconomics_data",
+    "read_itrs_data": "itrs_data",
+    "DatabaseConnection": "database",
+    "configure_pool": "database",
+    "pool_stats": "database",
+    "close_pools": "database",
+    "statement_stats": "database",
+    "reset_statement_stats": "database",
+    "AsyncDatabaseConnection": "database",
+    "close_async_pools": "database",
+    "Logger": "logger",
+    "decrypt": "decryption",
+    "encrypt": "decryption",
+    "encrypt_value": "license_manager",
+    "decrypt_value": "license_manager",
+    "validate_license": "license_manager",
+    "check_license_status": "license_manager",
+    "generate_license": "license_manager",
+    "get_license_expiry": "license_manager",
+    "clear_license_session": "license_manager",
+    "generate_token": "auth_token",
+    "verify_token": "auth_token",
+    "set_credential_provider": "auth_token",
+    "get_cached_token": "auth_token",
+    "renew_token": "auth_token",
+    "stop_token_refresher": "auth_token",
+    "perform_domain_login": "auth_token",
+    "authenticate_user": "auth_token",
+    "read_fsp_profile": "profile_reader",
+    "read_submissions": "submission_manager",
+    "set_trace_file": "tracing",
+    "configure_result_cache": "result_cache",
+    "clear_result_cache": "result_cache",
+    "result_cache_stats": "result_cache",
+    "invalidate_stale_partitions": "cache_invalidation",
+    "start_cache_invalidator": "cache_invalidation",
+    "stop_cache_invalidator": "cache_invalidation",
+    "refresh_rates": "itrs_rates",
+    "rates_as_of": "itrs_rates",
+    "convert_currency": "itrs_rates",
+    "convert_totals": "itrs_rates",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,13 +12,15 @@ The authenticate_user function checks if the user has a valid token. If not, it
 """
 
 import os
+import sys
+import threading
+import time
 import jwt  # Install this package with pip install pyjwt
 from datetime import datetime, timedelta
 from langodata.utils.database import DatabaseConnection
 from langodata.utils.logger import Logger
-from langodata.utils.license_manager import validate_license
+from langodata.utils.license_manager import validate_license, load_environment
 import requests
-import sys
 import getpass
 import pytz  # Import pytz for timezone handling
 
@@ -34,21 +36,47 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.getcwd(), '../MSPUsersDev')))
 #CERT_PATH = os.getenv("CERT_PATH", "./certificate/_.bot.go.tz.crt")
 
 
-SECRET_KEY = os.getenv("SECRET_KEY")
-LOGIN_URL = os.getenv("LOGIN_URL")
+# Token lifetime, how long before expiry it is renewed in the background, and
+# how long a login may be stretched by renewals before a fresh login is needed.
+TOKEN_LIFETIME_MINUTES = 30
+TOKEN_REFRESH_MARGIN = int(os.getenv("TOKEN_REFRESH_MARGIN", "300"))
+TOKEN_MAX_SESSION_HOURS = int(os.getenv("TOKEN_MAX_SESSION_HOURS", "12"))
+
+# Shared by worker processes so they can reuse a valid token without logging in again.
+TOKEN_CACHE_FILE = os.getenv("TOKEN_CACHE_FILE", os.path.join(os.path.expanduser("~"), ".langodata", "token"))
+
+_verified_tokens = {}
+_credential_provider = None
+_refresh_timer = None
+_token_lock = threading.Lock()
 #CERT_PATH = os.getenv("CERT_PATH")
 #CERT_PATH = "_.bot.go.tz.crt"
 #CERT_PATH = os.path.join(os.getcwd(), "certificate", "_.bot.go.tz.crt")
 
-def generate_token(username):
-    """Generate a JWT token with a 30-minute expiration."""
+
+def get_secret_key() -> str:
+    """Return SECRET_KEY from the environment, raising if it is not set."""
+    load_environment()
+    secret_key = os.getenv("SECRET_KEY")
+    if not secret_key:
+        raise ValueError("SECRET_KEY is not set in the environment variables")
+    return secret_key
+
+
+def generate_token(username, auth_time=None):
+    """Generate a JWT token with a 30-minute expiration.
+
+    ``auth_time`` is the epoch second of the original login; renewals carry it
+    forward so the session cannot be extended past TOKEN_MAX_SESSION_HOURS.
+    """
     logger = Logger()
     try:
         #expiration_time = datetime.utcnow() + timedelta(minutes=30)
         # Define GMT+3 timezone
         gmt_plus_3 = pytz.timezone("Etc/GMT-3")
-        expiration_time = datetime.now(gmt_plus_3) + timedelta(minutes=30)
-        token = jwt.encode({"username": username, "exp": expiration_time}, SECRET_KEY, algorithm="HS256")
+        expiration_time = datetime.now(gmt_plus_3) + timedelta(minutes=TOKEN_LIFETIME_MINUTES)
+        auth_time = int(auth_time or time.time())
+        token = jwt.encode({"username": username, "exp": expiration_time, "auth_time": auth_time}, get_secret_key(), algorithm="HS256")
         #logger.info(f"Access granted that expires at {expiration_time}(GMT+3)")
         #os.environ["USER_TOKEN"] = token
         return token
@@ -58,19 +86,161 @@ def generate_token(username):
 
 
 def verify_token(token):
-    """Verify if the token is valid and not expired."""
+    """Verify if the token is valid and not expired.
+
+    Successfully decoded tokens are cached until their expiry, so repeated
+    checks of the same token do not decode the JWT again.
+    """
     logger = Logger()
+    if not token:
+        return None
+    with _token_lock:
+        cached = _verified_tokens.get(token)
+    if cached and cached["exp"] > time.time():
+        return cached
     try:
-        decoded_token = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+        decoded_token = jwt.decode(token, get_secret_key(), algorithms=["HS256"])
         #logger.info(f"User validated successfully")
+        with _token_lock:
+            for stale in [key for key, value in _verified_tokens.items() if value["exp"] <= time.time()]:
+                del _verified_tokens[stale]
+            _verified_tokens[token] = decoded_token
         return decoded_token
     except jwt.ExpiredSignatureError:
         logger.debug(f"Token has expired") 
     except jwt.InvalidTokenError:
         logger.debug(f"Invalid token")
+    except ValueError as e:
+        logger.error(f"Error verifying token: {e}")
     return None  
 
 
+def set_credential_provider(provider):
+    """
+    Register a callback used instead of the interactive prompt.
+
+    The callback is called as ``provider(data_group)`` and returns a
+    ``(username, password)`` tuple, or None when no credentials are available.
+    """
+    global _credential_provider
+    _credential_provider = provider
+
+
+def _get_credentials(data_group):
+    """Return (username, password) from the provider, the environment, or a prompt on a terminal."""
+    if _credential_provider is not None:
+        return _credential_provider(data_group)
+    username = os.getenv("LANGODATA_USERNAME")
+    password = os.getenv("LANGODATA_PASSWORD")
+    if username and password:
+        return username, password
+    if sys.stdin is None or not sys.stdin.isatty():
+        # Batch jobs and worker processes must not block waiting for input.
+        return None
+    print("Please log in to continue.")
+    return input("Username: "), getpass.getpass("Password: ")
+
+
+def store_token(token):
+    """Publish a token to this process and to the shared token cache file."""
+    os.environ["USER_TOKEN"] = token
+    try:
+        os.makedirs(os.path.dirname(TOKEN_CACHE_FILE), exist_ok=True)
+        temp_file = f"{TOKEN_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as handle:
+            handle.write(token)
+        os.replace(temp_file, TOKEN_CACHE_FILE)
+    except OSError as e:
+        Logger().warning(f"Could not write token cache file: {e}")
+
+
+def _read_token_file():
+    """Return the token in the shared cache file, or None."""
+    try:
+        with open(TOKEN_CACHE_FILE) as handle:
+            return handle.read().strip()
+    except OSError:
+        return None
+
+
+def get_cached_token():
+    """Return a valid token from USER_TOKEN or the shared cache file, or None."""
+    token = os.getenv("USER_TOKEN")
+    if verify_token(token):
+        return token
+    token = _read_token_file()
+    if verify_token(token):
+        os.environ["USER_TOKEN"] = token
+        return token
+    return None
+
+
+def renew_token(token):
+    """
+    Issue a fresh token for the same user and login session.
+
+    Returns None when the token is no longer valid or the login session has
+    reached TOKEN_MAX_SESSION_HOURS.
+    """
+    decoded_token = verify_token(token)
+    if not decoded_token:
+        return None
+    auth_time = decoded_token.get("auth_time", time.time())
+    if time.time() - auth_time >= TOKEN_MAX_SESSION_HOURS * 3600:
+        return None
+    new_token = generate_token(decoded_token["username"], auth_time)
+    if verify_token(new_token):
+        store_token(new_token)
+        return new_token
+    return None
+
+
+def refresh_token(token):
+    """
+    Return a token to carry on with once `token` is about to expire.
+
+    A token in the shared cache file that expires later than `token` has been
+    renewed by another process and is adopted; otherwise `token` is renewed.
+    Returns None when neither is possible.
+    """
+    decoded_token = verify_token(token)
+    shared = _read_token_file()
+    shared_token = verify_token(shared)
+    if shared_token and (not decoded_token or shared_token["exp"] > decoded_token["exp"]):
+        os.environ["USER_TOKEN"] = shared
+        return shared
+    return renew_token(token)
+
+
+def start_token_refresher(token):
+    """Renew `token` in a background thread TOKEN_REFRESH_MARGIN seconds before it expires."""
+    global _refresh_timer
+    decoded_token = verify_token(token)
+    if not decoded_token:
+        return
+    stop_token_refresher()
+    delay = max(decoded_token["exp"] - time.time() - TOKEN_REFRESH_MARGIN, 0)
+
+    def refresh():
+        new_token = refresh_token(token)
+        if new_token:
+            start_token_refresher(new_token)
+
+    with _token_lock:
+        _refresh_timer = threading.Timer(delay, refresh)
+        _refresh_timer.daemon = True
+        _refresh_timer.start()
+
+
+def stop_token_refresher():
+    """Cancel the background token renewal, if one is scheduled."""
+    global _refresh_timer
+    with _token_lock:
+        if _refresh_timer is not None:
+            _refresh_timer.cancel()
+            _refresh_timer = None
+
+
 def perform_domain_login(username, password):
     """Placeholder for domain login logic."""
     logger = Logger()
@@ -78,7 +248,8 @@ def perform_domain_login(username, password):
     payload = {"username": username, "password": password, "submit": "Login"}
     
     try:
-        response = session.post(LOGIN_URL, data=payload, verify=CERT_PATH)
+        load_environment()
+        response = session.post(os.getenv("LOGIN_URL"), data=payload, verify=CERT_PATH)
         if response.status_code == 200:
             logger.info("Domain validation completed successfully")
             return True
@@ -236,10 +407,15 @@ def authenticate_user(data_group="BSIS"):
     --------
     str or None
         JWT token if authentication is successful, None otherwise
+
+    Notes:
+    ------
+    A valid token in USER_TOKEN or TOKEN_CACHE_FILE is reused without a login.
+    Otherwise credentials come from set_credential_provider, the
+    LANGODATA_USERNAME/LANGODATA_PASSWORD variables, or a prompt when running
+    on a terminal. The token is renewed in the background before it expires.
     """
     logger = Logger()    
-    domainLogin = False
-    token = ""
     
     # Define non-BSIS data groups that use generic login handler
     non_bsis_groups = [
@@ -247,51 +423,45 @@ def authenticate_user(data_group="BSIS"):
         "FINANCIAL-MARKETS", "PHYSICAL-SECURITY", "TOURISM"
     ]
     
+    # Reuse a valid token from this process or another worker
+    token = get_cached_token()
+    if token:
+        if _refresh_timer is None:
+            start_token_refresher(token)
+        return token
+
+    # Obtain login credentials without blocking non-interactive runs
+    credentials = _get_credentials(data_group)
+    if not credentials:
+        logger.error("No valid token and no credentials available; set LANGODATA_USERNAME/LANGODATA_PASSWORD or a credential provider.")
+        return None
+    username, password = credentials
+    username = username.upper()
+
+    # Perform login based on data group
     try:
-        token = os.getenv("USER_TOKEN")
-
-        #if token:
-        decoded_token = verify_token(token)
-        if decoded_token:
-            #logger.info(f"Existing token is valid")
-            domainLogin = True
-            return token
-    
+        if data_group.upper() in [g.upper() for g in non_bsis_groups]:
+            # Use generic non-BSIS login for supported groups
+            if not perform_non_bsis_login(data_group, username, password):
+                logger.error(f"{data_group} login failed for user: {username}")
+                return None
+        else:
+            # Default to BSIS login
+            if not perform_bsis_login(username, password):
+                logger.error(f"BSIS login failed for user: {username}")
+                return None
     except Exception as e:
-        logger.error(f"{e}") 
+        logger.error(f"Connectivity or other error: {e}")
+        return None
 
-    else:
-        # Prompt for login credentials
-        print("Please log in to continue.")
-        username = input("Username: ")
-        password = getpass.getpass("Password: ")
-    
-        username = username.upper()
-
-        # Perform login based on data group
-        try:
-            if data_group.upper() in [g.upper() for g in non_bsis_groups]:
-                # Use generic non-BSIS login for supported groups
-                if not perform_non_bsis_login(data_group, username, password):
-                    logger.error(f"{data_group} login failed for user: {username}")
-                    return None
-            else:
-                # Default to BSIS login
-                if not perform_bsis_login(username, password):
-                    logger.error(f"BSIS login failed for user: {username}")
-                    return None
-        except Exception as e:
-            logger.error(f"Connectivity or other error: {e}")
-                #return None
-
-      
-
-        # Generate and return a new token
-        token = generate_token(username)
-        if verify_token(token):
-            os.environ["USER_TOKEN"] = token
-            logger.info(f"Login successful for {data_group} user: {username}")
-            return token
+    # Generate, publish and keep renewing a new token
+    token = generate_token(username)
+    if verify_token(token):
+        store_token(token)
+        start_token_refresher(token)
+        logger.info(f"Login successful for {data_group} user: {username}")
+        return token
+    return None
 
 def binary_convert(mask: str) -> str:
     """
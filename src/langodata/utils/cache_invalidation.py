@@ -0,0 +1,256 @@
+"""
+Freshness-driven invalidation of the period cache.
+
+Instead of expiring cached months on a timer, the invalidator polls two
+cheap metadata sources and evicts only the partitions whose data changed
+after they were cached:
+
+* ITRS MONITORING reports LAST MIGRATION (raw returns loaded) and LAST
+  TRANSFORMATION (*_FINAL tables rebuilt) per return. Every cached month of
+  a return older than its timestamp is evicted.
+* The MSP submission log (SUBMISSION_CHANGES_QUERY) reports AUTHORIZEDDATE
+  per institution, return and reporting date. A cached month of that return
+  is evicted when it covers the institution (directly, via '*', or through a
+  consolidated type) and was cached before the authorisation.
+
+Partitions with no such source, e.g. ITRS OVERALL_ANALYSIS or the
+macroeconomics series, are evicted once older than UNTRACKED_MAX_AGE.
+"""
+
+import os
+import re
+import threading
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from langodata.utils.database import DatabaseConnection
+from langodata.utils.disk_cache import cached_months
+from langodata.utils.itrs_data import read_itrs_data
+from langodata.utils.logger import Logger
+from langodata.utils.msp_data import get_table_name as get_msp_table_name
+from langodata.utils.partitioning import format_period, month_end
+from langodata.utils.query_catalog import SUBMISSION_CHANGES_QUERY, bind_params
+from langodata.utils.result_cache import cached_keys, discard_result
+
+
+# Seconds between polls of the background invalidator.
+INVALIDATION_INTERVAL = int(os.getenv("CACHE_INVALIDATION_INTERVAL", "300"))
+
+# Seconds a partition without a change source is kept before it is evicted.
+UNTRACKED_MAX_AGE = int(os.getenv("CACHE_UNTRACKED_MAX_AGE", "86400"))
+
+# ITRS returns tracked by MONITORING; each also has a *_FINAL table.
+ITRS_RETURNS = ["URT_PAYMENTS", "URT_RECEIPTS", "ZNZ_PAYMENTS", "ZNZ_RECEIPTS"]
+
+# ITRS data types whose changes MONITORING reports (see itrs_return_changes).
+ITRS_TRACKED_TYPES = ITRS_RETURNS + [f"{data_type}_FINAL" for data_type in ITRS_RETURNS] + ["ITRS_DETAIL"]
+
+# MSP return code of each submission name in the submission log.
+SUBMISSION_RETURNS = {
+    "MSP2_01": "01", "MSP2_02": "02", "MSP2_03": "03", "MSP2_04": "04", "MSP2_05": "05",
+    "MSP2_06": "06", "MSP2_07": "07", "MSP2_08": "08", "MSP2_09": "09", "MSP2_10": "10",
+}
+
+SUBMISSION_COLUMNS = ["INSTITUTIONCODE", "SUBMISSIONNAME", "REPORTINGDATE", "AUTHORIZEDDATE"]
+
+PARTITION_COLUMNS = ["data_group", "data_type", "data_source", "institution", "month", "cached_at", "tier"]
+
+_invalidator_timer = None
+_invalidator_lock = threading.Lock()
+
+
+def cached_partitions() -> list:
+    """Return every cached month of the period cache, in memory and on disk, as dictionaries."""
+    partitions = []
+    for key, stored_at in cached_keys("period"):
+        _, data_group, data_source, data_type, institution, month = key
+        partitions.append({"data_group": data_group, "data_type": data_type, "data_source": data_source,
+                           "institution": institution, "month": month,
+                           "cached_at": datetime.fromtimestamp(stored_at), "tier": "memory", "location": key})
+    for data_group, data_type, data_source, institution, month, written_at, path in cached_months():
+        partitions.append({"data_group": data_group, "data_type": data_type, "data_source": data_source,
+                           "institution": institution, "month": month,
+                           "cached_at": datetime.fromtimestamp(written_at), "tier": "disk", "location": path})
+    return partitions
+
+
+def itrs_return_changes(data_source: str) -> dict:
+    """
+    Read ITRS MONITORING and return the last change of each return.
+
+    Returns:
+        dict: Maps a raw data type (e.g. "URT_PAYMENTS") to its LAST MIGRATION
+        and the matching *_FINAL type to its LAST TRANSFORMATION; ITRS_DETAIL
+        maps to the latest LAST TRANSFORMATION of any return.
+
+    Raises:
+        ValueError: If MONITORING cannot be read.
+    """
+    today = format_period(datetime.combine(date.today(), datetime.min.time()))
+    result = read_itrs_data("ITRS", data_source, "MONITORING", "*", today, today)
+    if result["debug"]:
+        raise ValueError(result["debug"])
+    df = result["df"]
+    changes = {}
+    if not len(df):
+        return changes
+    migrated = pd.to_datetime(df["LAST MIGRATION"], errors="coerce")
+    transformed = pd.to_datetime(df["LAST TRANSFORMATION"], errors="coerce")
+    for name, last_migration, last_transformation in zip(df["RETURN NAME"], migrated, transformed):
+        data_type = re.sub(r"[^A-Z]+", "_", str(name).upper()).strip("_").removesuffix("_FINAL")
+        if data_type not in ITRS_RETURNS:
+            continue
+        if pd.notna(last_migration):
+            changes[data_type] = last_migration.to_pydatetime()
+        if pd.notna(last_transformation):
+            changes[f"{data_type}_FINAL"] = last_transformation.to_pydatetime()
+    transformations = [changes[f"{data_type}_FINAL"] for data_type in ITRS_RETURNS if f"{data_type}_FINAL" in changes]
+    if transformations:
+        # ITRS_DETAIL, the pivot extract, is rebuilt with the transformation of any return
+        changes["ITRS_DETAIL"] = max(transformations)
+    return changes
+
+
+def submission_changes(data_source: str, start_period: str, end_period: str) -> dict:
+    """
+    Read the MSP submission log and index authorisations by return and month.
+
+    Submissions whose name is not in SUBMISSION_RETURNS are ignored.
+
+    Returns:
+        dict: Maps ``(return_code, "YYYY-MM")`` to a list of
+        ``(institution_code, authorized_date)``.
+    """
+    schema = "BSIS_DEV." if data_source in ["BSIS", "EDI"] else ""
+    sql = SUBMISSION_CHANGES_QUERY.format(schema=schema)
+    with DatabaseConnection(data_source) as conn:
+        df = conn.fetch_dataframe(sql, bind_params(sql, start_period=start_period, end_period=end_period),
+                                  SUBMISSION_COLUMNS)
+    changes = {}
+    if not len(df):
+        return changes
+    reported = pd.to_datetime(df["REPORTINGDATE"], errors="coerce")
+    authorized = pd.to_datetime(df["AUTHORIZEDDATE"], errors="coerce")
+    for institution, name, reporting_date, authorized_date in zip(df["INSTITUTIONCODE"], df["SUBMISSIONNAME"],
+                                                                  reported, authorized):
+        return_code = SUBMISSION_RETURNS.get(str(name).strip().upper())
+        if return_code is None or pd.isna(reporting_date) or pd.isna(authorized_date):
+            continue
+        changes.setdefault((return_code, f"{reporting_date:%Y-%m}"), []).append(
+            (institution, authorized_date.to_pydatetime()))
+    return changes
+
+
+def _covers(partition: dict, institution: str) -> bool:
+    """True when a cached MSP month includes rows of `institution`."""
+    cached = partition["institution"]
+    if partition["data_type"].startswith("CONS") or cached == "*":
+        return True
+    return institution in cached if isinstance(cached, tuple) else institution == cached
+
+
+def is_stale(partition: dict, itrs_changes: dict, msp_changes: dict) -> bool:
+    """
+    True when the return behind a cached month changed after it was cached,
+    or, for a month without a change source, when it is older than UNTRACKED_MAX_AGE.
+    """
+    if partition["data_group"] == "ITRS" and partition["data_type"] in ITRS_TRACKED_TYPES:
+        changed = itrs_changes.get(partition["data_type"])
+        return changed is not None and changed > partition["cached_at"]
+    if partition["data_group"] == "MSP":
+        return_code = get_msp_table_name(partition["data_type"]).split("_")[-1]
+        return any(authorized > partition["cached_at"] and _covers(partition, institution)
+                   for institution, authorized in msp_changes.get((return_code, partition["month"]), []))
+    return datetime.now() - partition["cached_at"] > timedelta(seconds=UNTRACKED_MAX_AGE)
+
+
+def _evict(partition: dict) -> None:
+    if partition["tier"] == "memory":
+        discard_result(partition["location"])
+    else:
+        try:
+            os.remove(partition["location"])
+        except FileNotFoundError:
+            pass
+
+
+def invalidate_stale_partitions() -> dict:
+    """
+    Poll MONITORING and the submission log and evict the cached months that changed.
+
+    Each data source in the cache is polled once per data group. Partitions
+    without a change source are evicted by age instead.
+
+    Returns:
+        dict: ``info`` summarises the run, ``debug`` lists sources that could
+        not be polled and ``df`` lists the evicted partitions.
+    """
+    logger = Logger()
+    result = {"info": "", "debug": "", "df": pd.DataFrame(columns=PARTITION_COLUMNS)}
+    partitions = cached_partitions()
+    by_source = {}
+    for partition in partitions:
+        by_source.setdefault((partition["data_group"], partition["data_source"]), []).append(partition)
+
+    evicted = []
+    for (data_group, data_source), source_partitions in by_source.items():
+        try:
+            if data_group == "ITRS" and any(partition["data_type"] in ITRS_TRACKED_TYPES
+                                            for partition in source_partitions):
+                itrs_changes, msp_changes = itrs_return_changes(data_source), {}
+            elif data_group == "MSP":
+                months = sorted(partition["month"] for partition in source_partitions)
+                start_period = format_period(datetime.strptime(months[0], "%Y-%m"))
+                end_period = format_period(month_end(datetime.strptime(months[-1], "%Y-%m")))
+                itrs_changes, msp_changes = {}, submission_changes(data_source, start_period, end_period)
+            else:
+                itrs_changes, msp_changes = {}, {}
+        except Exception as e:
+            error_message = f"Could not poll {data_group} changes from {data_source}: {str(e)}. "
+            result["debug"] += error_message
+            logger.error(error_message)
+            # Months without a change source still age out
+            itrs_changes, msp_changes = {}, {}
+        for partition in source_partitions:
+            if is_stale(partition, itrs_changes, msp_changes):
+                _evict(partition)
+                evicted.append(partition)
+
+    if evicted:
+        result["df"] = pd.DataFrame(evicted, columns=PARTITION_COLUMNS)
+    result["info"] = f"Evicted {len(evicted)} of {len(partitions)} cached partitions."
+    logger.info(result["info"])
+    return result
+
+
+def start_cache_invalidator(interval: int = None):
+    """Run invalidate_stale_partitions() every `interval` seconds (default CACHE_INVALIDATION_INTERVAL) in a daemon thread."""
+    interval = interval or INVALIDATION_INTERVAL
+    stop_cache_invalidator()
+    with _invalidator_lock:
+        _schedule(interval)
+
+
+def _schedule(interval):
+    global _invalidator_timer
+    _invalidator_timer = threading.Timer(interval, _poll, args=(interval,))
+    _invalidator_timer.daemon = True
+    _invalidator_timer.start()
+
+
+def _poll(interval):
+    invalidate_stale_partitions()
+    with _invalidator_lock:
+        # Reschedule unless the invalidator was stopped or restarted meanwhile
+        if _invalidator_timer is threading.current_thread():
+            _schedule(interval)
+
+
+def stop_cache_invalidator():
+    """Cancel the background invalidator, if one is running."""
+    global _invalidator_timer
+    with _invalidator_lock:
+        if _invalidator_timer is not None:
+            _invalidator_timer.cancel()
+            _invalidator_timer = None
@@ -1,13 +1,31 @@
+import asyncio
+import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from langodata.utils.logger import Logger
+from langodata.utils.database import OUTPUT_FORMATS, source_pool_size
 from langodata.utils.license_manager import validate_license, check_license_status
 from langodata.utils.auth_token import authenticate_user
-from langodata.utils.msp_data import read_msp_data
-from langodata.utils.macroeconomics_data import read_macroeconomics_data
-from langodata.utils.itrs_data import read_itrs_data
-from langodata.utils.profile_reader import read_fsp_profile
+from langodata.utils.msp_data import read_msp_data, read_msp_data_async
+from langodata.utils.macroeconomics_data import read_macroeconomics_data, read_macroeconomics_data_async
+from langodata.utils.itrs_data import read_itrs_data, read_itrs_data_async
+from langodata.utils.profile_reader import read_fsp_profile, read_fsp_profile_async, read_institution_codes
 from langodata.utils.submission_manager import read_submissions
+from langodata.utils.tracing import start_trace, span
+from langodata.utils.partitioning import (
+    plan_partitions, fetch_partitioned, is_partitionable, plan_shards, fetch_sharded, is_shardable, sort_result,
+    needs_residual_shard,
+)
+from langodata.utils.disk_cache import disk_cache_enabled
+from langodata.utils.period_cache import is_cacheable, read_periods
+from langodata.utils.result_cache import result_cache_enabled, get_result, store_result
+
+# Positional fields of a read_many() request spec.
+REQUEST_FIELDS = ["data_group", "data_source", "data_type", "bank_code", "start_period", "end_period"]
+
+# Default concurrent extracts per data source in read_many().
+READ_MANY_WORKERS = int(os.getenv("READ_MANY_WORKERS", "4"))
 
 def validate_inputs(data_group, data_source, start_period, end_period):
     """
@@ -42,35 +60,172 @@ def validate_environment(data_group="BSIS"):
     Validates license and authentication based on data group.
     """
     try:
-        validate_license()
-        if not check_license_status():
-            return "Invalid license. Please validate your license."
+        with span("license"):
+            validate_license()
+            if not check_license_status():
+                return "Invalid license. Please validate your license."
     except Exception as e:
         return f"License validation failed: {str(e)}"
 
     try:
-        if not authenticate_user(data_group):
-            return f"User authentication failed for {data_group}."
+        with span("authenticate", data_group=data_group):
+            if not authenticate_user(data_group):
+                return f"User authentication failed for {data_group}."
     except Exception as e:
         return f"Authentication error: {str(e)}"
 
     return None
 
-def execute_handler(handler_function, *args):
+def validate_profile_inputs(data_group, data_source):
+    """
+    Validates inputs for the profile read functions.
+    """
+    if data_group not in [
+        "MSP", "ITRS", "NPS", "BANK", "FUNDS", "MORGAGE", "LEASING", 
+        "TMS", "FXCFMIS", "CBR", "DERP-DATA", "TS-BOP"
+    ]:
+        return f"Invalid data group: {data_group}"
+    if data_source not in ["BSIS","EDI","DERPTS"]:
+        return f"Invalid data source: {data_source}"
+    return None
+
+def execute_handler(handler_function, *args, **kwargs):
     """
     Executes the given handler function with the provided arguments.
     """
     try:
-        return handler_function(*args)
+        with span("handler", handler=getattr(handler_function, "__name__", str(handler_function))):
+            return handler_function(*args, **kwargs)
     except Exception as e:
         return {"info": "", "debug": f"Handler error: {str(e)}", "df": pd.DataFrame()}
 
-def read_data(data_group, data_source, data_type, bank_code, start_period, end_period):
+async def execute_handler_async(handler_function, *args, **kwargs):
+    """
+    Awaits the given coroutine handler, reporting failures like execute_handler().
+    """
+    try:
+        with span("handler", handler=getattr(handler_function, "__name__", str(handler_function))):
+            return await handler_function(*args, **kwargs)
+    except Exception as e:
+        return {"info": "", "debug": f"Handler error: {str(e)}", "df": pd.DataFrame()}
+
+def validate_fetch_options(output_format, chunksize=None):
+    """
+    Validates the result format options shared by the read functions.
+    """
+    errors = []
+    if output_format not in OUTPUT_FORMATS:
+        errors.append(f"Invalid output format: {output_format}")
+    if chunksize is not None and chunksize <= 0:
+        errors.append(f"Invalid chunksize: {chunksize}")
+    return errors
+
+def validate_partition_options(data_group, data_type, partitions, partition_workers, streaming=False):
+    """
+    Validates the period partitioning options of read_data.
+    """
+    errors = []
+    if partitions is None:
+        return errors
+    if not isinstance(partitions, int) or partitions < 1:
+        errors.append(f"Invalid partitions: {partitions}")
+    elif partitions > 1 and not is_partitionable(data_group, data_type):
+        errors.append(f"Data type {data_type} of {data_group} cannot be partitioned by period")
+    elif partitions > 1 and streaming:
+        errors.append("Partitioned reads cannot be streamed")
+    if partition_workers is not None and partition_workers < 1:
+        errors.append(f"Invalid partition_workers: {partition_workers}")
+    return errors
+
+def validate_shard_options(data_group, data_type, bank_code, shards, shard_workers, streaming=False):
+    """
+    Validates the institution sharding options of read_data.
+    """
+    errors = []
+    if shards is None:
+        return errors
+    if not isinstance(shards, int) or shards < 1:
+        errors.append(f"Invalid shards: {shards}")
+    elif shards > 1 and bank_code != "*":
+        errors.append("Sharded reads require bank_code='*'")
+    elif shards > 1 and not is_shardable(data_group, data_type):
+        errors.append(f"Data type {data_type} of {data_group} cannot be sharded by institution")
+    elif shards > 1 and streaming:
+        errors.append("Sharded reads cannot be streamed")
+    if shard_workers is not None and shard_workers < 1:
+        errors.append(f"Invalid shard_workers: {shard_workers}")
+    return errors
+
+def is_empty_result(df):
+    """Return True for a result with no rows; streamed results are never reported empty."""
+    return hasattr(df, "__len__") and len(df) == 0
+
+def attach_trace(feedback, trace):
+    """Add the trace's ``timings`` and ``metrics`` sections to a feedback dictionary."""
+    feedback.update(trace.summary())
+    return feedback
+
+def read_data(data_group, data_source, data_type, bank_code, start_period, end_period, output_format="pandas",
+              chunksize=None, stream=False, arraysize=None, partitions=None, partition_workers=None,
+              shards=None, shard_workers=None, cache=None):
     """
     Reads data based on specified parameters and handles workflow.
+
+    ``bank_code`` is one institution code, ``'*'`` for all institutions, or a
+    list of codes; a list is sent to Oracle as a single bound collection, so
+    any number of institutions costs one statement and one round trip.
+
+    ``output_format`` selects a pandas DataFrame ("pandas", the default) or a
+    pyarrow Table ("arrow") for ``feedback["df"]``. With ``chunksize`` or
+    ``stream=True`` the MSP, ITRS and MACROECONOMICS readers return a generator
+    of batches in ``feedback["df"]`` instead, fetched ``arraysize`` rows per
+    round trip, so memory stays bounded however large the result is.
+
+    ``feedback["timings"]`` reports seconds per phase (license, authenticate,
+    connect, execute, fetch, dataframe, handler, total) and
+    ``feedback["metrics"]`` the rows, bytes and round trips of the fetch.
+    Streamed batches are fetched after read_data returns and are not counted.
+
+    With ``partitions`` > 1, MSP and row-level ITRS extracts are split into that
+    many month-end aligned period slices, fetched concurrently on up to
+    ``partition_workers`` sessions (default: the source's pool size) and
+    concatenated, ITRS rows in their statement's ORDER BY;
+    ``feedback["metrics"]["partition_plan"]`` lists each slice with its rows
+    and elapsed seconds.
+
+    With ``bank_code='*'`` and ``shards`` > 1, institution-level MSP and ITRS
+    extracts are instead split into that many shards of institution codes
+    (read from MSP_INSTITUTION or INSTITUTION), fetched concurrently on up to
+    ``shard_workers`` sessions with an IN-list predicate and merged. ITRS
+    *_FINAL tables are not joined to INSTITUTION, so they get one more shard
+    for every other code; ``feedback["metrics"]["shard_plan"]`` describes
+    each shard.
+
+    With ``cache=True`` (or LANGODATA_DISK_CACHE=true when ``cache`` is None),
+    month-based MSP and ITRS extracts for one institution or ``'*'`` go
+    through the Parquet disk cache: closed reporting months are read from
+    LANGODATA_CACHE_DIR and only open, recent or uncached months are fetched
+    from Oracle. ``feedback["metrics"]`` then includes ``cache_hits`` and
+    ``cache_misses`` (in months) and the cache bytes read and written.
+
+    When the in-process result cache is on (LANGODATA_RESULT_CACHE or
+    configure_result_cache()), a repeated request within its data group's TTL
+    is answered from memory and reported as ``result_cache_hits``. Month-based
+    MSP, ITRS and MACROECONOMICS extracts are held per reporting month, so an
+    overlapping request only fetches the months not cached yet, one statement
+    per gap (``cache_gaps``), merged back in reporting order. A month cached
+    for ``'*'`` also answers institution-level MSP and raw ITRS requests for one
+    or more codes by filtering locally (``superset_cache_hits``).
     """
-    data_frequency = bank_code
-    logger = Logger()
+    with start_trace("read_data", data_group=data_group, data_source=data_source, data_type=data_type) as trace:
+        feedback = _read_data(data_group, data_source, data_type, bank_code, start_period, end_period,
+                              output_format, chunksize, stream, arraysize, partitions, partition_workers,
+                              shards, shard_workers, cache)
+    return attach_trace(feedback, trace)
+
+def _read_data(data_group, data_source, data_type, bank_code, start_period, end_period, output_format,
+               chunksize, stream, arraysize, partitions=None, partition_workers=None, shards=None, shard_workers=None,
+               cache=None):
     feedback = {"info": "", "debug": "", "df": pd.DataFrame()}
 
     # Validate environment with specific data_group
@@ -79,31 +234,241 @@ def read_data(data_group, data_source, data_type, bank_code, start_period, end_p
         feedback["debug"] = env_error
         return feedback
 
+    return _fetch_data(data_group, data_source, data_type, bank_code, start_period, end_period, output_format,
+                       chunksize, stream, arraysize, partitions, partition_workers, shards, shard_workers, cache)
+
+def _fetch_data(data_group, data_source, data_type, bank_code, start_period, end_period, output_format,
+                chunksize, stream, arraysize, partitions=None, partition_workers=None, shards=None, shard_workers=None,
+                cache=None):
+    data_frequency = bank_code
+    feedback = {"info": "", "debug": "", "df": pd.DataFrame()}
+
     # Validate inputs
     input_errors = validate_inputs(data_group, data_source, start_period, end_period)
+    input_errors += validate_fetch_options(output_format, chunksize)
+    input_errors += validate_partition_options(data_group, data_type, partitions, partition_workers, chunksize or stream)
+    input_errors += validate_shard_options(data_group, data_type, bank_code, shards, shard_workers, chunksize or stream)
+    if isinstance(bank_code, (list, tuple)) and not bank_code:
+        input_errors.append("Invalid bank_code: empty list of institutions")
+    if partitions and partitions > 1 and shards and shards > 1:
+        input_errors.append("Use either partitions or shards, not both")
     if input_errors:
         feedback["debug"] = " | ".join(input_errors)
         return feedback
 
+    # Month-based extracts are cached per month by the period cache instead of whole
+    use_disk = disk_cache_enabled(cache)
+    period_cached = not (chunksize or stream) and not (shards and shards > 1) \
+        and (use_disk or result_cache_enabled()) \
+        and is_cacheable(data_group, data_type, tuple(bank_code) if isinstance(bank_code, list) else bank_code)
+
+    # Answer repeated requests from the in-process result cache
+    result_key = None
+    if result_cache_enabled() and not (chunksize or stream) and not period_cached:
+        institutions = tuple(bank_code) if isinstance(bank_code, list) else bank_code
+        result_key = ("read_data", data_group, data_source, data_type, institutions, start_period, end_period,
+                      output_format)
+        cached = get_result(result_key, data_group)
+        if cached is not None:
+            return cached
+
     # Select appropriate handler
+    fetch_options = {"output_format": output_format, "chunksize": chunksize, "stream": stream, "arraysize": arraysize}
+    handler = None
     if data_group == "MSP":
-        feedback = execute_handler(read_msp_data, data_group, data_source, data_type, bank_code, start_period, end_period)
-    if data_group == "MACROECONOMICS":
+        handler = read_msp_data
+    elif data_group == "MACROECONOMICS":
         data_frequency = bank_code
-        feedback = execute_handler(read_macroeconomics_data, data_group, data_source, data_type, data_frequency, start_period, end_period)
-    if data_group == "ITRS":
-        feedback = execute_handler(read_itrs_data, data_group, data_source, data_type, bank_code, start_period, end_period)
+        handler = read_macroeconomics_data
+    elif data_group == "ITRS":
+        handler = read_itrs_data
     elif data_group == "SUBMISSIONS":
-        feedback = execute_handler(read_submissions, data_group, data_source, data_type, bank_code, start_period, end_period)
+        handler, fetch_options = read_submissions, {}
     else:
         feedback["debug"] = f"No handler found for data group: {data_group}"
 
+    if handler and period_cached:
+        # Serve cached months and fetch only the missing gaps
+        feedback = _fetch_cached(handler, data_group, data_source, data_type, bank_code, start_period, end_period,
+                                 fetch_options, partitions, partition_workers, use_disk)
+    elif handler and partitions and partitions > 1:
+        # Fetch month-end aligned period slices concurrently and concatenate them
+        feedback = _fetch_partitioned(handler, data_group, data_source, data_type, bank_code, start_period,
+                                      end_period, fetch_options, partitions, partition_workers)
+    elif handler and shards and shards > 1:
+        # Fetch shards of the institution list concurrently and merge them
+        feedback = _fetch_sharded(handler, data_group, data_source, data_type, start_period, end_period,
+                                  fetch_options, shards, shard_workers)
+    elif handler:
+        feedback = execute_handler(handler, data_group, data_source, data_type, data_frequency, start_period, end_period, **fetch_options)
+
+    if result_key is not None:
+        feedback = store_result(result_key, feedback)
+
     # Check if result is empty
-    if feedback["df"].empty:
+    if is_empty_result(feedback["df"]):
         feedback["debug"] += " | Output DataFrame is empty. Check data source or query parameters."
     
     return feedback
 
+def _fetch_partitioned(handler, data_group, data_source, data_type, bank_code, start_period, end_period,
+                       fetch_options, partitions, partition_workers):
+    plan = plan_partitions(start_period, end_period, partitions)
+    workers = partition_workers or source_pool_size(data_source)
+    feedback = fetch_partitioned(
+        lambda slice_start, slice_end: execute_handler(handler, data_group, data_source, data_type, bank_code,
+                                                       slice_start, slice_end, **fetch_options),
+        plan, workers)
+    feedback["df"] = sort_result(feedback["df"], data_group, data_type)
+    return feedback
+
+def _fetch_cached(handler, data_group, data_source, data_type, bank_code, start_period, end_period,
+                  fetch_options, partitions, partition_workers, use_disk):
+    # Months are cached as pandas frames; Arrow output is converted once at the end
+    pandas_options = dict(fetch_options, output_format="pandas")
+
+    def fetch_range(range_start, range_end):
+        if partitions and partitions > 1 and is_partitionable(data_group, data_type):
+            return _fetch_partitioned(handler, data_group, data_source, data_type, bank_code, range_start,
+                                      range_end, pandas_options, partitions, partition_workers)
+        return execute_handler(handler, data_group, data_source, data_type, bank_code, range_start, range_end,
+                               **pandas_options)
+
+    try:
+        with span("period_cache"):
+            institutions = tuple(bank_code) if isinstance(bank_code, list) else bank_code
+            feedback = read_periods(fetch_range, (data_group, data_type, data_source, institutions),
+                                    start_period, end_period, use_memory=result_cache_enabled(), use_disk=use_disk)
+    except Exception as e:
+        return {"info": "", "debug": f"Cache error: {str(e)}", "df": pd.DataFrame()}
+    # Months are joined oldest first
+    feedback["df"] = sort_result(feedback["df"], data_group, data_type)
+    if fetch_options["output_format"] == "arrow":
+        import pyarrow
+        feedback["df"] = pyarrow.Table.from_pandas(feedback["df"], preserve_index=False)
+    return feedback
+
+def _fetch_sharded(handler, data_group, data_source, data_type, start_period, end_period, fetch_options,
+                   shards, shard_workers):
+    try:
+        with span("institutions"):
+            codes = read_institution_codes(data_group, data_source)
+    except Exception as e:
+        return {"info": "", "debug": f"Could not read institution list: {str(e)}", "df": pd.DataFrame()}
+    if not codes:
+        return execute_handler(handler, data_group, data_source, data_type, "*", start_period, end_period, **fetch_options)
+    feedback = fetch_sharded(
+        lambda shard: execute_handler(handler, data_group, data_source, data_type, shard,
+                                      start_period, end_period, **fetch_options),
+        plan_shards(codes, shards, needs_residual_shard(data_group, data_type)),
+        shard_workers or source_pool_size(data_source))
+    feedback["df"] = sort_result(feedback["df"], data_group, data_type)
+    return feedback
+
+def normalize_request(request):
+    """
+    Turn a read_many() request spec into keyword arguments for _fetch_data().
+
+    A spec is either a tuple ``(data_group, data_source, data_type, bank_code,
+    start_period, end_period)`` or a dict with those keys plus optional
+    ``output_format`` and ``arraysize``.
+    """
+    if isinstance(request, dict):
+        spec = dict(request)
+    else:
+        spec = dict(zip(REQUEST_FIELDS, request))
+    missing = [field for field in REQUEST_FIELDS if field not in spec]
+    if missing:
+        raise ValueError(f"Request {request!r} is missing {', '.join(missing)}")
+    if isinstance(spec["bank_code"], list):
+        # Lists are not hashable; a tuple keeps the request usable as a result key
+        spec["bank_code"] = tuple(spec["bank_code"])
+    spec.setdefault("output_format", "pandas")
+    spec.setdefault("arraysize", None)
+    spec.setdefault("partitions", None)
+    spec.setdefault("partition_workers", None)
+    spec.setdefault("shards", None)
+    spec.setdefault("shard_workers", None)
+    spec.setdefault("cache", None)
+    spec.update(chunksize=None, stream=False)
+    return spec
+
+def read_many(requests, max_workers=None):
+    """
+    Reads many extracts concurrently and returns their feedback keyed by request.
+
+    The license is validated and each data group authenticated once for the
+    whole batch. Requests are grouped by data source and each group runs on
+    its own thread pool, capped at ``max_workers`` (default READ_MANY_WORKERS)
+    and at the source's connection pool size so sessions are never oversubscribed.
+
+    Args:
+        requests (list): Request specs, see normalize_request(). Identical
+            requests are fetched once.
+        max_workers (int): Upper bound on concurrent extracts per source.
+
+    Returns:
+        dict: Maps ``(data_group, data_source, data_type, bank_code,
+        start_period, end_period)`` to the same feedback dictionary read_data()
+        returns, including its ``timings`` and ``metrics``; errors for a
+        request are reported in its ``debug`` field.
+    """
+    max_workers = max_workers or READ_MANY_WORKERS
+    results = {}
+    specs = {}
+    for request in requests:
+        try:
+            spec = normalize_request(request)
+        except ValueError as e:
+            key = tuple(request.get(field) for field in REQUEST_FIELDS) if isinstance(request, dict) else tuple(request)
+            results[key] = {"info": "", "debug": str(e), "df": pd.DataFrame()}
+            continue
+        specs.setdefault(tuple(spec[field] for field in REQUEST_FIELDS), spec)
+
+    # Validate license and authentication once per data group
+    env_errors = {}
+    with start_trace("read_many") as batch_trace:
+        for data_group in {spec["data_group"] for spec in specs.values()}:
+            env_errors[data_group] = validate_environment(data_group)
+    batch_timings = batch_trace.timings()
+
+    by_source = {}
+    for key, spec in specs.items():
+        env_error = env_errors[spec["data_group"]]
+        if env_error:
+            results[key] = {"info": "", "debug": env_error, "df": pd.DataFrame()}
+        else:
+            by_source.setdefault(spec["data_source"], []).append((key, spec))
+
+    def run(spec):
+        with start_trace("read_many", data_group=spec["data_group"], data_source=spec["data_source"],
+                         data_type=spec["data_type"]) as trace:
+            try:
+                feedback = _fetch_data(**spec)
+            except Exception as e:
+                feedback = {"info": "", "debug": f"Handler error: {str(e)}", "df": pd.DataFrame()}
+        return attach_trace(feedback, trace)
+
+    executors = [ThreadPoolExecutor(max_workers=min(max_workers, source_pool_size(source)),
+                                    thread_name_prefix=f"read_many-{source}")
+                 for source in by_source]
+    try:
+        futures = {}
+        for executor, source_requests in zip(executors, by_source.values()):
+            for key, spec in source_requests:
+                futures[executor.submit(run, spec)] = key
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    finally:
+        for executor in executors:
+            executor.shutdown(wait=True)
+
+    # Share the one-off license and authentication cost with every request
+    for feedback in results.values():
+        if "timings" in feedback:
+            feedback["timings"].update({phase: seconds for phase, seconds in batch_timings.items() if phase != "total"})
+    return results
+
 def read_profile(data_group, data_source, fsp_code):
     """
     Reads FSP profile data based on specified parameters.
@@ -119,21 +484,99 @@ def read_profile(data_group, data_source, fsp_code):
         return feedback
 
     # Validate inputs
-    if data_group not in [
-        "MSP", "ITRS", "NPS", "BANK", "FUNDS", "MORGAGE", "LEASING", 
-        "TMS", "FXCFMIS", "CBR", "DERP-DATA", "TS-BOP"
-    ]:
-        feedback["debug"] = f"Invalid data group: {data_group}"
-        return feedback
-    if data_source not in ["BSIS","EDI","DERPTS"]:
-        feedback["debug"] = f"Invalid data source: {data_source}"
+    input_error = validate_profile_inputs(data_group, data_source)
+    if input_error:
+        feedback["debug"] = input_error
         return feedback
 
-    # Execute handler
+    # Execute handler, or answer a repeated request from the result cache
+    result_key = ("read_profile", data_group, data_source, fsp_code)
+    cached = get_result(result_key, data_group) if result_cache_enabled() else None
+    if cached is not None:
+        return cached
     feedback = execute_handler(read_fsp_profile, data_group, data_source, fsp_code)
+    if result_cache_enabled():
+        feedback = store_result(result_key, feedback)
 
     # Check if result is empty
     if feedback["df"].empty:
         feedback["debug"] += " | Output DataFrame is empty. Check data source or query parameters."
     
     return feedback
+
+async def read_data_async(data_group, data_source, data_type, bank_code, start_period, end_period,
+                          output_format="pandas"):
+    """
+    Coroutine form of read_data() for dashboards and notebooks running an event loop.
+
+    Many calls can be awaited together (e.g. with asyncio.gather); each source
+    admits at most {SRC}_ASYNC_CONCURRENCY / DB_ASYNC_CONCURRENCY extracts at
+    once (default: the pool max) and shares a small asyncio session pool.
+    License and authentication checks run in a worker thread so they do not
+    block the loop. Returns the same feedback dictionary as read_data().
+    """
+    with start_trace("read_data_async", data_group=data_group, data_source=data_source, data_type=data_type) as trace:
+        feedback = await _read_data_async(data_group, data_source, data_type, bank_code, start_period, end_period,
+                                          output_format)
+    return attach_trace(feedback, trace)
+
+async def _read_data_async(data_group, data_source, data_type, bank_code, start_period, end_period, output_format):
+    feedback = {"info": "", "debug": "", "df": pd.DataFrame()}
+
+    # Validate environment with specific data_group
+    env_error = await asyncio.to_thread(validate_environment, data_group)
+    if env_error:
+        feedback["debug"] = env_error
+        return feedback
+
+    # Validate inputs
+    input_errors = validate_inputs(data_group, data_source, start_period, end_period)
+    input_errors += validate_fetch_options(output_format)
+    if input_errors:
+        feedback["debug"] = " | ".join(input_errors)
+        return feedback
+
+    # Select appropriate handler
+    if data_group == "MSP":
+        feedback = await execute_handler_async(read_msp_data_async, data_group, data_source, data_type, bank_code, start_period, end_period, output_format)
+    elif data_group == "MACROECONOMICS":
+        feedback = await execute_handler_async(read_macroeconomics_data_async, data_group, data_source, data_type, bank_code, start_period, end_period, output_format)
+    elif data_group == "ITRS":
+        feedback = await execute_handler_async(read_itrs_data_async, data_group, data_source, data_type, bank_code, start_period, end_period, output_format)
+    elif data_group == "SUBMISSIONS":
+        feedback = await asyncio.to_thread(execute_handler, read_submissions, data_group, data_source, data_type, bank_code, start_period, end_period)
+    else:
+        feedback["debug"] = f"No handler found for data group: {data_group}"
+
+    # Check if result is empty
+    if is_empty_result(feedback["df"]):
+        feedback["debug"] += " | Output DataFrame is empty. Check data source or query parameters."
+
+    return feedback
+
+async def read_profile_async(data_group, data_source, fsp_code):
+    """
+    Coroutine form of read_profile().
+    """
+    feedback = {"info": "", "debug": "", "df": pd.DataFrame()}
+
+    # Validate environment
+    env_error = await asyncio.to_thread(validate_environment)
+    if env_error:
+        feedback["debug"] = env_error
+        return feedback
+
+    # Validate inputs
+    input_error = validate_profile_inputs(data_group, data_source)
+    if input_error:
+        feedback["debug"] = input_error
+        return feedback
+
+    # Execute handler
+    feedback = await execute_handler_async(read_fsp_profile_async, data_group, data_source, fsp_code)
+
+    # Check if result is empty
+    if feedback.setdefault("df", pd.DataFrame()).empty:
+        feedback["debug"] += " | Output DataFrame is empty. Check data source or query parameters."
+
+    return feedback
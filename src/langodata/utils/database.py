@@ -1,6 +1,61 @@
+import asyncio
+import math
 import oracledb
 import os
+import threading
+import pandas as pd
+from langodata.config import APP_NAME
 from langodata.utils.decryption import decrypt
+from langodata.utils.license_manager import load_environment
+from langodata.utils.tracing import span, record_metrics, result_size
+from langodata.utils.query_catalog import INSTITUTION_LIST_TYPE
+
+try:
+    import pyarrow
+except ImportError:  # Arrow output and the columnar fetch path are optional
+    pyarrow = None
+
+
+# Environment variables holding (user, password, dsn) for each data source.
+CREDENTIAL_ENV = {
+    "BSIS": ("BSIS_USER", "BSIS_PASS", "BSIS_DSN"),
+    "BSISA": ("BSIS_USERA", "BSIS_PASSA", "BSIS_DSN"),
+    "EDI": ("EDI_USER", "EDI_PASS", "EDI_DSN"),
+    "DWH": ("DWH_USER", "DWH_PASS", "DWH_DSN"),
+}
+
+# Default pool sizing; override per source with e.g. BSIS_POOL_MAX or
+# globally with DB_POOL_MAX, or at runtime through configure_pool().
+DEFAULT_POOL_SETTINGS = {
+    "min": 1,
+    "max": 4,
+    "increment": 1,
+    "ping_interval": 60,
+    "stmtcachesize": 50,
+}
+
+# Result formats accepted by DatabaseConnection.fetch_dataframe() and read_data().
+OUTPUT_FORMATS = ["pandas", "arrow"]
+
+# Rows per network round trip for DataFrame fetches.
+FETCH_ARRAYSIZE = int(os.getenv("DB_FETCH_ARRAYSIZE", "10000"))
+
+# Rows per batch when a reader streams its result.
+DEFAULT_CHUNKSIZE = int(os.getenv("DB_STREAM_CHUNKSIZE", "50000"))
+
+# Distinct bind value sets remembered per statement text by statement_stats().
+MAX_BIND_SETS = int(os.getenv("DB_STATS_MAX_BIND_SETS", "1000"))
+
+_pools = {}
+_pool_settings = {}
+_pool_counters = {}
+_pool_lock = threading.Lock()
+_statement_stats = {}
+_stats_lock = threading.Lock()
+_async_pools = {}
+_async_limits = {}
+# (SID, SERIAL#) of the sessions already set up, per async pool key
+_async_sessions = {}
 
 
 def _get_env_and_decrypt(key: str) -> str:
@@ -9,6 +64,7 @@ def _get_env_and_decrypt(key: str) -> str:
     Raises a ValueError with an informative message if the environment
     variable is missing or decryption fails.
     """
+    load_environment()
     val = os.getenv(key)
     if val is None:
         raise ValueError(f"Environment variable {key} is not set; cannot obtain credentials.")
@@ -17,59 +73,370 @@ def _get_env_and_decrypt(key: str) -> str:
     except Exception as e:
         raise ValueError(f"Failed to decrypt environment variable {key}: {e}")
 
+
+def _pooling_enabled() -> bool:
+    """Pooling is on unless DB_POOL_ENABLED is set to a false value."""
+    return os.getenv("DB_POOL_ENABLED", "true").strip().lower() not in ("0", "false", "no")
+
+
+def _init_session(connection, requested_tag):
+    """Default session callback, run once for every new session, pooled or standalone.
+
+    Tags the session with the application name and pins the date format the
+    readers rely on when comparing REPORTINGDATE with 'DD-MON-YYYY' strings.
+    """
+    connection.module = APP_NAME
+    with connection.cursor() as cursor:
+        cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'DD-MON-YYYY'")
+
+
+def _session_setup(data_source: str):
+    """Return the session callback for a data source: the default setup, then any configure_pool() callback."""
+    user_callback = _pool_settings.get(data_source, {}).get("session_callback")
+
+    def session_callback(connection, requested_tag):
+        _init_session(connection, requested_tag)
+        if user_callback:
+            user_callback(connection, requested_tag)
+
+    return session_callback
+
+
+def configure_pool(data_source: str, min: int = None, max: int = None, increment: int = None,
+                   session_callback=None, ping_interval: int = None):
+    """
+    Set pool options for a data source before its pool is first used.
+
+    Args:
+        data_source (str): The data source ("BSIS", "BSISA", "EDI" or "DWH").
+        min (int): Sessions opened when the pool is created.
+        max (int): Upper bound on concurrent sessions.
+        increment (int): Sessions opened each time the pool grows.
+        session_callback (callable): Called as ``callback(connection, requested_tag)``
+            after the default session setup, for every new session.
+        ping_interval (int): Seconds a session may sit idle before it is
+            health-checked on acquire; a negative value disables pinging.
+
+    Raises:
+        ValueError: If the data source is unknown or its pool already exists.
+    """
+    if data_source not in CREDENTIAL_ENV:
+        raise ValueError(f"Invalid data source: {data_source}")
+    options = {"min": min, "max": max, "increment": increment,
+               "session_callback": session_callback, "ping_interval": ping_interval}
+    with _pool_lock:
+        if data_source in _pools:
+            raise ValueError(f"Pool for {data_source} is already open; call close_pools() first.")
+        _pool_settings.setdefault(data_source, {}).update(
+            {key: value for key, value in options.items() if value is not None}
+        )
+
+
+def _resolve_pool_settings(data_source: str) -> dict:
+    """Merge defaults, environment overrides and configure_pool() options."""
+    settings = {}
+    for key, default in DEFAULT_POOL_SETTINGS.items():
+        value = os.getenv(f"{data_source}_POOL_{key.upper()}", os.getenv(f"DB_POOL_{key.upper()}"))
+        settings[key] = int(value) if value else default
+    settings.update(_pool_settings.get(data_source, {}))
+    return settings
+
+
+def source_pool_size(data_source: str) -> int:
+    """Maximum sessions the pool for a data source will open."""
+    return _resolve_pool_settings(data_source)["max"]
+
+
+def get_pool(data_source: str, user: str, password: str, dsn: str):
+    """Return the process-wide pool for a data source, creating it on first use."""
+    with _pool_lock:
+        pool = _pools.get(data_source)
+        if pool is None:
+            settings = _resolve_pool_settings(data_source)
+            settings.pop("session_callback", None)
+            pool = oracledb.create_pool(
+                user=user,
+                password=password,
+                dsn=dsn,
+                session_callback=_session_setup(data_source),
+                **settings
+            )
+            _pools[data_source] = pool
+            _pool_counters[data_source] = {"acquired": 0, "released": 0}
+        return pool
+
+
+def pool_stats() -> dict:
+    """Return sizing and usage counters for every open pool, keyed by data source."""
+    stats = {}
+    with _pool_lock:
+        for data_source, pool in _pools.items():
+            stats[data_source] = {
+                "min": pool.min,
+                "max": pool.max,
+                "increment": pool.increment,
+                "opened": pool.opened,
+                "busy": pool.busy,
+                **_pool_counters[data_source],
+            }
+    return stats
+
+
+def close_pools():
+    """Close every open pool; new pools are created lazily on the next connection."""
+    with _pool_lock:
+        for pool in _pools.values():
+            pool.close(force=True)
+        _pools.clear()
+        _pool_counters.clear()
+
+
+def _round_trips(rows: int, arraysize: int) -> int:
+    """Network round trips needed to fetch `rows` rows `arraysize` at a time."""
+    return max(1, math.ceil(rows / max(arraysize, 1)))
+
+
+def _check_output_format(output_format: str) -> None:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output format: {output_format}")
+    if output_format == "arrow" and pyarrow is None:
+        raise ValueError("pyarrow is required for output_format='arrow'")
+
+
+def _arrow_result(table, columns, output_format):
+    """Name the columns of a fetched Arrow table and convert it to the requested format."""
+    with span("dataframe", output_format=output_format):
+        if columns and len(columns) == table.num_columns:
+            table = table.rename_columns(columns)
+        result = table if output_format == "arrow" else table.to_pandas()
+    record_metrics(rows=table.num_rows, bytes=result_size(result),
+                   round_trips=_round_trips(table.num_rows, FETCH_ARRAYSIZE))
+    return result
+
+
+def _rows_result(rows, names, columns, output_format):
+    """Build the requested result format from fetched row tuples."""
+    if columns and len(columns) == len(names):
+        names = columns
+    with span("dataframe", output_format=output_format):
+        df = pd.DataFrame(rows, columns=names)
+        result = pyarrow.Table.from_pandas(df, preserve_index=False) if output_format == "arrow" else df
+    record_metrics(rows=len(rows), bytes=result_size(result), round_trips=_round_trips(len(rows), FETCH_ARRAYSIZE))
+    return result
+
+
+def _has_collections(params) -> bool:
+    return bool(params) and any(isinstance(value, (list, tuple)) for value in params.values())
+
+
+def _bind_collections(collection_type, params):
+    """Replace list values in `params` with collection objects of `collection_type`."""
+    return {key: collection_type.newobject(list(value)) if isinstance(value, (list, tuple)) else value
+            for key, value in params.items()}
+
+
+def _record_statement(query: str, params) -> None:
+    """Count executions of a statement text; every run after the first can reuse its cursor."""
+    with _stats_lock:
+        stats = _statement_stats.setdefault(query, {"executions": 0, "reuses": 0, "bind_sets": set()})
+        stats["executions"] += 1
+        if stats["executions"] > 1:
+            stats["reuses"] += 1
+        if params and len(stats["bind_sets"]) < MAX_BIND_SETS:
+            stats["bind_sets"].add(tuple(sorted((key, str(value)) for key, value in params.items())))
+
+
+def statement_stats() -> dict:
+    """
+    Return per-statement execution counters, keyed by SQL text.
+
+    ``reuses`` counts executions that could be served from the statement
+    cache instead of a hard parse; ``distinct_binds`` counts the different
+    bind value sets the same text was run with, up to MAX_BIND_SETS.
+    """
+    with _stats_lock:
+        return {
+            query: {
+                "executions": stats["executions"],
+                "reuses": stats["reuses"],
+                "distinct_binds": len(stats["bind_sets"]),
+            }
+            for query, stats in _statement_stats.items()
+        }
+
+
+def reset_statement_stats():
+    """Clear the per-statement execution counters."""
+    with _stats_lock:
+        _statement_stats.clear()
+
+
 class DatabaseConnection:
-    def __init__(self, data_source):
+    def __init__(self, data_source, pooled=None):
         self.conn = None
         self.user = None
         self.password = None
         self.dsn = None
+        self.data_source = data_source
+        self.pooled = _pooling_enabled() if pooled is None else pooled
+        self._pool = None
+
+        if data_source in CREDENTIAL_ENV:
+            user_env, password_env, dsn_env = CREDENTIAL_ENV[data_source]
+            self.user = _get_env_and_decrypt(user_env)
+            self.password = _get_env_and_decrypt(password_env)
+            self.dsn = os.getenv(dsn_env)
+
 
-        if data_source == "BSIS":
-            self.user = _get_env_and_decrypt("BSIS_USER")
-            self.password = _get_env_and_decrypt("BSIS_PASS")
-            self.dsn = os.getenv("BSIS_DSN")
-        if data_source == "BSISA":
-            self.user = _get_env_and_decrypt("BSIS_USERA")
-            self.password = _get_env_and_decrypt("BSIS_PASSA")
-            self.dsn = os.getenv("BSIS_DSN")    
-        elif data_source == "EDI":
-            self.user = _get_env_and_decrypt("EDI_USER")
-            self.password = _get_env_and_decrypt("EDI_PASS")
-            self.dsn = os.getenv("EDI_DSN")
-        if data_source == "DWH":
-            self.user = _get_env_and_decrypt("DWH_USER")
-            self.password = _get_env_and_decrypt("DWH_PASS")
-            self.dsn = os.getenv("DWH_DSN")           
-
-  
     def connect(self):
         if not self.conn:
-            self.conn = oracledb.connect(
-                user=self.user,
-                password=self.password,
-                dsn=self.dsn
-            )
+            with span("connect", data_source=self.data_source, pooled=self.pooled):
+                self._open()
         return self.conn
-        
+
+    def _open(self):
+        if not self.conn:
+            if self.pooled:
+                self._pool = get_pool(self.data_source, self.user, self.password, self.dsn)
+                self.conn = self._pool.acquire()
+                with _pool_lock:
+                    _pool_counters[self.data_source]["acquired"] += 1
+            else:
+                self.conn = oracledb.connect(
+                    user=self.user,
+                    password=self.password,
+                    dsn=self.dsn
+                )
+                # A standalone session gets the same setup as a pooled one
+                _session_setup(self.data_source)(self.conn, None)
+
     def cursor(self):
         """Get a cursor object."""
-        return self.connect().cursor()    
+        return self.connect().cursor()
+
+    def bind_collections(self, params):
+        """Bind list values, such as a list of bank codes, as one Oracle collection each."""
+        if not _has_collections(params):
+            return params
+        return _bind_collections(self.conn.gettype(INSTITUTION_LIST_TYPE), params)
 
     def __enter__(self):
         self.connect()
         return self
 
     def execute_query(self, query, params=None):
+        _record_statement(query, params)
+        params = self.bind_collections(params)
         with self.conn.cursor() as cursor:
-            if params:
-                return cursor.execute(query, params).fetchall()
-            else:
-                return cursor.execute(query).fetchall()
+            with span("execute"):
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+            with span("fetch"):
+                rows = cursor.fetchall()
+        record_metrics(rows=len(rows), round_trips=_round_trips(len(rows), cursor.arraysize))
+        return rows
 
+    def fetch_dataframe(self, query, params=None, columns=None, output_format="pandas"):
+        """
+        Run a query and return the result as a typed pandas DataFrame or pyarrow Table.
 
-    def __exit__(self, exc_type, exc_value, traceback):
+        Uses oracledb's Arrow fetch so NUMBER, DATE and VARCHAR2 columns land
+        directly in typed column buffers instead of a list of Python tuples.
+        Falls back to ``fetchall()`` when the driver or pyarrow lacks support.
+
+        Args:
+            query (str): SQL statement, with bind placeholders.
+            params (dict): Bind values for the statement.
+            columns (list): Names to give the result columns; ignored when the
+                statement returns a different number of columns.
+            output_format (str): "pandas" or "arrow".
+
+        Returns:
+            pd.DataFrame or pyarrow.Table: The query result.
+        """
+        _check_output_format(output_format)
+        _record_statement(query, params)
+        params = self.bind_collections(params)
+
+        if pyarrow is not None and hasattr(self.conn, "fetch_df_all"):
+            with span("fetch", path="arrow"):
+                table = pyarrow.table(
+                    self.conn.fetch_df_all(statement=query, parameters=params or None, arraysize=FETCH_ARRAYSIZE)
+                )
+            return _arrow_result(table, columns, output_format)
+
+        with self.conn.cursor() as cursor:
+            cursor.arraysize = FETCH_ARRAYSIZE
+            with span("execute"):
+                cursor.execute(query, params or {})
+            names = [description[0] for description in cursor.description]
+            with span("fetch", path="cursor"):
+                rows = cursor.fetchall()
+        return _rows_result(rows, names, columns, output_format)
+
+    def iter_dataframes(self, query, params=None, columns=None, chunksize=None, arraysize=None,
+                        output_format="pandas"):
+        """
+        Run a query and yield the result in batches of at most `chunksize` rows.
+
+        Only one batch is held in memory at a time, so peak memory is bounded
+        by the chunk size rather than the size of the result.
+
+        Args:
+            query (str): SQL statement, with bind placeholders.
+            params (dict): Bind values for the statement.
+            columns (list): Names to give the result columns; ignored when the
+                statement returns a different number of columns.
+            chunksize (int): Rows per yielded batch (default DEFAULT_CHUNKSIZE).
+            arraysize (int): Rows per network round trip (default: the smaller
+                of the chunk size and FETCH_ARRAYSIZE).
+            output_format (str): "pandas" or "arrow".
+
+        Yields:
+            pd.DataFrame or pyarrow.Table: One batch of rows.
+        """
+        _check_output_format(output_format)
+        chunksize = chunksize or DEFAULT_CHUNKSIZE
+        _record_statement(query, params)
+        params = self.bind_collections(params)
+
+        with self.conn.cursor() as cursor:
+            cursor.arraysize = arraysize or min(chunksize, FETCH_ARRAYSIZE)
+            cursor.prefetchrows = cursor.arraysize
+            with span("execute"):
+                cursor.execute(query, params or {})
+            names = [description[0] for description in cursor.description]
+            if columns and len(columns) == len(names):
+                names = columns
+            while True:
+                with span("fetch", path="stream"):
+                    rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                with span("dataframe", output_format=output_format):
+                    df = pd.DataFrame(rows, columns=names)
+                    batch = pyarrow.Table.from_pandas(df, preserve_index=False) if output_format == "arrow" else df
+                record_metrics(rows=len(rows), bytes=result_size(batch),
+                               round_trips=-(-len(rows) // cursor.arraysize), batches=1)
+                yield batch
+
+    def close(self):
+        """Return a pooled session to its pool, or close a standalone connection."""
         if self.conn:
-            self.conn.close()
+            if self._pool is not None:
+                self._pool.release(self.conn)
+                with _pool_lock:
+                    if self.data_source in _pool_counters:
+                        _pool_counters[self.data_source]["released"] += 1
+            else:
+                self.conn.close()
+            self.conn = None
+            self._pool = None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
     # Expose user, password, and dsn as properties
@@ -83,4 +450,193 @@ class DatabaseConnection:
 
     @property
     def get_dsn(self):
-        return self.dsn
\ No newline at end of file
+        return self.dsn
+
+
+def stream_query(data_source, query, params=None, columns=None, chunksize=None, arraysize=None,
+                 output_format="pandas"):
+    """
+    Generator that opens its own connection and yields the result batch by batch.
+
+    The session is borrowed when iteration starts and returned when the
+    generator is exhausted or closed, so callers can hand it out of a reader.
+    """
+    with DatabaseConnection(data_source) as conn:
+        yield from conn.iter_dataframes(query, params, columns, chunksize, arraysize, output_format)
+
+
+def _async_concurrency(data_source: str) -> int:
+    """Extracts allowed in flight per source: {SRC}_ASYNC_CONCURRENCY, DB_ASYNC_CONCURRENCY or the pool max."""
+    value = os.getenv(f"{data_source}_ASYNC_CONCURRENCY", os.getenv("DB_ASYNC_CONCURRENCY"))
+    return int(value) if value else source_pool_size(data_source)
+
+
+def get_async_limit(data_source: str) -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent async extracts against a data source."""
+    loop = asyncio.get_running_loop()
+    with _pool_lock:
+        entry = _async_limits.get(data_source)
+        if entry is None or entry[0] is not loop:
+            entry = (loop, asyncio.Semaphore(_async_concurrency(data_source)))
+            _async_limits[data_source] = entry
+        return entry[1]
+
+
+def get_async_pool(data_source: str, user: str, password: str, dsn: str):
+    """Return the asyncio pool for a data source on the running event loop, creating it on first use.
+
+    Pools are kept per (data source, event loop), so a pool is never replaced
+    while another loop may still be using it; the pools of a loop that has
+    been closed are dropped, their sessions having gone with the loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _pool_lock:
+        for key in [key for key in _async_pools if key[1].is_closed()]:
+            del _async_pools[key]
+            _async_sessions.pop(key, None)
+        pool = _async_pools.get((data_source, loop))
+        if pool is None:
+            settings = _resolve_pool_settings(data_source)
+            # The session setup runs in AsyncDatabaseConnection.connect() instead.
+            settings.pop("session_callback", None)
+            pool = oracledb.create_pool_async(user=user, password=password, dsn=dsn, **settings)
+            _async_pools[(data_source, loop)] = pool
+            _async_sessions[(data_source, loop)] = set()
+        return pool
+
+
+async def _setup_async_session(data_source: str, connection) -> None:
+    """Run _init_async_session() on a session acquired from the pool the first time it is handed out."""
+    sessions = _async_sessions.setdefault((data_source, asyncio.get_running_loop()), set())
+    session = (connection.session_id, connection.serial_num)
+    if session not in sessions:
+        await _init_async_session(data_source, connection)
+        sessions.add(session)
+
+
+async def _init_async_session(data_source: str, connection) -> None:
+    """Async form of _session_setup(): the default setup, then any configure_pool() callback.
+
+    The readers bind periods as 'DD-MON-YYYY' strings, e.g. the macroeconomics
+    TIME_PERIOD BETWEEN :start_period AND :end_period, so async sessions need
+    the same NLS_DATE_FORMAT as the synchronous ones. A coroutine callback is
+    awaited.
+    """
+    connection.module = APP_NAME
+    with connection.cursor() as cursor:
+        await cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'DD-MON-YYYY'")
+    user_callback = _pool_settings.get(data_source, {}).get("session_callback")
+    if user_callback:
+        outcome = user_callback(connection, None)
+        if asyncio.iscoroutine(outcome):
+            await outcome
+
+
+async def close_async_pools():
+    """Close every asyncio pool opened on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _pool_lock:
+        closing = {key: pool for key, pool in _async_pools.items() if key[1] is loop}
+        for key in closing:
+            del _async_pools[key]
+            _async_sessions.pop(key, None)
+    for pool in closing.values():
+        await pool.close(force=True)
+
+
+class AsyncDatabaseConnection:
+    """
+    asyncio counterpart of DatabaseConnection built on oracledb's async pools.
+
+    Entering the context waits for a slot on the per-source semaphore before a
+    session is acquired, so any number of coroutines can share a few sessions.
+    """
+
+    def __init__(self, data_source):
+        self.conn = None
+        self.user = None
+        self.password = None
+        self.dsn = None
+        self.data_source = data_source
+        self._pool = None
+        self._limit = None
+
+        if data_source in CREDENTIAL_ENV:
+            user_env, password_env, dsn_env = CREDENTIAL_ENV[data_source]
+            self.user = _get_env_and_decrypt(user_env)
+            self.password = _get_env_and_decrypt(password_env)
+            self.dsn = os.getenv(dsn_env)
+
+    async def connect(self):
+        if not self.conn:
+            with span("connect", data_source=self.data_source, pooled=True):
+                self._limit = get_async_limit(self.data_source)
+                await self._limit.acquire()
+                try:
+                    self._pool = get_async_pool(self.data_source, self.user, self.password, self.dsn)
+                    self.conn = await self._pool.acquire()
+                    await _setup_async_session(self.data_source, self.conn)
+                except BaseException:
+                    if self.conn:
+                        await self._pool.release(self.conn)
+                        self.conn = None
+                    self._limit.release()
+                    self._limit = None
+                    raise
+        return self.conn
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def bind_collections(self, params):
+        """Bind list values, such as a list of bank codes, as one Oracle collection each."""
+        if not _has_collections(params):
+            return params
+        return _bind_collections(await self.conn.gettype(INSTITUTION_LIST_TYPE), params)
+
+    async def execute_query(self, query, params=None):
+        _record_statement(query, params)
+        params = await self.bind_collections(params)
+        with self.conn.cursor() as cursor:
+            with span("execute"):
+                await cursor.execute(query, params or {})
+            with span("fetch"):
+                rows = await cursor.fetchall()
+        record_metrics(rows=len(rows), round_trips=_round_trips(len(rows), cursor.arraysize))
+        return rows
+
+    async def fetch_dataframe(self, query, params=None, columns=None, output_format="pandas"):
+        """Async form of DatabaseConnection.fetch_dataframe(); same arguments and result."""
+        _check_output_format(output_format)
+        _record_statement(query, params)
+        params = await self.bind_collections(params)
+
+        if pyarrow is not None and hasattr(self.conn, "fetch_df_all"):
+            with span("fetch", path="arrow"):
+                table = pyarrow.table(
+                    await self.conn.fetch_df_all(statement=query, parameters=params or None, arraysize=FETCH_ARRAYSIZE)
+                )
+            return _arrow_result(table, columns, output_format)
+
+        with self.conn.cursor() as cursor:
+            cursor.arraysize = FETCH_ARRAYSIZE
+            with span("execute"):
+                await cursor.execute(query, params or {})
+            names = [description[0] for description in cursor.description]
+            with span("fetch", path="cursor"):
+                rows = await cursor.fetchall()
+        return _rows_result(rows, names, columns, output_format)
+
+    async def close(self):
+        """Return the session to its pool and free the concurrency slot."""
+        if self.conn:
+            await self._pool.release(self.conn)
+            self.conn = None
+            self._pool = None
+        if self._limit is not None:
+            self._limit.release()
+            self._limit = None
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
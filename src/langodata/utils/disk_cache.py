@@ -0,0 +1,159 @@
+"""
+Persistent Parquet cache of reader results, one file per reporting month.
+
+Files live under LANGODATA_CACHE_DIR as
+``<group>/<type>/<source>/<institution>/<YYYY-MM>.parquet``. Only months
+that closed more than DISK_CACHE_OPEN_MONTHS ago are kept; open and recent
+months always go to Oracle. The directory is kept under
+DISK_CACHE_MAX_BYTES by evicting the least recently used files: a file's
+access time records its last use and its modification time when it was
+written. Writes keep a running total of the directory size, and the
+directory is only walked once that total crosses the limit or is older
+than DISK_CACHE_SWEEP_SECONDS, as other processes write to it too. The
+period cache (period_cache.read_periods) decides which months
+to load and store.
+"""
+
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from langodata.utils.tracing import record_metrics
+
+try:
+    import pyarrow
+except ImportError:  # Parquet needs pyarrow; without it the cache is disabled
+    pyarrow = None
+
+
+DISK_CACHE_DIR = os.getenv("LANGODATA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".langodata", "cache"))
+DISK_CACHE_MAX_BYTES = int(os.getenv("DISK_CACHE_MAX_BYTES", str(2 * 1024 ** 3)))
+DISK_CACHE_OPEN_MONTHS = int(os.getenv("DISK_CACHE_OPEN_MONTHS", "2"))
+DISK_CACHE_COMPRESSION = os.getenv("DISK_CACHE_COMPRESSION", "zstd")
+DISK_CACHE_SWEEP_SECONDS = int(os.getenv("DISK_CACHE_SWEEP_SECONDS", "600"))
+
+_evict_lock = threading.Lock()
+# Cache directory -> [bytes, time of the walk that measured them]
+_cache_sizes = {}
+
+
+def disk_cache_enabled(cache=None) -> bool:
+    """
+    Whether a read should go through the disk cache.
+
+    ``cache`` overrides the LANGODATA_DISK_CACHE switch (off by default); the
+    cache is always off without pyarrow.
+    """
+    if pyarrow is None:
+        return False
+    if cache is None:
+        return os.getenv("LANGODATA_DISK_CACHE", "false").strip().lower() in ("1", "true", "yes")
+    return bool(cache)
+
+
+def is_closed(month: datetime, today: date = None) -> bool:
+    """True when `month` ended before the open window of the reporting calendar."""
+    today = today or date.today()
+    first_open = today.replace(day=1)
+    for _ in range(DISK_CACHE_OPEN_MONTHS):
+        first_open = (first_open - timedelta(days=1)).replace(day=1)
+    return month.date() < first_open
+
+
+def cache_path(data_group, data_type, data_source, bank_code, month: datetime) -> str:
+    institution = "ALL" if bank_code == "*" else bank_code
+    return os.path.join(DISK_CACHE_DIR, data_group, data_type, data_source, institution,
+                        f"{month:%Y-%m}.parquet")
+
+
+def load_month(path: str):
+    """Read a cached month and mark it recently used; None when absent or unreadable."""
+    try:
+        df = pd.read_parquet(path)
+    except (OSError, ValueError, pyarrow.ArrowException):
+        return None
+    # Mark the file as recently used, keeping its modification time as the write time
+    os.utime(path, (time.time(), os.stat(path).st_mtime))
+    record_metrics(cache_bytes_read=os.path.getsize(path))
+    return df
+
+
+def store_month(path: str, df: pd.DataFrame) -> None:
+    """Write one month atomically, then evict old files if the cache is over its limit."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    df.to_parquet(temp_path, compression=DISK_CACHE_COMPRESSION, index=False)
+    with _evict_lock:
+        replaced = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(temp_path, path)
+        written = os.path.getsize(path)
+        if not _add_bytes(written - replaced, DISK_CACHE_MAX_BYTES):
+            _evict(DISK_CACHE_MAX_BYTES)
+    record_metrics(cache_bytes_written=written)
+
+
+def _add_bytes(delta: int, max_bytes: int) -> bool:
+    """Add a write to the running size; False when that size is unknown, stale or over `max_bytes`."""
+    measured = _cache_sizes.get(DISK_CACHE_DIR)
+    if measured is None or time.time() - measured[1] > DISK_CACHE_SWEEP_SECONDS:
+        return False
+    measured[0] += delta
+    return measured[0] <= max_bytes
+
+
+def evict(max_bytes: int) -> int:
+    """Delete least recently used files until the cache fits in `max_bytes`; returns files removed."""
+    with _evict_lock:
+        return _evict(max_bytes)
+
+
+def _evict(max_bytes: int) -> int:
+    files = []
+    for folder, _, names in os.walk(DISK_CACHE_DIR):
+        for name in names:
+            if name.endswith(".parquet"):
+                path = os.path.join(folder, name)
+                stat = os.stat(path)
+                files.append((stat.st_atime, stat.st_size, path))
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        os.remove(path)
+        total -= size
+        removed += 1
+    _cache_sizes[DISK_CACHE_DIR] = [total, time.time()]
+    if removed:
+        record_metrics(cache_evictions=removed)
+    return removed
+
+
+def cached_months() -> list:
+    """
+    List every cached file.
+
+    Returns:
+        list: ``(data_group, data_type, data_source, institution, "YYYY-MM",
+        written_at, path)`` tuples; ``institution`` is ``'*'`` for all-bank files.
+    """
+    months = []
+    for folder, _, names in os.walk(DISK_CACHE_DIR):
+        parts = os.path.relpath(folder, DISK_CACHE_DIR).split(os.sep)
+        if len(parts) != 4:
+            continue
+        data_group, data_type, data_source, institution = parts
+        for name in names:
+            if name.endswith(".parquet"):
+                path = os.path.join(folder, name)
+                months.append((data_group, data_type, data_source, "*" if institution == "ALL" else institution,
+                               name[:-len(".parquet")], os.stat(path).st_mtime, path))
+    return months
+
+
+def clear_disk_cache() -> None:
+    """Remove every cached file."""
+    evict(0)
@@ -0,0 +1,373 @@
+"""
+Balance of Payments statement built from the ITRS FINAL tables.
+
+The statement is the ITRS_URT_BOP_TEMPLATE rows with the USD totals of
+their receipts and payments purpose codes. Instead of two SUM statements per
+template row, each FINAL table is scanned once with GROUP BY PU_CODE and the
+totals are joined to the template in one merge.
+
+The account-group aggregates of load_account_groups() (itrs_account_groups)
+are compiled once into a RollupPlan, a DAG from component to aggregate codes,
+and computed on the code totals bottom-up with one grouped sum per level of
+the DAG. The totals may hold one column per period, so a whole series is
+rolled up in one pass.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from langodata.utils.database import DatabaseConnection, source_pool_size
+from langodata.utils.itrs_account_groups import load_account_groups
+from langodata.utils.logger import Logger
+from langodata.utils.query_catalog import BOP_SERIES_QUERY, BOP_SUMS_QUERY, BOP_TEMPLATE_QUERY, bind_params
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+BOP_COLUMNS = ["DESCRIPTIONNO", "PURPOSE", "RECEIPTS_CODE", "PAYMENTS_CODE",
+               "RECEIPTS_AMOUNT", "PAYMENTS_AMOUNT", "NET_AMOUNT", "REG_DATE"]
+
+DIRECTIONS = ["RECEIPTS", "PAYMENTS"]
+
+AMOUNT_COLUMNS = ["RECEIPTS_AMOUNT", "PAYMENTS_AMOUNT", "NET_AMOUNT"]
+
+REGIONS = ["URT", "ZNZ"]
+
+
+def reporting_timestamp(period: str) -> pd.Timestamp:
+    """Return a DD-MON-YYYY period as the REG_DATE Timestamp, as in the series."""
+    return pd.to_datetime(period, format="%d-%b-%Y")
+
+
+def final_table(schema: str, region: str, direction: str) -> str:
+    """Return the FINAL table of a region ("URT" or "ZNZ") and direction."""
+    return f"{schema}ITRS_{region}_{direction}_FINAL"
+
+
+def read_template(conn, schema: str) -> pd.DataFrame:
+    """Fetch the BOP template with its purpose codes as nullable integers."""
+    sql = BOP_TEMPLATE_QUERY.format(table_name=f"{schema}ITRS_URT_BOP_TEMPLATE")
+    template = conn.fetch_dataframe(sql, {}, BOP_COLUMNS[:4])
+    for column in ("RECEIPTS_CODE", "PAYMENTS_CODE"):
+        template[column] = pd.to_numeric(template[column], errors="coerce").astype("Int64")
+    return template
+
+
+def read_code_sums(conn, table_name: str, reporting_date: str) -> pd.Series:
+    """Return the USD total of every PU_CODE of one FINAL table on a reporting date, indexed by code."""
+    sql = BOP_SUMS_QUERY.format(table_name=table_name)
+    sums = conn.fetch_dataframe(sql, bind_params(sql, reporting_date=reporting_date), ["PU_CODE", "AMOUNT"])
+    codes = pd.to_numeric(sums["PU_CODE"], errors="coerce").astype("Int64")
+    return sums["AMOUNT"].astype(float).groupby(codes).sum()
+
+
+def read_code_series(conn, table_name: str, start_period: str, end_period: str) -> pd.DataFrame:
+    """Return the USD total of every PU_CODE (rows) and reporting date (columns) of one FINAL table."""
+    sql = BOP_SERIES_QUERY.format(table_name=table_name)
+    sums = conn.fetch_dataframe(sql, bind_params(sql, start_period=start_period, end_period=end_period),
+                                ["REPORTINGDATE", "PU_CODE", "AMOUNT"])
+    codes = pd.to_numeric(sums["PU_CODE"], errors="coerce").astype("Int64").rename("PU_CODE")
+    dates = pd.to_datetime(sums["REPORTINGDATE"]).dt.normalize().rename("REG_DATE")
+    return sums["AMOUNT"].astype(float).groupby([codes, dates]).sum().unstack("REG_DATE")
+
+
+def _flatten_groups(account_groups: list):
+    """Yield every group definition, descending into nested groups."""
+    for account_group in account_groups:
+        for definition in account_group.values():
+            if "aggregate_code" in definition or "payments_codes" in definition:
+                yield definition
+            else:
+                yield from _flatten_groups([definition])
+
+
+class RollupPlan:
+    """
+    Account-group aggregates compiled into a DAG from component to aggregate codes.
+
+    For each direction the edges are split into levels: an aggregate's level
+    is one above the highest aggregate among its components, so a single
+    grouped sum per level, bottom-up, computes every aggregate after the
+    aggregates it depends on.
+    """
+
+    def __init__(self, levels: dict):
+        self.levels = levels
+
+    def apply(self, amounts, direction: str):
+        """
+        Fill in the aggregates of one direction.
+
+        Args:
+            amounts (DataFrame or Series): Totals indexed by PU code; a
+                DataFrame may hold one column per reporting period.
+            direction (str): "RECEIPTS" or "PAYMENTS".
+
+        Returns:
+            Same type as `amounts`, indexed by every reported and aggregate
+            code. An aggregate is the sum of its components; when none of
+            them has data, the aggregate's own reported total is kept.
+        """
+        frame = amounts.to_frame() if isinstance(amounts, pd.Series) else amounts
+        levels = self.levels[direction]
+        codes = frame.index.append(pd.Index(np.concatenate([edges["AGGREGATE"].to_numpy() for edges in levels])
+                                            if levels else [], dtype=frame.index.dtype)).unique()
+        values = np.full((len(codes), frame.shape[1]), np.nan)
+        values[codes.get_indexer(frame.index)] = frame.to_numpy(dtype=float, na_value=np.nan)
+        for edges in levels:
+            children = codes.get_indexer(edges["CHILD"].to_numpy())
+            known = children >= 0
+            children, parents = children[known], codes.get_indexer(edges["AGGREGATE"].to_numpy()[known])
+            component = values[children]
+            totals = np.zeros((len(codes), values.shape[1]))
+            counts = np.zeros((len(codes), values.shape[1]))
+            np.add.at(totals, parents, np.nan_to_num(component))
+            np.add.at(counts, parents, ~np.isnan(component))
+            values = np.where(counts > 0, totals, values)
+        if isinstance(amounts, pd.Series):
+            return pd.Series(values[:, 0], index=codes, name=amounts.name)
+        return pd.DataFrame(values, index=codes, columns=frame.columns)
+
+
+def compile_account_groups(account_groups: list = None) -> RollupPlan:
+    """
+    Compile account-group definitions into a RollupPlan.
+
+    Nested groups are included. When an aggregate code is defined more than
+    once for a direction, the last definition wins.
+
+    Raises:
+        ValueError: If the definitions contain a cycle.
+    """
+    children = {direction: {} for direction in DIRECTIONS}
+    for definition in _flatten_groups(load_account_groups() if account_groups is None else account_groups):
+        for direction, aggregate_key in (("PAYMENTS", "aggregate_code"), ("RECEIPTS", "aggregate_receipts_code")):
+            codes = definition.get(f"{direction.lower()}_codes", [])
+            aggregate_code = definition.get(aggregate_key)
+            if codes and aggregate_code:
+                children[direction][aggregate_code] = list(codes)
+
+    levels = {}
+    for direction, graph in children.items():
+        depth = {}
+
+        def visit(code, path):
+            if code in depth:
+                return depth[code]
+            if code in path:
+                raise ValueError(f"Cycle in {direction.lower()} account groups: {' -> '.join(map(str, path + [code]))}")
+            depth[code] = max([visit(child, path + [code]) for child in graph[code] if child in graph], default=-1) + 1
+            return depth[code]
+
+        for code in graph:
+            visit(code, [])
+        edges = pd.DataFrame([(child, code, depth[code]) for code in graph for child in graph[code]],
+                             columns=["CHILD", "AGGREGATE", "LEVEL"])
+        levels[direction] = [level_edges for _, level_edges in edges.groupby("LEVEL", sort=True)]
+    return RollupPlan(levels)
+
+
+_default_plan = None
+
+
+def default_plan() -> RollupPlan:
+    """Return the plan of load_account_groups(), compiled on first use."""
+    global _default_plan
+    if _default_plan is None:
+        _default_plan = compile_account_groups()
+    return _default_plan
+
+
+def build_statement(template: pd.DataFrame, receipts: pd.Series, payments: pd.Series, reporting_date,
+                    plan: RollupPlan = None) -> pd.DataFrame:
+    """
+    Fill in the aggregates of the code totals and join them to the template.
+
+    Args:
+        template (DataFrame): Output of read_template().
+        receipts (Series): Receipts totals indexed by PU_CODE.
+        payments (Series): Payments totals indexed by PU_CODE.
+        reporting_date: Value of the REG_DATE column.
+        plan (RollupPlan): Aggregates to compute; default_plan() by default.
+
+    Returns:
+        DataFrame: One row per template row with BOP_COLUMNS.
+    """
+    plan = plan or default_plan()
+    statement = template.copy()
+    for direction, sums in (("RECEIPTS", receipts), ("PAYMENTS", payments)):
+        totals = plan.apply(sums, direction)
+        totals = totals.rename(f"{direction}_AMOUNT").rename_axis(f"{direction}_CODE").reset_index()
+        statement = statement.merge(totals, on=f"{direction}_CODE", how="left")
+        statement[f"{direction}_AMOUNT"] = statement[f"{direction}_AMOUNT"].fillna(0.0)
+    statement["NET_AMOUNT"] = statement["RECEIPTS_AMOUNT"] - statement["PAYMENTS_AMOUNT"]
+    statement["REG_DATE"] = reporting_date
+    return statement[BOP_COLUMNS]
+
+
+def build_series(template: pd.DataFrame, receipts: pd.DataFrame, payments: pd.DataFrame, wide: bool = False,
+                 plan: RollupPlan = None) -> pd.DataFrame:
+    """
+    Build the statement of every reporting date at once.
+
+    The aggregates of all periods are rolled up in one pass per direction and
+    the template rows are looked up in the code x period matrices, so the cost
+    does not grow with a per-period loop.
+
+    Args:
+        template (DataFrame): Output of read_template().
+        receipts (DataFrame): Receipts totals, PU codes by reporting date.
+        payments (DataFrame): Payments totals, PU codes by reporting date.
+        wide (bool): Return one row per reporting date instead of one row per
+            template row and reporting date.
+        plan (RollupPlan): Aggregates to compute; default_plan() by default.
+
+    Returns:
+        DataFrame: In long form the BOP_COLUMNS ordered by REG_DATE and
+        DESCRIPTIONNO; in wide form indexed by REG_DATE with columns
+        ``(amount column, DESCRIPTIONNO)``.
+    """
+    plan = plan or default_plan()
+    periods = receipts.columns.union(payments.columns).sort_values()
+    amounts = {}
+    for direction, sums in (("RECEIPTS", receipts), ("PAYMENTS", payments)):
+        totals = plan.apply(sums.reindex(columns=periods), direction)
+        amounts[f"{direction}_AMOUNT"] = totals.reindex(template[f"{direction}_CODE"]).fillna(0.0).to_numpy()
+    amounts["NET_AMOUNT"] = amounts["RECEIPTS_AMOUNT"] - amounts["PAYMENTS_AMOUNT"]
+
+    # Template rows repeat once per period; the matrices are read period by period
+    series = template.iloc[np.tile(np.arange(len(template)), len(periods))].reset_index(drop=True)
+    for column, values in amounts.items():
+        series[column] = values.T.ravel()
+    series["REG_DATE"] = np.repeat(periods.to_numpy(), len(template))
+    series = series[BOP_COLUMNS]
+    if wide:
+        return series.pivot(index="REG_DATE", columns="DESCRIPTIONNO", values=AMOUNT_COLUMNS)
+    return series
+
+
+def read_bop_series(data_source: str, schema: str, start_period: str, end_period: str, wide: bool = False,
+                    output_format: str = "pandas") -> dict:
+    """
+    Build the URT BOP statement of every reporting date in [start_period, end_period].
+
+    Three statements are run on one session however many periods there are:
+    the template, and one scan each of the receipts and payments FINAL tables
+    grouped by reporting date and PU_CODE. Reporting dates without flows are
+    left out.
+
+    Returns:
+        dict: Contains Info, Debug, and the series DataFrame (or Arrow table;
+        the wide columns are then named ``<amount column>_<DESCRIPTIONNO>``).
+    """
+    logger = Logger()
+    result = {"info": "", "debug": "", "df": pd.DataFrame()}
+    try:
+        with DatabaseConnection(data_source) as conn:
+            template = read_template(conn, schema)
+            sums = {direction: read_code_series(conn, final_table(schema, "URT", direction), start_period, end_period)
+                    for direction in DIRECTIONS}
+        series = build_series(template, sums["RECEIPTS"], sums["PAYMENTS"], wide)
+        if output_format == "arrow":
+            if wide:
+                series = series.set_axis([f"{column}_{number}" for column, number in series.columns], axis=1)
+            series = pyarrow.Table.from_pandas(series, preserve_index=wide)
+        result["df"] = series
+        result["info"] = "Query executed successfully for BOP series."
+        logger.info("BOP series successfully built.")
+    except Exception as e:
+        error_message = f"Error building ITRS BOP series: {str(e)}"
+        result["debug"] += error_message
+        logger.error(error_message)
+    return result
+
+
+def read_bop(data_source: str, schema: str, start_period: str, end_period: str,
+             output_format: str = "pandas") -> dict:
+    """
+    Build the URT BOP statement of the reporting date end_period.
+
+    As with the original BOP, only flows reported on that date are summed;
+    start_period is not used (BOP_SERIES covers a range). Three statements
+    are run on one session: the template, and one grouped scan each of
+    ITRS_URT_RECEIPTS_FINAL and ITRS_URT_PAYMENTS_FINAL.
+
+    Returns:
+        dict: Contains Info, Debug, and the statement DataFrame (or Arrow table).
+    """
+    logger = Logger()
+    result = {"info": "", "debug": "", "df": pd.DataFrame()}
+    try:
+        with DatabaseConnection(data_source) as conn:
+            template = read_template(conn, schema)
+            sums = {direction: read_code_sums(conn, final_table(schema, "URT", direction), end_period)
+                    for direction in DIRECTIONS}
+        statement = build_statement(template, sums["RECEIPTS"], sums["PAYMENTS"], reporting_timestamp(end_period))
+        result["df"] = pyarrow.Table.from_pandas(statement, preserve_index=False) if output_format == "arrow" else statement
+        result["info"] = "Query executed successfully for BOP."
+        logger.info("BOP statement successfully built.")
+    except Exception as e:
+        error_message = f"Error building ITRS BOP: {str(e)}"
+        result["debug"] += error_message
+        logger.error(error_message)
+    return result
+
+
+def read_region_sums(data_source: str, schema: str, region: str, reporting_date: str) -> dict:
+    """Return the code totals of both FINAL tables of a region, read on a session of its own."""
+    with DatabaseConnection(data_source) as conn:
+        return {direction: read_code_sums(conn, final_table(schema, region, direction), reporting_date)
+                for direction in DIRECTIONS}
+
+
+def read_bop_regions(data_source: str, schema: str, start_period: str, end_period: str,
+                     output_format: str = "pandas") -> dict:
+    """
+    Build the URT, ZNZ and consolidated BOP statements of the reporting date end_period together.
+
+    The template and the grouped scans of the URT and ZNZ FINAL tables are
+    read concurrently, each on its own session. The consolidated code totals
+    are the sum of the two regions' totals, so they cost no further query;
+    the aggregates of every view are then rolled up from its own totals.
+
+    Returns:
+        dict: Contains Info, Debug, and one DataFrame (or Arrow table) with a
+        REGION column ("URT", "ZNZ" or "CONSOLIDATED") before the BOP_COLUMNS.
+    """
+    logger = Logger()
+    result = {"info": "", "debug": "", "df": pd.DataFrame()}
+    try:
+        def read_statement_template():
+            with DatabaseConnection(data_source) as conn:
+                return read_template(conn, schema)
+
+        workers = max(1, min(len(REGIONS) + 1, source_pool_size(data_source)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bop") as executor:
+            template_future = executor.submit(contextvars.copy_context().run, read_statement_template)
+            region_futures = {region: executor.submit(contextvars.copy_context().run, read_region_sums,
+                                                      data_source, schema, region, end_period)
+                              for region in REGIONS}
+            template = template_future.result()
+            sums = {region: future.result() for region, future in region_futures.items()}
+        sums["CONSOLIDATED"] = {direction: sums["URT"][direction].add(sums["ZNZ"][direction], fill_value=0.0)
+                                for direction in DIRECTIONS}
+
+        reporting_date = reporting_timestamp(end_period)
+        statements = [build_statement(template, region_sums["RECEIPTS"], region_sums["PAYMENTS"], reporting_date)
+                      .assign(REGION=region) for region, region_sums in sums.items()]
+        statements = pd.concat(statements, ignore_index=True)[["REGION"] + BOP_COLUMNS]
+        result["df"] = (pyarrow.Table.from_pandas(statements, preserve_index=False) if output_format == "arrow"
+                        else statements)
+        result["info"] = "Query executed successfully for BOP regions."
+        logger.info("BOP statements successfully built for URT, ZNZ and consolidated.")
+    except Exception as e:
+        error_message = f"Error building ITRS BOP regions: {str(e)}"
+        result["debug"] += error_message
+        logger.error(error_message)
+    return result
@@ -1,12 +1,16 @@
+import asyncio
 import os
 import pandas as pd
-from langodata.utils.database import DatabaseConnection
+from langodata.utils.database import DatabaseConnection, AsyncDatabaseConnection, stream_query
 from langodata.utils.logger import Logger
-from typing import Dict
-from datetime import datetime
+from langodata.utils.itrs_bop import read_bop, read_bop_regions, read_bop_series
+from langodata.utils.itrs_pivot import PIVOT_TYPES, read_pivot
+from langodata.utils.query_catalog import ITRS_QUERIES, institution_condition, institution_binds, bind_params, get_query
 
 
-def read_itrs_data(data_group: str, data_source: str, data_type: str, bank_code: str, start_period: str, end_period: str) -> dict:
+def read_itrs_data(data_group: str, data_source: str, data_type: str, bank_code, start_period: str, end_period: str,
+                   output_format: str = "pandas", chunksize: int = None, stream: bool = False,
+                   arraysize: int = None) -> dict:
     """
     Reads ITRS data from the specified data source and returns a result dictionary.
 
@@ -14,9 +18,27 @@ def read_itrs_data(data_group: str, data_source: str, data_type: str, bank_code:
         data_group (str): The data group (e.g., "ITRS").
         data_source (str): The data source (e.g., "BSIS" or "EDI").
         data_type (str): The type of data to fetch.
-        bank_code (str): Bank code to filter data. Use '*' for all banks.
+        bank_code (str or list): Bank code to filter data, a list of codes, or '*' for all banks.
         start_period (str): Start date of the period (DD-MON-YYYY).
         end_period (str): End date of the period (DD-MON-YYYY).
+        output_format (str): "pandas" for a DataFrame or "arrow" for a pyarrow Table.
+        chunksize (int): Rows per batch; when set, "df" is a generator of batches.
+        stream (bool): Stream with the default chunk size when chunksize is not given.
+        arraysize (int): Rows fetched per network round trip while streaming.
+
+    The "BOP" data type builds the URT Balance of Payments statement of the
+    reporting date end_period (see itrs_bop); start_period is ignored, so
+    request a range with "BOP_SERIES". That builds one statement per
+    reporting date between start_period and end_period, one row per template
+    row and date, and "BOP_SERIES_WIDE" one row per date. "BOP_REGIONS"
+    builds the URT, ZNZ and consolidated statements of end_period together,
+    told apart by a REGION column, and ignores start_period too. They are
+    always returned whole, never streamed.
+
+    The country/sector pivots (COUNTRIES_SECTORS_*, CONSOLIDATED_*) and the
+    regional blocs (REGION_SECTOR_*) are computed in memory from one
+    ITRS_DETAIL extract per month shared by all of them (see itrs_pivot);
+    they are not streamed either.
 
     Returns:
         dict: Contains Info, Debug, and DataFrame with ITRS data.
@@ -25,51 +47,37 @@ def read_itrs_data(data_group: str, data_source: str, data_type: str, bank_code:
     result = {"info": "", "debug": "", "df": pd.DataFrame()}
 
     # Validate inputs
-    valid_data_sources = ["BSIS", "EDI"]
-    valid_data_types = [
-        "RATES", "MONITORING", "OVERALL_ANALYSIS", "TRANSFORMATION_ERRORS",
-        "COUNTRIES_SECTORS_TZS", "COUNTRIES_SECTORS_USD",
-        "CONSOLIDATED_TZS", "CONSOLIDATED_USD",
-        "REGION_SECTOR_TZS", "REGION_SECTOR_USD",
-        "URT_PAYMENTS", "URT_RECEIPTS",
-        "ZNZ_PAYMENTS", "ZNZ_RECEIPTS",
-        "URT_PAYMENTS_FINAL", "URT_RECEIPTS_FINAL",
-        "ZNZ_PAYMENTS_FINAL", "ZNZ_RECEIPTS_FINAL"
-    ]
-
-    if data_source not in valid_data_sources:
-        result["debug"] += f"Invalid data source: {data_source}. "
-        return result
-    if data_type not in valid_data_types:
-        result["debug"] += f"Invalid data type: {data_type}. "
+    request_error = validate_request(data_source, data_type)
+    if request_error:
+        result["debug"] += request_error
         return result
 
+    if data_type == "BOP":
+        return read_bop(data_source, get_schema(data_source, data_type), start_period, end_period, output_format)
+    if data_type in ("BOP_SERIES", "BOP_SERIES_WIDE"):
+        return read_bop_series(data_source, get_schema(data_source, data_type), start_period, end_period,
+                               data_type == "BOP_SERIES_WIDE", output_format)
+    if data_type == "BOP_REGIONS":
+        return read_bop_regions(data_source, get_schema(data_source, data_type), start_period, end_period,
+                                output_format)
+    if data_type in PIVOT_TYPES:
+        table_name = get_table_name(data_type, get_schema(data_source, data_type))
+        return read_pivot(data_source, table_name, data_type, start_period, end_period, output_format)
+
     try:
+        sql_query, params, columns = build_query(data_source, data_type, bank_code, start_period, end_period)
+
+        if chunksize or stream:
+            # Hand back a generator of batches; the session is held until it is exhausted
+            result["df"] = stream_query(data_source, sql_query, params, columns, chunksize, arraysize, output_format)
+            result["info"] = f"Streaming {data_type} in batches."
+            return result
+
         with DatabaseConnection(data_source) as conn:
-            # Determine schema
-            schema = get_schema(data_source, data_type)
-            
-            # Get table name
-            table_name = get_table_name(data_type, schema)
-            
-            # Get SQL query
-            sql_query = get_sql_query(data_type, table_name, start_period, end_period, bank_code)
-            
-            if not sql_query:
-                result["debug"] += f"No query found for data type: {data_type}. "
-                return result
-
-            # Execute query
-            data = conn.execute_query(sql_query)
-            
-            # Get column names
-            columns = get_columns(data_type)
-            if not columns:
-                raise ValueError(f"Invalid data_type '{data_type}'. No column mapping found.")
-
-            # Construct DataFrame
-            if data:
-                result["df"] = pd.DataFrame(data, columns=columns)
+            # Execute query and fetch straight into typed columns
+            df = conn.fetch_dataframe(sql_query, params, columns, output_format)
+            if len(df):
+                result["df"] = df
                 logger.info(f"Data successfully retrieved for {data_type}.")
                 result["info"] = f"Query executed successfully for {data_type}."
             else:
@@ -84,6 +92,107 @@ def read_itrs_data(data_group: str, data_source: str, data_type: str, bank_code:
     return result
 
 
+async def read_itrs_data_async(data_group: str, data_source: str, data_type: str, bank_code, start_period: str,
+                               end_period: str, output_format: str = "pandas") -> dict:
+    """
+    Coroutine form of read_itrs_data() for use from an event loop.
+
+    Takes the same arguments (without streaming) and returns the same result
+    dictionary; the extract waits for a free slot on the source's semaphore.
+    """
+    logger = Logger()
+    result = {"info": "", "debug": "", "df": pd.DataFrame()}
+
+    request_error = validate_request(data_source, data_type)
+    if request_error:
+        result["debug"] += request_error
+        return result
+
+    if data_type == "BOP":
+        # The statement is a few grouped scans on one session; run it off the loop
+        return await asyncio.to_thread(read_bop, data_source, get_schema(data_source, data_type),
+                                       start_period, end_period, output_format)
+    if data_type in ("BOP_SERIES", "BOP_SERIES_WIDE"):
+        return await asyncio.to_thread(read_bop_series, data_source, get_schema(data_source, data_type),
+                                       start_period, end_period, data_type == "BOP_SERIES_WIDE", output_format)
+    if data_type == "BOP_REGIONS":
+        return await asyncio.to_thread(read_bop_regions, data_source, get_schema(data_source, data_type),
+                                       start_period, end_period, output_format)
+    if data_type in PIVOT_TYPES:
+        table_name = get_table_name(data_type, get_schema(data_source, data_type))
+        return await asyncio.to_thread(read_pivot, data_source, table_name, data_type,
+                                       start_period, end_period, output_format)
+
+    try:
+        sql_query, params, columns = build_query(data_source, data_type, bank_code, start_period, end_period)
+        async with AsyncDatabaseConnection(data_source) as conn:
+            df = await conn.fetch_dataframe(sql_query, params, columns, output_format)
+        if len(df):
+            result["df"] = df
+            logger.info(f"Data successfully retrieved for {data_type}.")
+            result["info"] = f"Query executed successfully for {data_type}."
+        else:
+            logger.warning(f"No data found for the given parameters: {data_type}")
+            result["info"] = "No data found for the given parameters."
+    except Exception as e:
+        error_message = f"Error fetching ITRS data: {str(e)}"
+        result["debug"] += error_message
+        logger.error(error_message)
+
+    return result
+
+
+def validate_request(data_source: str, data_type: str) -> str:
+    """Return a debug message for an unsupported source or type, or an empty string."""
+    valid_data_sources = ["BSIS", "EDI"]
+    valid_data_types = [
+        "RATES", "MONITORING", "OVERALL_ANALYSIS", "TRANSFORMATION_ERRORS",
+        "COUNTRIES_SECTORS_TZS", "COUNTRIES_SECTORS_USD",
+        "CONSOLIDATED_TZS", "CONSOLIDATED_USD",
+        "REGION_SECTOR_TZS", "REGION_SECTOR_USD",
+        "URT_PAYMENTS", "URT_RECEIPTS",
+        "ZNZ_PAYMENTS", "ZNZ_RECEIPTS",
+        "URT_PAYMENTS_FINAL", "URT_RECEIPTS_FINAL",
+        "ZNZ_PAYMENTS_FINAL", "ZNZ_RECEIPTS_FINAL",
+        "BOP", "BOP_SERIES", "BOP_SERIES_WIDE", "BOP_REGIONS"
+    ]
+
+    if data_source not in valid_data_sources:
+        return f"Invalid data source: {data_source}. "
+    if data_type not in valid_data_types:
+        return f"Invalid data type: {data_type}. "
+    return ""
+
+
+def build_query(data_source: str, data_type: str, bank_code, start_period: str, end_period: str) -> tuple:
+    """
+    Build the statement, bind values and column names for an ITRS extract.
+
+    Returns:
+        tuple: (sql, params, columns).
+
+    Raises:
+        ValueError: If the data type has no query or column mapping.
+    """
+    # Determine schema
+    schema = get_schema(data_source, data_type)
+
+    # Get table name
+    table_name = get_table_name(data_type, schema)
+
+    # Get SQL query
+    sql_query = get_sql_query(data_type, table_name, bank_code)
+    if not sql_query:
+        raise ValueError(f"No query found for data type: {data_type}.")
+
+    # Get column names
+    columns = get_columns(data_type)
+    if not columns:
+        raise ValueError(f"Invalid data_type '{data_type}'. No column mapping found.")
+    params = bind_params(sql_query, start_period=start_period, end_period=end_period, **institution_binds(bank_code))
+    return sql_query, params, columns
+
+
 def get_schema(data_source: str, data_type: str) -> str:
     """Determine the schema based on the data source and type."""
     if data_source == "BSIS":
@@ -98,7 +207,7 @@ def get_table_name(data_type: str, schema: str = "") -> str:
     itrs_prefix = "ITRS_"
     table_mapping = {
         "RATES": f"{schema}{itrs_prefix}FI_RATE",
-        "MONITORING": "SYS.{itrs_prefix}MONITORING",
+        "MONITORING": f"SYS.{itrs_prefix}MONITORING",
         "OVERALL_ANALYSIS": f"{schema}{itrs_prefix}master_details",
         "TRANSFORMATION_ERRORS": f"{schema}{itrs_prefix}ERRORS",
         "COUNTRIES_SECTORS_TZS": f"{schema}{itrs_prefix}ITRS_DETAIL",
@@ -119,210 +228,11 @@ def get_table_name(data_type: str, schema: str = "") -> str:
     return table_mapping.get(data_type)
 
 
-def get_sql_query(data_type: str, table_name: str, start_period: str, end_period: str, bank_code: str) -> str:
-    """Get SQL query for the specified data type."""
-    condition = "1=1" if bank_code == "*" else f"INSTITUTIONCODE = '{bank_code}'"
-
-    sql_queries = {
-        "RATES": f"""
-            SELECT ROWNUM AS SNO, A.RA_DATE AS REPORTING_DATE, A.CU_CODE AS CURRENCY,
-                   B.CU_DESC AS DESCRIPTION, A.RA_SRATE AS TZS_RATE, A.RA_DRATE AS USD_RATE
-            FROM {table_name} A, ITRS_FI_CURR B
-            WHERE A.RA_DATE BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-              AND A.CU_CODE = B.CU_CODE
-            ORDER BY A.CU_CODE
-        """,
-        "MONITORING": f"""
-            SELECT ROWNUM AS SNO, A."RETURN NAME", A."EDI RECORDS", A."LAST EDI UPDATE",
-                   A."BSIS RECORDS", A."TRANSFORMED RECORDS", A."LAST MIGRATION",
-                   TO_CHAR(ROUND(A."MIGRATION PERCENTAGE", 0)) || '%' AS MIGRATION_PERCENTAGE,
-                   A."LAST TRANSFORMATION",
-                   TO_CHAR(ROUND(A."TRANSFORMATION PERCENTAGE", 0)) || '%' AS TRANSFORMATION_PERCENTAGE,
-                   TO_CHAR(ROUND(A."COMPLETION PERCENTAGE", 0)) || '%' AS COMPLETION_PERCENTAGE
-            FROM {table_name} A
-        """,
-        "OVERALL_ANALYSIS": f"""
-            SELECT *
-            FROM {table_name}
-            WHERE reportingdate BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-        """,
-        "TRANSFORMATION_ERRORS": f"""
-            SELECT ROWNUM AS SNO, ERROR_DATE, ERROR_DETAILS, ERROR_TYPE, ERROR_ID
-            FROM (
-                SELECT ERROR_DATE, ERROR_DETAILS, ERROR_TYPE, ID AS ERROR_ID
-                FROM {table_name}
-                WHERE LAST_DAY(TO_DATE(ERROR_DATE, 'DD-MM-YY') - 31)
-                      BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-                ORDER BY ERROR_DATE DESC
-            )
-        """,
-        "COUNTRIES_SECTORS_TZS": f"""
-            SELECT *
-            FROM (
-                SELECT DISTINCT COUNTRY, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION AS LOCATION_PURPOSE,
-                                amount_in_tzs_eqv
-                FROM {table_name}
-                WHERE reportingdate BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-                GROUP BY COUNTRY, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION, amount_in_tzs_eqv
-            )
-            PIVOT (
-                SUM(amount_in_tzs_eqv)
-                FOR LOCATION_PURPOSE IN ('PAYMENT -URT', 'RECEIPTS -URT', 'PAYMENT -ZANZIBAR', 'RECEIPTS -ZANZIBAR')
-            )
-        """,
-        "COUNTRIES_SECTORS_USD": f"""
-            SELECT *
-            FROM (
-                SELECT DISTINCT COUNTRY, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION AS LOCATION_PURPOSE,
-                                AMOUNT_IN_USD_EQV
-                FROM {table_name}
-                WHERE reportingdate BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-                GROUP BY COUNTRY, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION, AMOUNT_IN_USD_EQV
-                ORDER BY COUNTRY ASC, SECTOR ASC
-            )
-            PIVOT (
-                SUM(AMOUNT_IN_USD_EQV)
-                FOR LOCATION_PURPOSE IN ('PAYMENT -URT', 'RECEIPTS -URT', 'PAYMENT -ZANZIBAR', 'RECEIPTS -ZANZIBAR')
-            )
-        """,
-        "CONSOLIDATED_TZS": f"""
-            SELECT *
-            FROM (
-                SELECT DISTINCT COUNTRY, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION AS LOCATION_PURPOSE,
-                                AMOUNT_IN_TZS_EQV
-                FROM {table_name}
-                WHERE reportingdate BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-                GROUP BY COUNTRY, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION, AMOUNT_IN_TZS_EQV
-                ORDER BY COUNTRY ASC, SECTOR ASC
-            )
-            PIVOT (
-                SUM(AMOUNT_IN_TZS_EQV)
-                FOR LOCATION_PURPOSE IN ('PAYMENT -URT', 'RECEIPTS -URT', 'PAYMENT -ZANZIBAR', 'RECEIPTS -ZANZIBAR')
-            )
-        """,
-        "CONSOLIDATED_USD": f"""
-            SELECT *
-            FROM (
-                SELECT DISTINCT COUNTRY, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION AS LOCATION_PURPOSE,
-                                AMOUNT_IN_USD_EQV
-                FROM {table_name}
-                WHERE reportingdate BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-                GROUP BY COUNTRY, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION, AMOUNT_IN_USD_EQV
-                ORDER BY COUNTRY ASC, SECTOR ASC
-            )
-            PIVOT (
-                SUM(AMOUNT_IN_USD_EQV)
-                FOR LOCATION_PURPOSE IN ('PAYMENT -URT', 'RECEIPTS -URT', 'PAYMENT -ZANZIBAR', 'RECEIPTS -ZANZIBAR')
-            )
-        """,
-        "REGION_SECTOR_TZS": f"""
-            SELECT REGION_GROUPING, SECTOR, SUM(NVL(PAYMENT_URT, 0)) AS PAYMENT_URT,
-                   SUM(NVL(RECEIPTS_URT, 0)) AS RECEIPTS_URT,
-                   SUM(NVL(PAYMENT_ZANZIBAR, 0)) AS PAYMENT_ZANZIBAR,
-                   SUM(NVL(RECEIPTS_ZANZIBAR, 0)) AS RECEIPTS_ZANZIBAR
-            FROM (
-                SELECT 'EAC' AS REGION_GROUPING, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION AS LOCATION_PURPOSE,
-                       AMOUNT_IN_TZS_EQV
-                FROM {table_name}
-                WHERE reportingdate BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-                  AND COUNTRY IN ('TANZANIA', 'KENYA', 'UGANDA', 'RWANDA', 'BURUNDI', 'SOUTH SUDAN')
-                UNION ALL
-                SELECT 'SADC' AS REGION_GROUPING, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION AS LOCATION_PURPOSE,
-                       AMOUNT_IN_TZS_EQV
-                FROM {table_name}
-                WHERE reportingdate BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-                  AND COUNTRY IN ('SOUTH AFRICA', 'ZAMBIA', 'ZIMBABWE')
-            )
-            PIVOT (
-                SUM(AMOUNT_IN_TZS_EQV)
-                FOR LOCATION_PURPOSE IN ('PAYMENT -URT', 'RECEIPTS -URT', 'PAYMENT -ZANZIBAR', 'RECEIPTS -ZANZIBAR')
-            )
-            GROUP BY REGION_GROUPING, SECTOR
-            ORDER BY REGION_GROUPING ASC, SECTOR ASC
-        """,
-        "REGION_SECTOR_USD": f"""
-            SELECT REGION_GROUPING, SECTOR, SUM(NVL(PAYMENT_URT, 0)) AS PAYMENT_URT,
-                   SUM(NVL(RECEIPTS_URT, 0)) AS RECEIPTS_URT,
-                   SUM(NVL(PAYMENT_ZANZIBAR, 0)) AS PAYMENT_ZANZIBAR,
-                   SUM(NVL(RECEIPTS_ZANZIBAR, 0)) AS RECEIPTS_ZANZIBAR
-            FROM (
-                SELECT 'EAC' AS REGION_GROUPING, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION AS LOCATION_PURPOSE,
-                       AMOUNT_IN_USD_EQV
-                FROM {table_name}
-                WHERE reportingdate BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-                  AND COUNTRY IN ('TANZANIA', 'KENYA', 'UGANDA', 'RWANDA', 'BURUNDI', 'SOUTH SUDAN')
-                UNION ALL
-                SELECT 'SADC' AS REGION_GROUPING, SECTOR, PURPOSE || ' -' || TRANSACTION_LOCATION AS LOCATION_PURPOSE,
-                       AMOUNT_IN_USD_EQV
-                FROM {table_name}
-                WHERE reportingdate BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-                  AND COUNTRY IN ('SOUTH AFRICA', 'ZAMBIA', 'ZIMBABWE')
-            )
-            PIVOT (
-                SUM(AMOUNT_IN_USD_EQV)
-                FOR LOCATION_PURPOSE IN ('PAYMENT -URT', 'RECEIPTS -URT', 'PAYMENT -ZANZIBAR', 'RECEIPTS -ZANZIBAR')
-            )
-            GROUP BY REGION_GROUPING, SECTOR
-            ORDER BY REGION_GROUPING ASC, SECTOR ASC
-        """,
-        "URT_PAYMENTS": f"""
-            SELECT B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.DESCRIPTIONNO AS SNO, A.REPORTINGDATE,A.PURPOSE, A.PU_CODE AS CODE, A.SECTOR, A.COUNTRY, A.CURRENCY, A.AMOUNT
-            FROM {table_name} A, INSTITUTION B
-            JOIN {table_name}_INSTITUTION B ON A.INSTITUTIONCODE = B.INSTITUTIONCODE
-            WHERE {condition} AND A.INSTITUTIONCODE=B.INSTITUTIONCODE AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-            ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO, A.REPORTINGDATE DESC
-        """,
-        "URT_RECEIPTS": f"""
-            SELECT B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.DESCRIPTIONNO AS SNO, A.REPORTINGDATE,A.PURPOSE, A.PU_CODE AS CODE, A.SECTOR, A.COUNTRY, A.CURRENCY, A.AMOUNT
-            FROM {table_name} A, INSTITUTION B
-            JOIN {table_name}_INSTITUTION B ON A.INSTITUTIONCODE = B.INSTITUTIONCODE
-            WHERE {condition} AND A.INSTITUTIONCODE=B.INSTITUTIONCODE AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-            ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO, A.REPORTINGDATE DESC
-        """,
-        "ZNZ_PAYMENTS": f"""
-            SELECT B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.DESCRIPTIONNO AS SNO, A.REPORTINGDATE,A.PURPOSE, A.PU_CODE AS CODE, A.SECTOR, A.COUNTRY, A.CURRENCY, A.AMOUNT
-            FROM {table_name} A, INSTITUTION B
-            JOIN {table_name}_INSTITUTION B ON A.INSTITUTIONCODE = B.INSTITUTIONCODE
-            WHERE {condition} AND A.INSTITUTIONCODE=B.INSTITUTIONCODE AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-            ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO, A.REPORTINGDATE DESC
-        """,
-        "ZNZ_RECEIPTS": f"""
-            SELECT B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.DESCRIPTIONNO AS SNO, A.REPORTINGDATE,A.PURPOSE, A.PU_CODE AS CODE, A.SECTOR, A.COUNTRY, A.CURRENCY, A.AMOUNT
-            FROM {table_name} A, INSTITUTION B
-            JOIN {table_name}_INSTITUTION B ON A.INSTITUTIONCODE = B.INSTITUTIONCODE
-            WHERE {condition} AND A.INSTITUTIONCODE=B.INSTITUTIONCODE AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-            ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO, A.REPORTINGDATE DESC
-        """,
-        "URT_PAYMENTS_FINAL": f"""
-            SELECT DESCRIPTIONNO AS SNO, REPORTINGDATE, PURPOSE, PU_CODE AS CODE, SECTOR, COUNTRY, CURRENCY,
-                   AMOUNT_IN_ORIG_CURRENCY, AMOUNT_IN_USD_EQV, AMOUNT_IN_TZS_EQV
-            FROM {table_name}
-            WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-            ORDER BY REPORTINGDATE DESC, SNO
-        """,
-        "URT_RECEIPTS_FINAL": f"""
-            SELECT DESCRIPTIONNO AS SNO, REPORTINGDATE, PURPOSE, PU_CODE AS CODE, SECTOR, COUNTRY, CURRENCY,
-                   AMOUNT_IN_ORIG_CURRENCY, AMOUNT_IN_USD_EQV, AMOUNT_IN_TZS_EQV
-            FROM {table_name}
-            WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-            ORDER BY REPORTINGDATE DESC, SNO
-        """,
-        "ZNZ_PAYMENTS_FINAL": f"""
-            SELECT DESCRIPTIONNO AS SNO, REPORTINGDATE, PURPOSE, PU_CODE AS CODE, SECTOR, COUNTRY, CURRENCY,
-                   AMOUNT_IN_ORIG_CURRENCY, AMOUNT_IN_USD_EQV, AMOUNT_IN_TZS_EQV
-            FROM {table_name}
-            WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-            ORDER BY REPORTINGDATE DESC, SNO
-        """,
-        "ZNZ_RECEIPTS_FINAL": f"""
-            SELECT DESCRIPTIONNO AS SNO, REPORTINGDATE, PURPOSE, PU_CODE AS CODE, SECTOR, COUNTRY, CURRENCY,
-                   AMOUNT_IN_ORIG_CURRENCY, AMOUNT_IN_USD_EQV, AMOUNT_IN_TZS_EQV
-            FROM {table_name}
-            WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE('{start_period}', 'DD-MON-YYYY') AND TO_DATE('{end_period}', 'DD-MON-YYYY')
-            ORDER BY REPORTINGDATE DESC, SNO
-        """
-    }
-    return sql_queries.get(data_type)
+def get_sql_query(data_type: str, table_name: str, bank_code) -> str:
+    """Get the bind-parameterized SQL query for the specified data type."""
+    column = "INSTITUTIONCODE" if data_type.endswith("_FINAL") else "A.INSTITUTIONCODE"
+    condition = institution_condition(bank_code, column)
+    return get_query(ITRS_QUERIES, data_type, table_name=table_name, condition=condition)
 
 
 def get_columns(data_type: str) -> list:
@@ -335,18 +245,6 @@ def get_columns(data_type: str) -> list:
         "OVERALL_ANALYSIS": ["INSTITUTION", "TRANSACTION_LOCATION", "PERIOD", "REPORTINGDATE", "DATE",
                             "PURPOSE", "PURPOSE_DESCRIPTION"],
         "TRANSFORMATION_ERRORS": ["SNO", "ERROR_DATE", "ERROR_DETAILS", "ERROR_TYPE", "ERROR_ID"],
-        "COUNTRIES_SECTORS_TZS": ["COUNTRY", "SECTOR", "PAYMENT -URT", "RECEIPTS -URT",
-                                  "PAYMENT -ZANZIBAR", "RECEIPTS -ZANZIBAR"],
-        "COUNTRIES_SECTORS_USD": ["COUNTRY", "SECTOR", "PAYMENT -URT", "RECEIPTS -URT",
-                                  "PAYMENT -ZANZIBAR", "RECEIPTS -ZANZIBAR"],
-        "CONSOLIDATED_TZS": ["COUNTRY", "SECTOR", "PAYMENT -URT", "RECEIPTS -URT",
-                            "PAYMENT -ZANZIBAR", "RECEIPTS -ZANZIBAR"],
-        "CONSOLIDATED_USD": ["COUNTRY", "SECTOR", "PAYMENT -URT", "RECEIPTS -URT",
-                            "PAYMENT -ZANZIBAR", "RECEIPTS -ZANZIBAR"],
-        "REGION_SECTOR_TZS": ["REGION_GROUPING", "SECTOR", "PAYMENT_URT", "RECEIPTS_URT",
-                             "PAYMENT_ZANZIBAR", "RECEIPTS_ZANZIBAR"],
-        "REGION_SECTOR_USD": ["REGION_GROUPING", "SECTOR", "PAYMENT_URT", "RECEIPTS_URT",
-                             "PAYMENT_ZANZIBAR", "RECEIPTS_ZANZIBAR"],
         "URT_PAYMENTS": ["SNO", "REPORTINGDATE", "PURPOSE", "CODE", "SECTOR", "COUNTRY", "CURRENCY", "AMOUNT"],
         "URT_RECEIPTS": ["SNO", "REPORTINGDATE", "PURPOSE", "CODE", "SECTOR", "COUNTRY", "CURRENCY", "AMOUNT"],
         "ZNZ_PAYMENTS": ["SNO", "REPORTINGDATE", "PURPOSE", "CODE", "SECTOR", "COUNTRY", "CURRENCY", "AMOUNT"],
@@ -1,6 +1,7 @@
 import os
 import pandas as pd
 from langodata.utils.database import DatabaseConnection
+from langodata.utils.itrs_account_groups import load_account_groups
 from langodata.utils.logger import Logger
 from typing import Dict
 from datetime import datetime
@@ -273,404 +274,6 @@ def itrs_bop(reporting_date, user, password, dsn):
         if conn:
             conn.close()
 
-def load_account_groups():
-    """Loads account groups from a predefined structure."""
-    account_groups = []
-
-    # Example account groups and their definitions
-    account_groups.append({
-        "Goods Account": {
-            "payments_codes": [3101000, 3102000],
-            "receipts_codes": [2101000, 2102000, 2103000, 2104000],
-            "aggregate_code": 3100000,
-            "aggregate_receipts_code": 2100000
-        }
-    })
-
-    account_groups.append({
-        "Sea Transport": {
-            "payments_codes": [3203010, 3203020, 3203030],
-            "receipts_codes": [2203010, 2203020, 2203030],
-            "aggregate_code": 3203001,
-            "aggregate_receipts_code": 2203001
-        },
-        "Air Transport": {
-            "payments_codes": [3203110, 3203120, 3203130],
-            "receipts_codes": [2203110, 2203120, 2203130],
-            "aggregate_code": 3203100,
-            "aggregate_receipts_code": 2203100
-        },
-        "Rail Transport": {
-            "payments_codes": [3203210, 3203220, 3203230],
-            "receipts_codes": [2203210, 2203220, 2203230],
-            "aggregate_code": 3203200,
-            "aggregate_receipts_code": 2203200
-        },
-        "Road Transport": {
-            "payments_codes": [3203310, 3203320, 3203330],
-            "receipts_codes": [2203310, 2203320, 2203330],
-            "aggregate_code": 3203300,
-            "aggregate_receipts_code": 2203300
-        }
-    })
-    
-    # Adding new account groups
-    account_groups.append({
-        "Other Transport": {
-            "payments_codes": [3203410, 3203420, 3203430, 3203440, 3203450],
-            "receipts_codes": [2203410, 2203420, 2203430, 2203440, 2203450],
-            "aggregate_code": 3203400,
-            "aggregate_receipts_code": 2203400
-        },
-        "Personal Travel": {
-            "payments_codes": [3204210, 3204220, 3204230],
-            "receipts_codes": [2204210, 2204220, 2204230],
-            "aggregate_code": 3204200,
-            "aggregate_receipts_code": 2204200
-        },
-        "Overall Travel": {
-            "payments_codes": [3204100, 3204200],
-            "receipts_codes": [2204100, 2204200],
-            "aggregate_code": 3204000,
-            "aggregate_receipts_code": 2204000
-        },
-        "Transport Aggregates": {
-            "payments_codes": [3203001, 3203100, 3203200, 3203300, 3203400, 3203500],
-            "receipts_codes": [2203001, 2203100, 2203200, 2203300, 2203400, 2203500],
-            "aggregate_code": 3203000,
-            "aggregate_receipts_code": 2203000
-        }
-    })
-    
-    account_groups.append({
-        "Insurance and Pension Services": {
-            "Direct Insurance": {
-                "payments_codes": [3206110, 3206120],
-                "receipts_codes": [2206110, 2206120],
-                "aggregate_code": 3206100,
-                "aggregate_receipts_code": 2206100
-            },
-            "Reinsurance": {
-                "payments_codes": [3206210, 3206220],
-                "receipts_codes": [2206210, 2206220],
-                "aggregate_code": 3206200,
-                "aggregate_receipts_code": 2206200
-            },
-            "Pension and Standardised Guarantee Services": {
-                "payments_codes": [3206410, 3206420],
-                "receipts_codes": [2206410, 2206420],
-                "aggregate_code": 3206400,
-                "aggregate_receipts_code": 2206400
-            },
-            "Overall Insurance and Pension Services": {
-                "payments_codes": [3206100, 3206200, 3206300, 3206400],
-                "receipts_codes": [2206100, 2206200, 2206300, 2206400],
-                "aggregate_code": 3206000,
-                "aggregate_receipts_code": 2206000
-            }
-        }
-    })
-    
-    account_groups.append({
-        "Telecommunications, Computer and Information Services": {
-            "payments_codes": [3209100, 3209200, 3209300],
-            "receipts_codes": [2209100, 2209200, 2209300],
-            "aggregate_code": 3209000,
-            "aggregate_receipts_code": 2209000
-        }
-    })
-
-    account_groups.append({
-        "Government Goods and Services n.i.e.": {
-            "payments_codes": [3212100, 3212200, 3212300],
-            "receipts_codes": [2212100, 2212200, 2212300],
-            "aggregate_code": 3212000,
-            "aggregate_receipts_code": 2212000
-        }
-    })
-
-    account_groups.append({
-        "Personal, Cultural and Recreational Services": {
-            "payments_codes": [3211100, 3211200],
-            "receipts_codes": [2211100, 2211200],
-            "aggregate_code": 3211000,
-            "aggregate_receipts_code": 2211000
-        }
-    })
-
-    account_groups.append({
-        "Other Business Services": {
-            "payments_codes": [3210100, 3210200, 3210300],
-            "receipts_codes": [2210100, 2210200, 2210300],
-            "aggregate_code": 3210000,
-            "aggregate_receipts_code": 2210000
-        }
-    })
-    
-    account_groups.append({
-        "Overall Services": {
-            "payments_codes": [3201000, 3202000, 3203000, 3204000, 3205000, 3206000, 3207000, 3208000, 3209000, 3210000, 3211000, 3212000],
-            "receipts_codes": [2201000, 2202000, 2203000, 2204000, 2205000, 2206000, 2207000, 2208000, 2209000, 2210000, 2211000, 2212000],
-            "aggregate_code": 3200000,
-            "aggregate_receipts_code": 2200000
-         }
-    })
-
-    # Primary Income Account Group (2301000 and 3301000)
-    account_groups.append({
-        "Primary Income": {
-            "payments_codes": [3301100],
-            "receipts_codes": [2301100],
-            "aggregate_code": 3301000,
-            "aggregate_receipts_code": 2301000
-        }
-    })
-
-    # Salaries and Wages Account Group (2301100 and 3301100)
-    account_groups.append({
-        "Salaries and Wages": {
-            "payments_codes": [3302111],
-            "receipts_codes": [2302111],
-            "aggregate_code": 3302100,
-            "aggregate_receipts_code": 2302100
-        }
-    })
-
-    # Portfolio Investment Account Group (2302200 and 3302200)
-    account_groups.append({
-        "Portfolio Investment": {
-            "payments_codes": [3302210, 3302211, 3302220, 3302221, 3302230],
-            "receipts_codes": [2302210, 2302211, 2302220, 2302221, 2302230],
-            "aggregate_code": 3302200,
-            "aggregate_receipts_code": 2302200
-        }
-    })
-
-    # Other Investment Account Group (2302300 and 3302300)
-    account_groups.append({
-        "Other Investment": {
-            "payments_codes": [3302310, 3302320, 3302321, 3302330],
-            "receipts_codes": [2302310, 2302320, 2302321, 2302330],
-            "aggregate_code": 3302300,
-            "aggregate_receipts_code": 2302300
-        }
-    })
-
-    # Compensation of Employees Account Group (2301000 and 3301000)
-    account_groups.append({
-        "Compensation of Employees": {
-            "payments_codes": [3302100, 3302200, 3302300],
-            "receipts_codes": [2302100, 2302200, 2302300],
-            "aggregate_code": 3302000,
-            "aggregate_receipts_code": 2302000
-        }
-    })
-
-    # Reserve Assets Account Group (2303000)
-    account_groups.append({
-        "Reserve Assets": {
-            "payments_codes": [],
-            "receipts_codes": [2303100, 2303200],
-            "aggregate_code": 2303000,
-            "aggregate_receipts_code": 2303000
-        }
-    })
-
-    # Other Primary Income Account Group (2304000 and 3303000)
-    account_groups.append({
-        "Other Primary Income": {
-            "payments_codes": [3303100, 3303200],
-            "receipts_codes": [2304100, 2304200],
-            "aggregate_code": 3303000,
-            "aggregate_receipts_code": 2304000
-        }
-    })
-    
-    # Other Primary Income Account Group (2304000 and 3303000)
-    account_groups.append({
-        "Other Primary Income": {
-            "payments_codes": [3303100, 3303200],
-            "receipts_codes": [2304100, 2304200],
-            "aggregate_code": 3303000,
-            "aggregate_receipts_code": 2304000
-        }
-    })
-
-    # Primary Income Account Group (2305000 and 3304000)
-    account_groups.append({
-        "Primary Income": {
-            "payments_codes": [3304100, 3304200],
-            "receipts_codes": [2305100, 2305200],
-            "aggregate_code": 3304000,
-            "aggregate_receipts_code": 2305000
-        }
-    })
-
-    # Secondary Income Account Group (2306000 and 3305000)
-    account_groups.append({
-        "Secondary Income": {
-            "payments_codes": [3305100, 3305200],
-            "receipts_codes": [2306100, 2306200],
-            "aggregate_code": 3305000,
-            "aggregate_receipts_code": 2306000
-        }
-    })
-
-    # Tertiary Income Account Group (2307000 and 3306000)
-    account_groups.append({
-        "Tertiary Income": {
-            "payments_codes": [3306100, 3306200],
-            "receipts_codes": [2307100, 2307200],
-            "aggregate_code": 3306000,
-            "aggregate_receipts_code": 2307000
-        }
-    })
-
-    # Quaternary Income Account Group (2308000 and 3307000)
-    account_groups.append({
-        "Quaternary Income": {
-            "payments_codes": [3307100, 3307200],
-            "receipts_codes": [2308100, 2308200],
-            "aggregate_code": 3307000,
-            "aggregate_receipts_code": 2308000
-        }
-    })
-
-    # Other Expenses Account Group (2309000 and 3308000)
-    account_groups.append({
-        "Other Expenses": {
-            "payments_codes": [3308100, 3308200],
-            "receipts_codes": [2309100, 2309200],
-            "aggregate_code": 3308000,
-            "aggregate_receipts_code": 2309000
-        }
-    })
-
-    # Primary Expenses Account Group (2310000 and 3309000)
-    account_groups.append({
-        "Primary Expenses": {
-            "payments_codes": [3309100, 3309200],
-            "receipts_codes": [2310100, 2310200],
-            "aggregate_code": 3309000,
-            "aggregate_receipts_code": 2310000
-        }
-    })
-
-    # Secondary Expenses Account Group (2311000 and 3310000)
-    account_groups.append({
-        "Secondary Expenses": {
-            "payments_codes": [3310100, 3310200],
-            "receipts_codes": [2311100, 2311200],
-            "aggregate_code": 3310000,
-            "aggregate_receipts_code": 2311000
-        }
-    })
-
-    # Tertiary Expenses Account Group (2312000 and 3311000)
-    account_groups.append({
-        "Tertiary Expenses": {
-            "payments_codes": [3311100, 3311200],
-            "receipts_codes": [2312100, 2312200],
-            "aggregate_code": 3311000,
-            "aggregate_receipts_code": 2312000
-        }
-    })
-
-    # Quaternary Expenses Account Group (2313000 and 3312000)
-    account_groups.append({
-        "Quaternary Expenses": {
-            "payments_codes": [3312100, 3312200],
-            "receipts_codes": [2313100, 2313200],
-            "aggregate_code": 3312000,
-            "aggregate_receipts_code": 2313000
-        }
-    })
-
-    account_groups.append({
-        "Direct investment in Tanzania": {
-            "payments_codes": [3601210, 3601220, 3601230],
-            "receipts_codes": [2601210, 2601220, 2601230],
-            "aggregate_code": 3601200,
-            "aggregate_receipts_code": 2601200
-        }
-    })
-
-    account_groups.append({
-        "Direct Investment": {
-            "payments_codes": [3601100, 3601200],
-            "receipts_codes": [2601100, 2601200],
-            "aggregate_code": 3601000,
-            "aggregate_receipts_code": 2601000
-        }
-    })
-
-    account_groups.append({
-        "Assets": {
-            "payments_codes": [3602110, 3602120],
-            "receipts_codes": [2602110, 2602120],
-            "aggregate_code": 3602100,
-            "aggregate_receipts_code": 2602100
-        }
-    })
-
-    account_groups.append({
-        "Liabilities": {
-            "payments_codes": [3602210, 3602220],
-            "receipts_codes": [2602210, 2602220],
-            "aggregate_code": 3602200,
-            "aggregate_receipts_code": 2602200
-        }
-    })
-
-    account_groups.append({
-        "Portfolio Investment": {
-            "payments_codes": [3601100, 3601200],
-            "receipts_codes": [2601100, 2601200],
-            "aggregate_code": 3602000,
-            "aggregate_receipts_code": 2602000
-        }
-    })
-
-    account_groups.append({
-        "Assets": {
-            "payments_codes": [3603110, 3603120, 3603130, 3603140],
-            "receipts_codes": [2603110, 2603120, 2603130, 2603140],
-            "aggregate_code": 3603100,
-            "aggregate_receipts_code": 2603100
-        }
-    })
-
-    account_groups.append({
-        "Liabilities": {
-            "payments_codes": [3603210, 3603220, 3603230, 3603240],
-            "receipts_codes": [2603210, 2603220, 2603230, 2603240],
-            "aggregate_code": 3603200,
-            "aggregate_receipts_code": 2603200
-        }
-    })
-
-    account_groups.append({
-        "Other Investment": {
-            "payments_codes": [3603100, 3603200],
-            "receipts_codes": [2603100, 2603200],
-            "aggregate_code": 3603000,
-            "aggregate_receipts_code": 2603000
-        }
-    })
-
-    account_groups.append({
-        "Financial Account": {
-            "payments_codes": [3601000, 3602000, 3603000],
-            "receipts_codes": [2601000, 2602000, 2603000],
-            "aggregate_code": 3600000,
-            "aggregate_receipts_code": 2600000
-        }
-    })
-
-
-    # You can load more account groups here by appending dictionaries for each group
-
-    return account_groups
 
 def fetch_static_table(cursor):
     """Fetches records from the static ITRS_BOP template table."""
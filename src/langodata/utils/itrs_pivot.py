@@ -0,0 +1,169 @@
+"""
+Country and sector pivots of ITRS_DETAIL computed in memory.
+
+COUNTRIES_SECTORS_* and CONSOLIDATED_* used to run their own Oracle PIVOT
+over ITRS_DETAIL, each over a ``SELECT DISTINCT`` that collapsed equal
+amounts of the same country, sector and location. Instead every pivot is
+computed with a groupby/unstack from one compact extract, the amounts in TZS
+and USD summed per reporting date, country, sector, purpose and location. The
+extract is kept per month in the period cache, so the TZS and USD variants,
+and later requests over the same months, cost no further scan.
+
+REGION_SECTOR_* aggregate the same extract by regional bloc. Countries are
+mapped to blocs through the REGION_MEMBERS registry with one join, so a
+country may belong to several blocs and a new bloc is one
+register_region() call rather than another scan.
+"""
+
+import os
+
+import pandas as pd
+
+from langodata.utils.database import DatabaseConnection
+from langodata.utils.disk_cache import disk_cache_enabled
+from langodata.utils.logger import Logger
+from langodata.utils.period_cache import read_periods
+from langodata.utils.query_catalog import ITRS_DETAIL_EXTRACT_QUERY, bind_params
+from langodata.utils.result_cache import result_cache_enabled
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+EXTRACT_COLUMNS = ["REPORTINGDATE", "COUNTRY", "SECTOR", "PURPOSE", "TRANSACTION_LOCATION",
+                   "AMOUNT_TZS", "AMOUNT_USD"]
+
+# Pivoted columns, "<purpose> -<transaction location>", in output order.
+LOCATION_PURPOSES = ["PAYMENT -URT", "RECEIPTS -URT", "PAYMENT -ZANZIBAR", "RECEIPTS -ZANZIBAR"]
+
+# Row keys and amount currency of every pivot data type.
+PIVOT_TYPES = {
+    "COUNTRIES_SECTORS_TZS": (["COUNTRY", "SECTOR"], "TZS"),
+    "COUNTRIES_SECTORS_USD": (["COUNTRY", "SECTOR"], "USD"),
+    "CONSOLIDATED_TZS": (["COUNTRY", "SECTOR"], "TZS"),
+    "CONSOLIDATED_USD": (["COUNTRY", "SECTOR"], "USD"),
+    "REGION_SECTOR_TZS": (["REGION_GROUPING", "SECTOR"], "TZS"),
+    "REGION_SECTOR_USD": (["REGION_GROUPING", "SECTOR"], "USD"),
+}
+
+# Countries of each regional bloc, as spelled in ITRS_DETAIL.COUNTRY.
+REGION_MEMBERS = {
+    "EAC": ["TANZANIA", "KENYA", "UGANDA", "RWANDA", "BURUNDI", "SOUTH SUDAN"],
+    "SADC": ["TANZANIA", "SOUTH AFRICA", "ZAMBIA", "ZIMBABWE"],
+}
+
+# Add an OTHER bloc with the countries of no registered bloc.
+REGION_OTHER = os.getenv("ITRS_REGION_OTHER", "false").strip().lower() in ("1", "true", "yes")
+
+
+def read_extract(data_source: str, table_name: str, start_period: str, end_period: str) -> dict:
+    """
+    Return the compact ITRS_DETAIL extract for [start_period, end_period].
+
+    Months already held by the period cache are not read again.
+
+    Returns:
+        dict: A reader result dictionary with the EXTRACT_COLUMNS.
+    """
+    def fetch_range(range_start, range_end):
+        result = {"info": "", "debug": "", "df": pd.DataFrame(columns=EXTRACT_COLUMNS)}
+        try:
+            sql = ITRS_DETAIL_EXTRACT_QUERY.format(table_name=table_name)
+            with DatabaseConnection(data_source) as conn:
+                result["df"] = conn.fetch_dataframe(sql, bind_params(sql, start_period=range_start,
+                                                                     end_period=range_end), EXTRACT_COLUMNS)
+            result["info"] = "Query executed successfully for ITRS_DETAIL."
+        except Exception as e:
+            result["debug"] += f"Error fetching ITRS_DETAIL extract: {str(e)}"
+        return result
+
+    key = ("ITRS", "ITRS_DETAIL", data_source, "*")
+    return read_periods(fetch_range, key, start_period, end_period,
+                        use_memory=result_cache_enabled(), use_disk=disk_cache_enabled())
+
+
+def pivot_extract(extract: pd.DataFrame, keys: list, currency: str) -> pd.DataFrame:
+    """
+    Sum one currency's amounts by `keys` with one column per LOCATION_PURPOSES value.
+
+    As with Oracle's PIVOT, a key without amounts for a location is NULL
+    there, and rows come out ordered by `keys` with NULL keys last.
+    """
+    location_purpose = (extract["PURPOSE"].astype("string") + " -"
+                        + extract["TRANSACTION_LOCATION"].astype("string")).rename("LOCATION_PURPOSE")
+    amounts = pd.to_numeric(extract[f"AMOUNT_{currency}"], errors="coerce")
+    groups = [extract[key] for key in keys] + [location_purpose]
+    table = amounts.groupby(groups, dropna=False).sum(min_count=1).unstack("LOCATION_PURPOSE")
+    table = table.reindex(columns=LOCATION_PURPOSES)
+    table.columns.name = None
+    return table.reset_index()
+
+
+def register_region(region: str, countries: list) -> None:
+    """Add a regional bloc, or replace its members, e.g. register_region("COMESA", [...])."""
+    if not region or region == "OTHER":
+        raise ValueError(f"Invalid region: {region}")
+    REGION_MEMBERS[region] = [str(country).upper() for country in countries]
+
+
+def region_membership() -> pd.DataFrame:
+    """Return the registry as one (COUNTRY, REGION_GROUPING) row per membership."""
+    return pd.DataFrame([(country, region) for region, countries in REGION_MEMBERS.items() for country in countries],
+                        columns=["COUNTRY", "REGION_GROUPING"])
+
+
+def pivot_regions(extract: pd.DataFrame, currency: str, include_other: bool = None) -> pd.DataFrame:
+    """
+    Sum one currency's amounts by regional bloc and sector.
+
+    A country counts towards every bloc it belongs to. With `include_other`
+    (REGION_OTHER by default), the rows of countries in no bloc are grouped
+    under OTHER. Locations without amounts are 0.
+    """
+    include_other = REGION_OTHER if include_other is None else include_other
+    membership = region_membership()
+    rows = extract.merge(membership, on="COUNTRY", how="inner")
+    if include_other:
+        others = extract[extract["COUNTRY"].notna() & ~extract["COUNTRY"].isin(membership["COUNTRY"])]
+        rows = pd.concat([rows, others.assign(REGION_GROUPING="OTHER")], ignore_index=True)
+    table = pivot_extract(rows, ["REGION_GROUPING", "SECTOR"], currency)
+    table[LOCATION_PURPOSES] = table[LOCATION_PURPOSES].fillna(0.0)
+    return table.rename(columns={column: column.replace(" -", "_") for column in LOCATION_PURPOSES})
+
+
+def read_pivot(data_source: str, table_name: str, data_type: str, start_period: str, end_period: str,
+               output_format: str = "pandas") -> dict:
+    """
+    Build a pivot data type (see PIVOT_TYPES) from the cached ITRS_DETAIL extract.
+
+    Returns:
+        dict: Contains Info, Debug, and the pivot DataFrame (or Arrow table).
+    """
+    logger = Logger()
+    result = {"info": "", "debug": "", "df": pd.DataFrame()}
+    keys, currency = PIVOT_TYPES[data_type]
+    extract = read_extract(data_source, table_name, start_period, end_period)
+    if extract["debug"]:
+        result["debug"] += extract["debug"]
+        logger.error(extract["debug"])
+        return result
+    if not len(extract["df"]):
+        logger.warning(f"No data found for the given parameters: {data_type}")
+        result["info"] = "No data found for the given parameters."
+        return result
+
+    try:
+        if keys[0] == "REGION_GROUPING":
+            table = pivot_regions(extract["df"], currency)
+        else:
+            table = pivot_extract(extract["df"], keys, currency)
+        result["df"] = pyarrow.Table.from_pandas(table, preserve_index=False) if output_format == "arrow" else table
+        result["info"] = f"Query executed successfully for {data_type}."
+        logger.info(f"Data successfully retrieved for {data_type}.")
+    except Exception as e:
+        error_message = f"Error building ITRS pivot: {str(e)}"
+        result["debug"] += error_message
+        logger.error(error_message)
+    return result
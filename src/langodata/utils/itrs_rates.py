@@ -0,0 +1,272 @@
+"""
+Local store of the ITRS exchange rates and currency conversion of extracts.
+
+The store keeps ITRS_FI_RATE (with the currency descriptions of
+ITRS_FI_CURR) per data source, ordered by reporting date with CURRENCY as
+the as-of key. A refresh only reads the rates from the last stored RA_DATE
+onwards; the store refreshes itself when it is older than RATES_STORE_TTL,
+but not within RATES_RETRY_BACKOFF of a failed refresh, and with the disk
+cache enabled it is kept as Parquet between processes.
+
+Conversion assumes the ITRS definitions of the rates:
+
+    amount_tzs = amount_orig * TZS_RATE
+    amount_usd = amount_orig * USD_RATE
+
+using the rate of the amount's currency on, or else last before, its
+reporting date. So an extract in any of ORIG, USD and TZS can be turned into
+the others without another round trip, e.g. USD to TZS is
+``amount_usd / USD_RATE * TZS_RATE``. Aggregates such as the pivots have no
+per-row currency and date; convert_totals() converts them between USD and
+TZS at the rates of one date.
+"""
+
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from langodata.utils import disk_cache
+from langodata.utils.database import DatabaseConnection
+from langodata.utils.itrs_data import get_schema, get_table_name
+from langodata.utils.logger import Logger
+from langodata.utils.partitioning import PERIOD_FORMAT, format_period
+from langodata.utils.query_catalog import RATES_SINCE_QUERY, bind_params
+
+
+RATE_COLUMNS = ["REPORTING_DATE", "CURRENCY", "DESCRIPTION", "TZS_RATE", "USD_RATE"]
+
+# Seconds before a lookup refreshes the store from Oracle.
+RATES_STORE_TTL = int(os.getenv("RATES_STORE_TTL", "900"))
+
+# Seconds after a failed refresh before Oracle is tried again; lookups meanwhile
+# use the stored rates, or fail fast when there are none.
+RATES_RETRY_BACKOFF = int(os.getenv("RATES_RETRY_BACKOFF", "60"))
+
+# First RA_DATE read into an empty store.
+RATES_HISTORY_START = os.getenv("RATES_HISTORY_START", "01-JAN-2000")
+
+# Amount column of each unit in the ITRS *_FINAL extracts.
+AMOUNT_COLUMNS = {
+    "ORIG": "AMOUNT_IN_ORIG_CURRENCY",
+    "USD": "AMOUNT_IN_USD_EQV",
+    "TZS": "AMOUNT_IN_TZS_EQV",
+}
+
+_stores = {}
+_failures = {}
+# Guards the dictionaries; each data source is refreshed under its own lock
+_store_lock = threading.Lock()
+_refresh_locks = {}
+
+
+def _store_path(data_source: str) -> str:
+    return os.path.join(disk_cache.DISK_CACHE_DIR, "ITRS", "RATES_STORE", f"{data_source}.parquet")
+
+
+def _refresh_lock(data_source: str) -> threading.Lock:
+    with _store_lock:
+        return _refresh_locks.setdefault(data_source, threading.Lock())
+
+
+def _is_stale(store) -> bool:
+    return store is None or time.monotonic() - store["refreshed"] > RATES_STORE_TTL
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    df = df[RATE_COLUMNS].copy()
+    df["REPORTING_DATE"] = pd.to_datetime(df["REPORTING_DATE"]).dt.normalize().astype("datetime64[ns]")
+    df["CURRENCY"] = df["CURRENCY"].astype(str).str.strip()
+    for column in ("TZS_RATE", "USD_RATE"):
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+    return df
+
+
+def refresh_rates(data_source: str = "BSIS") -> dict:
+    """
+    Read the rates from the last stored RA_DATE onwards into the store.
+
+    The last stored date is read again, so rates added for it later are not
+    missed; a rate read again replaces the stored one.
+
+    Returns:
+        dict: Contains Info, Debug, and the rates read.
+    """
+    with _refresh_lock(data_source):
+        return _refresh(data_source)
+
+
+def _refresh(data_source: str) -> dict:
+    """refresh_rates() for a caller holding the data source's refresh lock."""
+    logger = Logger()
+    result = {"info": "", "debug": "", "df": pd.DataFrame(columns=RATE_COLUMNS)}
+    store = _stores.get(data_source)
+    if store is None and disk_cache.disk_cache_enabled():
+        df = disk_cache.load_month(_store_path(data_source))
+        store = {"df": _normalize(df), "refreshed": 0.0} if df is not None else None
+    rates = store["df"] if store is not None else pd.DataFrame(columns=RATE_COLUMNS)
+    since = format_period(rates["REPORTING_DATE"].max()) if len(rates) else RATES_HISTORY_START
+    try:
+        sql = RATES_SINCE_QUERY.format(table_name=get_table_name("RATES", get_schema(data_source, "RATES")))
+        with DatabaseConnection(data_source) as conn:
+            fetched = _normalize(conn.fetch_dataframe(sql, bind_params(sql, since=since), RATE_COLUMNS))
+    except Exception as e:
+        error_message = f"Error refreshing ITRS rates: {str(e)}"
+        result["debug"] += error_message
+        logger.error(error_message)
+        with _store_lock:
+            _failures[data_source] = (time.monotonic(), error_message)
+            if store is not None:
+                # Rates kept on disk still answer lookups until Oracle is back
+                _stores.setdefault(data_source, store)
+        return result
+
+    rates = pd.concat([rates, fetched], ignore_index=True) if len(rates) else fetched
+    rates = (rates.drop_duplicates(["CURRENCY", "REPORTING_DATE"], keep="last")
+             .sort_values(["REPORTING_DATE", "CURRENCY"], kind="stable").reset_index(drop=True))
+    with _store_lock:
+        _stores[data_source] = {"df": rates, "refreshed": time.monotonic()}
+        _failures.pop(data_source, None)
+    if disk_cache.disk_cache_enabled():
+        disk_cache.store_month(_store_path(data_source), rates)
+    result["df"] = fetched
+    result["info"] = f"Read {len(fetched)} rates since {since}."
+    logger.info(result["info"])
+    return result
+
+
+def get_rates(data_source: str = "BSIS") -> pd.DataFrame:
+    """
+    Return the stored rates, refreshing them first when older than RATES_STORE_TTL.
+
+    Within RATES_RETRY_BACKOFF of a failed refresh the store is not refreshed
+    again, so lookups while Oracle is down do not each wait on a connection.
+    Lookups that find the store stale together wait for one refresh.
+
+    Raises:
+        ValueError: If the rates cannot be read and none are stored.
+    """
+    store = _stores.get(data_source)
+    if _is_stale(store):
+        with _refresh_lock(data_source):
+            # Another lookup may have refreshed the store, or failed to, while this one waited
+            store = _stores.get(data_source)
+            failed_at, error_message = _failures.get(data_source, (None, ""))
+            if _is_stale(store) and (failed_at is None or time.monotonic() - failed_at > RATES_RETRY_BACKOFF):
+                error_message = _refresh(data_source)["debug"]
+                store = _stores.get(data_source)
+        if store is None:
+            raise ValueError(error_message)
+    return store["df"]
+
+
+def rates_as_of(currencies, dates, data_source: str = "BSIS") -> pd.DataFrame:
+    """
+    Look up the rates of many (currency, date) pairs at once.
+
+    Args:
+        currencies (array-like): Currency codes.
+        dates (array-like): Reporting dates, same length as `currencies`.
+        data_source (str): Source of the rates ("BSIS" or "EDI").
+
+    Returns:
+        DataFrame: TZS_RATE and USD_RATE in the order of the pairs; NaN when a
+        currency has no rate on or before the date.
+    """
+    keys = pd.DataFrame({"CURRENCY": pd.Series(currencies, dtype="object").astype(str).str.strip().to_numpy(),
+                         "DATE": pd.to_datetime(pd.Series(dates)).dt.normalize().astype("datetime64[ns]").to_numpy(),
+                         "ROW": np.arange(len(currencies))})
+    keys = keys[keys["DATE"].notna()].sort_values("DATE", kind="stable")
+    matched = pd.merge_asof(keys, get_rates(data_source)[["REPORTING_DATE", "CURRENCY", "TZS_RATE", "USD_RATE"]],
+                            left_on="DATE", right_on="REPORTING_DATE", by="CURRENCY", direction="backward")
+    rates = matched.set_index("ROW")[["TZS_RATE", "USD_RATE"]]
+    return rates.reindex(np.arange(len(currencies))).reset_index(drop=True)
+
+
+def convert_currency(df: pd.DataFrame, to_unit: str, from_unit: str = "ORIG", data_source: str = "BSIS",
+                     amount_column: str = None, output_column: str = None, currency_column: str = "CURRENCY",
+                     date_column: str = "REPORTINGDATE") -> pd.DataFrame:
+    """
+    Convert an ITRS extract's amounts between original currency, USD and TZS.
+
+    Args:
+        df (DataFrame): Extract with a currency and a reporting date column.
+        to_unit (str): "ORIG", "USD" or "TZS".
+        from_unit (str): Unit of `amount_column`.
+        data_source (str): Source of the rates.
+        amount_column (str): Amounts to convert; AMOUNT_COLUMNS[from_unit] by default.
+        output_column (str): Column for the result; AMOUNT_COLUMNS[to_unit] by default.
+        currency_column (str): Original currency of each row.
+        date_column (str): Reporting date of each row.
+
+    Returns:
+        DataFrame: A copy of `df` with `output_column` set.
+
+    Raises:
+        ValueError: If a unit is not ORIG, USD or TZS.
+    """
+    for unit in (to_unit, from_unit):
+        if unit not in AMOUNT_COLUMNS:
+            raise ValueError(f"Invalid currency unit: {unit}")
+    amount_column = amount_column or AMOUNT_COLUMNS[from_unit]
+    output_column = output_column or AMOUNT_COLUMNS[to_unit]
+    rates = rates_as_of(df[currency_column].to_numpy(), df[date_column].to_numpy(), data_source)
+
+    amounts = pd.to_numeric(df[amount_column], errors="coerce").to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if from_unit != "ORIG":
+            amounts = amounts / rates[f"{from_unit}_RATE"].to_numpy()
+        if to_unit != "ORIG":
+            amounts = amounts * rates[f"{to_unit}_RATE"].to_numpy()
+    converted = df.copy()
+    converted[output_column] = np.where(np.isfinite(amounts), amounts, np.nan)
+    return converted
+
+
+def convert_totals(df: pd.DataFrame, columns: list, to_unit: str, from_unit: str, as_of,
+                   data_source: str = "BSIS") -> pd.DataFrame:
+    """
+    Convert aggregated USD or TZS amounts, e.g. the *_TZS and *_USD pivots.
+
+    Totals no longer carry the currency and reporting date of their rows, so
+    they cannot be converted to or from ORIG, and are converted at the rates
+    of USD in force on `as_of`: ``amount_tzs = amount_usd / USD_RATE * TZS_RATE``.
+    Over a range in which the rates moved this differs from summing converted
+    rows; the pivot of the other unit has the exact totals.
+
+    Args:
+        df (DataFrame): Table of totals.
+        columns (list): Amount columns to convert.
+        to_unit (str): "USD" or "TZS".
+        from_unit (str): Unit of `columns`.
+        as_of: Date of the rates, a DD-MON-YYYY string or a date.
+        data_source (str): Source of the rates.
+
+    Returns:
+        DataFrame: A copy of `df` with `columns` converted.
+
+    Raises:
+        ValueError: If a unit is not USD or TZS, or USD has no rate on or before `as_of`.
+    """
+    for unit in (to_unit, from_unit):
+        if unit not in ("USD", "TZS"):
+            raise ValueError(f"Invalid currency unit for totals: {unit}")
+    as_of = pd.to_datetime(as_of, format=PERIOD_FORMAT) if isinstance(as_of, str) else as_of
+    rates = rates_as_of(["USD"], [as_of], data_source).iloc[0]
+    if rates.isna().any():
+        raise ValueError(f"No USD rate on or before {as_of}")
+    converted = df.copy()
+    converted[columns] = converted[columns].apply(pd.to_numeric, errors="coerce") \
+        * (rates[f"{to_unit}_RATE"] / rates[f"{from_unit}_RATE"])
+    return converted
+
+
+def clear_rates_store(data_source: str = None) -> None:
+    """Forget the stored rates of one data source, or of all of them."""
+    with _store_lock:
+        for source in [source for source in _stores if data_source is None or source == data_source]:
+            del _stores[source]
+        for source in [source for source in _failures if data_source is None or source == data_source]:
+            del _failures[source]
@@ -1,6 +1,10 @@
 import os
 import sys
 import base64
+import hashlib
+import threading
+import time
+from functools import lru_cache
 from datetime import datetime, timedelta
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -9,22 +13,36 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.padding import PKCS7
 from cryptography.fernet import Fernet  # Import Fernet for handling encryption keys
 from dotenv import load_dotenv
-import unittest
 import json
 
-# Load environment variables
-load_dotenv()
-
 # Constants
-ENCRYPTION_KEY = os.getenv("ENCRYPTION_KEY")
-KEYWORD = os.getenv("KEYWORD")
-
-if not ENCRYPTION_KEY:
-    raise ValueError("ENCRYPTION_KEY is not set in the environment variables")
-
 SALT = b'some_salt'  # Replace with a securely generated unique salt for production
 BACKEND = default_backend()
 
+# Seconds a validated license is trusted before it is re-derived (never past its expiry date).
+LICENSE_CACHE_TTL = int(os.getenv("LICENSE_CACHE_TTL", "3600"))
+
+_license_session = {}
+_license_lock = threading.Lock()
+_environment_loaded = False
+
+
+def load_environment():
+    """Load the .env file once per process; called on first use instead of at import."""
+    global _environment_loaded
+    if not _environment_loaded:
+        load_dotenv()
+        _environment_loaded = True
+
+
+def get_encryption_key() -> str:
+    """Return ENCRYPTION_KEY from the environment, raising if it is not set."""
+    load_environment()
+    encryption_key = os.getenv("ENCRYPTION_KEY")
+    if not encryption_key:
+        raise ValueError("ENCRYPTION_KEY is not set in the environment variables")
+    return encryption_key
+
 
 # Generate a Fernet Key (if you don't already have one)
 def generate_fernet_key():
@@ -36,6 +54,7 @@ def generate_fernet_key():
 
 
 # Derive Key Function
+@lru_cache(maxsize=8)
 def derive_key(keyword: str) -> bytes:
     """Derive a 32-byte symmetric key from a keyword."""
     kdf = PBKDF2HMAC(
@@ -96,67 +115,63 @@ def decrypt_value(keyword: str, encrypted_value: str) -> dict:
     return {"credentials": credentials, "date": date, "expire_date": expire_date}
 
 
-# License Validation Function
-def validate_license():
-    #encrypted_license = os.getenv("ENCRYPTION_KEY")
-    if not ENCRYPTION_KEY:
-        raise ValueError("ENCRYPTION_KEY not found in environment variables")
-    #print(f"License Key: {ENCRYPTION_KEY}")
-    
-    date = os.getenv("ISSUE_DATE")
-    days_to_expire = os.getenv("VALIDITY_DAYS")
-    encrypted_license = generate_license(date, int(days_to_expire))
-    #print(f"Encrypted License: {encrypted_license}")
-    license_data = decrypt_value(ENCRYPTION_KEY, encrypted_license)
-    #print(f"Decrypted License: {decrypted_license}")
-    
-    #license_data = decrypt_value("spectacular", ENCRYPTION_KEY)
-    #license_data = decrypt_value(ENCRYPTION_KEY, ENCRYPTION_KEY)
-    #print(f"Decrypted value: {license_data}")
-    
-    #decrypted_dictionary_object = json.loads(str(decrypted_data))
-    
-    #print(f"License Details: {license_data}")
-    expire_date_str = license_data["expire_date"]
-    expire_date = datetime.strptime(expire_date_str, "%d-%b-%Y")
-    today = datetime.now()
+def _license_fingerprint() -> str:
+    """Digest of every environment value the license verdict depends on."""
+    values = [os.getenv("ENCRYPTION_KEY")] + [os.getenv(name) for name in
+              ("ISSUE_DATE", "VALIDITY_DAYS", "BSIS_USER", "BSIS_PASS", "EDI_USER", "EDI_PASS")]
+    return hashlib.sha256("|".join(str(value) for value in values).encode()).hexdigest()
 
-    if today > expire_date:
-        raise Exception(f"License expired on {expire_date.strftime('%d-%b-%Y')}.")
 
-    days_left = (expire_date - today).days
-    if days_left < 7:
-        print(f"Warning: License will expire in {days_left} days. Please renew it soon.")
+def get_license_expiry() -> datetime:
+    """
+    Return the license expiry date, validating the license at most once per session.
 
-def check_license_status() -> bool:
-    licenseStatus = False
-    #encrypted_license = os.getenv("ENCRYPTION_KEY")
-    if not ENCRYPTION_KEY:
-        raise ValueError("ENCRYPTION_KEY not found in environment variables")
-    #print(f"License Key: {ENCRYPTION_KEY}")
-    
-    date = os.getenv("ISSUE_DATE")
-    days_to_expire = os.getenv("VALIDITY_DAYS")
-    encrypted_license = generate_license(date, int(days_to_expire))
-    #print(f"Encrypted License: {encrypted_license}")
-    license_data = decrypt_value(ENCRYPTION_KEY, encrypted_license)
+    The first call derives the key, generates and decrypts the license; later
+    calls reuse the cached expiry date until LICENSE_CACHE_TTL seconds have
+    passed, the expiry date is reached, or any license environment value changes.
+    """
+    encryption_key = get_encryption_key()
+    fingerprint = _license_fingerprint()
+    with _license_lock:
+        session = _license_session
+        now = time.monotonic()
+        if (session.get("fingerprint") == fingerprint
+                and now < session["valid_until"]
+                and datetime.now() < session["expire_date"]):
+            return session["expire_date"]
+
+        date = os.getenv("ISSUE_DATE")
+        days_to_expire = os.getenv("VALIDITY_DAYS")
+        encrypted_license = generate_license(date, int(days_to_expire))
+        license_data = decrypt_value(encryption_key, encrypted_license)
+        expire_date = datetime.strptime(license_data["expire_date"], "%d-%b-%Y")
+
+        session.update(fingerprint=fingerprint, expire_date=expire_date, valid_until=now + LICENSE_CACHE_TTL)
+        days_left = (expire_date - datetime.now()).days
+        if 0 <= days_left < 7:
+            print(f"Warning: License will expire in {days_left} days. Please renew it soon.")
+        return expire_date
 
-    #print(f"Decrypted value: {license_data}")
-    
-    #decrypted_dictionary_object = json.loads(str(decrypted_data))
-    
-    #print(f"License Details: {license_data}")
-    expire_date_str = license_data["expire_date"]
-    expire_date = datetime.strptime(expire_date_str, "%d-%b-%Y")
-    today = datetime.now()
 
-    if today < expire_date:
-        licenseStatus = True
-    return licenseStatus
+def clear_license_session():
+    """Forget the cached license verdict so the next check validates from scratch."""
+    with _license_lock:
+        _license_session.clear()
+
+
+# License Validation Function
+def validate_license():
+    expire_date = get_license_expiry()
+    if datetime.now() > expire_date:
+        raise Exception(f"License expired on {expire_date.strftime('%d-%b-%Y')}.")
+
+def check_license_status() -> bool:
+    return datetime.now() < get_license_expiry()
 
 # License Generation Function
 def generate_license(date: str, days_to_expire: int) -> str:
     """Generate a license with credentials and expiration date."""
+    encryption_key = get_encryption_key()
     BSIS_USER = os.getenv("BSIS_USER")
     BSIS_PASS = os.getenv("BSIS_PASS")
     EDI_USER = os.getenv("EDI_USER")
@@ -166,29 +181,31 @@ def generate_license(date: str, days_to_expire: int) -> str:
         raise ValueError("User credentials are not set in environment variables")
 
     credentials = f"{BSIS_USER}:{BSIS_PASS}:{EDI_USER}:{EDI_PASS}"
-    return encrypt_value(ENCRYPTION_KEY, credentials, date, days_to_expire)
+    return encrypt_value(encryption_key, credentials, date, days_to_expire)
 
 
 # Add current working directory to sys.path
 current_dir = os.getcwd()
 sys.path.insert(0, os.path.abspath(os.path.join(current_dir, '../MSPUsersDev')))
 
-# Testing Framework
-class TestUtils(unittest.TestCase):
-    def test_read_data(self):
-        # Example test for read_data
-        print("read_data() test passed")
+if __name__ == "__main__":
+    import unittest
 
-    def test_database_connection(self):
-        # Example test for DatabaseConnection
-        print("DatabaseConnection test passed")
+    # Testing Framework
+    class TestUtils(unittest.TestCase):
+        def test_read_data(self):
+            # Example test for read_data
+            print("read_data() test passed")
 
-    def test_logger(self):
-        # Example test for Logger
-        print("Logger test passed")
+        def test_database_connection(self):
+            # Example test for DatabaseConnection
+            print("DatabaseConnection test passed")
 
+        def test_logger(self):
+            # Example test for Logger
+            print("Logger test passed")
 
-if __name__ == "__main__":
+    load_environment()
     date = os.getenv("ISSUE_DATE")
     days_to_expire = os.getenv("VALIDITY_DAYS")
 
@@ -196,7 +213,7 @@ if __name__ == "__main__":
     encrypted_license = generate_license(date, int(days_to_expire))
     print(f"Encrypted License: {encrypted_license}")
 
-    decrypted_license = decrypt_value(ENCRYPTION_KEY, encrypted_license)
+    decrypted_license = decrypt_value(get_encryption_key(), encrypted_license)
     print(f"Decrypted License: {decrypted_license}")
     
     
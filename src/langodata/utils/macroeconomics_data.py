@@ -1,10 +1,13 @@
 import os
 import pandas as pd
-from langodata.utils.database import DatabaseConnection
+from langodata.utils.database import DatabaseConnection, AsyncDatabaseConnection, stream_query
 from langodata.utils.logger import Logger
+from langodata.utils.query_catalog import MACROECONOMICS_QUERIES, bind_params, get_query
 
 
-def read_macroeconomics_data(data_group: str, data_source: str, data_type: str, data_frequency: str, start_period: str, end_period: str) -> dict:
+def read_macroeconomics_data(data_group: str, data_source: str, data_type: str, data_frequency: str, start_period: str, end_period: str,
+                             output_format: str = "pandas", chunksize: int = None, stream: bool = False,
+                             arraysize: int = None) -> dict:
     """
     Reads Time Series BOT data from the specified data source and returns a result dictionary.
 
@@ -15,6 +18,10 @@ def read_macroeconomics_data(data_group: str, data_source: str, data_type: str,
         data_frequency (str): Frequency ("DAILY","MONTHLY","QUARTERLY","ANNUAL-CALENDAR","ANNUAL-FINANCIAL").
         start_period (str): Start date of the period (YYYY-MM-DD).
         end_period (str): End date of the period (YYYY-MM-DD).
+        output_format (str): "pandas" for a DataFrame or "arrow" for a pyarrow Table.
+        chunksize (int): Rows per batch; when set, "df" is a generator of batches.
+        stream (bool): Stream with the default chunk size when chunksize is not given.
+        arraysize (int): Rows fetched per network round trip while streaming.
         Example: read_macroeconomics_data('MACROECONOMICS','DWH','CPI','MONTHLY','31-JAN-2060','31-JAN-2026')
 
     Returns:
@@ -26,143 +33,33 @@ def read_macroeconomics_data(data_group: str, data_source: str, data_type: str,
     
     
     # Validate inputs
-    valid_data_sources = ["DWH"]
-    valid_data_group = ["MACROECONOMICS"]
-    valid_data_types =  ["CPI", "BOP", "NATIONAL-ACCOUNTS", "FISCAL", "MONETARY", "INTEREST-RATES", "COMMODITIES-PRICES","REAL-SECTOR"]
-    #valid_data_format = ["WIDE", "LONG"]
-    valid_data_frequencies = ["DAILY","MONTHLY","QUARTERLY","ANNUAL-CALENDAR","ANNUAL-FINANCIAL"]
-
-    if data_source not in valid_data_sources:
-        result["debug"] += f"Invalid data source: {data_source}. "
-        return result
-    if data_group not in valid_data_group:
-        result["debug"] += f"Invalid data group: {data_group}. "
-        return result
-    if data_type not in valid_data_types:
-        result["debug"] += f"Invalid data type: {data_type}. "
-        return result
-    if data_frequency not in valid_data_frequencies:    
-        result["debug"] += f"Invalid data frequency: {data_frequency}. "
+    request_error = validate_request(data_group, data_source, data_type, data_frequency)
+    if request_error:
+        result["debug"] += request_error
         return result
 
         
     try:
-    
-        # Determine schema
-        with DatabaseConnection(data_source) as conn:
-    
-            if data_source == "DWH":
-                schema = "DWH."        
-            
-            table_mapping = {
-                "CPI": "FACT_CPI",
-                "BOP": "FACT_BOP"
-                }
-            data_table =    table_mapping.get(data_type)
-            #Define SQL query
-            table_name = f"{schema}{data_table}"            
-            #condition = "1=1" #if bank_code == "*" else f"INSTITUTIONCODE = '{bank_code}'" 
-            
-            #print("tablename: " + table_name)
-            result["debug"] += f"Table name: {table_name}. "
-
-            # Determine the frequency code for the WHERE clause
-            freq_code = {
-                "DAILY": "D", "MONTHLY": "M", "QUARTERLY": "Q", 
-                "ANNUAL-CALENDAR": "A", "ANNUAL-FINANCIAL": "F"
-            }.get(data_frequency)
-
-            sql_mapping = {
-                "CPI": f"""
-                    SELECT 
-                        T.TIME_PERIOD,
-                        T.YEAR,
-                        T.MONTH,
-                        L.LOCATION_NAME,
-                        L.LOCATION_ISO,
-                        I.INDICATOR_NAME,
-                        I.DESCRIPTION AS INDICATOR_DESCRIPTION,
-                        F.VALUE,
-                        U.UNIT,
-                        FR.FREQUENCY,
-                        S.SOURCE
-                FROM {table_name} F
-                JOIN DWH.DIM_TIME T       ON F.TIME_ID = T.TIME_ID
-                JOIN DWH.DIM_LOCATION L   ON F.LOCATION_ID = L.LOCATION_ID
-                JOIN DWH.DIM_INDICATOR I  ON F.INDICATOR_ID = I.INDICATOR_ID
-                JOIN DWH.DIM_UNITS U      ON F.UNIT_ID = U.UNIT_ID
-                JOIN DWH.DIM_FREQ FR      ON F.FREQ_ID = FR.FREQ_ID
-                JOIN DWH.DIM_SOURCES S    ON F.SOURCE_ID = S.SOURCE_ID
-                WHERE 
-                    T.TIME_PERIOD BETWEEN '{start_period}' AND '{end_period}'
-                    AND FR.FREQUENCY = '{freq_code}' -- Takes 'M' from 'MONTHLY', 'Q' from 'QUARTERLY'
-                """,
-
-                "BOP": f"""
-                    SELECT 
-                        T.TIME_PERIOD,
-                        T.YEAR,
-                        T.MONTH,
-                        T.QUARTER,
-                        L.LOCATION_NAME,
-                        I.INDICATOR_NAME,
-                        I.DESCRIPTION AS INDICATOR_DESCRIPTION,
-                        F.VALUE,
-                        U.UNIT,
-                        FR.FREQUENCY,
-                        S.SOURCE
-                FROM {table_name} F
-                JOIN DWH.DIM_TIME T        ON F.TIME_ID = T.TIME_ID
-                JOIN DWH.DIM_LOCATION L    ON F.LOCATION_ID = L.LOCATION_ID
-                JOIN DWH.DIM_INDICATOR I   ON F.INDICATOR_ID = I.INDICATOR_ID
-                JOIN DWH.DIM_UNITS U       ON F.UNIT_ID = U.UNIT_ID
-                JOIN DWH.DIM_FREQ FR       ON F.FREQ_ID = FR.FREQ_ID
-                JOIN DWH.DIM_SOURCES S     ON F.SOURCE_ID = S.SOURCE_ID
-                    WHERE 
-                        T.TIME_PERIOD BETWEEN '{start_period}' AND '{end_period}'
-                        AND FR.FREQUENCY = '{freq_code}' -- Balance of Payments is often reported Quarterly ('Q')
-                        ORDER BY T.TIME_PERIOD DESC"""
-                }
-          
-            sql = sql_mapping.get(data_type)
-           
-            
-            
-            #result['sql_query']= sql
-            
-            
-            #print(f"sql is : {sql}")
-            result["debug"] += f"SQL query: {sql}"
+        sql, params, columns = build_query(data_source, data_type, data_frequency, start_period, end_period)
+        result["debug"] += f"Table name: {get_table_name(data_source, data_type)}. "
+        result["debug"] += f"SQL query: {sql}"
 
+        if chunksize or stream:
+            #Hand back a generator of batches; the session is held until it is exhausted
+            result["df"] = stream_query(data_source, sql, params, columns, chunksize, arraysize, output_format)
+            result["info"] = "Streaming Macroeconomics data in batches."
+            return result
 
-        
-            #Fetch data
-            data = conn.execute_query(sql)
-     
-
-            #Define columns based on data_type
-            columns_mapping = {
-                "CPI": ["TIME_PERIOD", "YEAR", "MONTH", "LOCATION_NAME", "LOCATION_ISO", 
-                       "INDICATOR_NAME", "INDICATOR_DESCRIPTION", "VALUE", "UNIT", 
-                       "FREQUENCY", "SOURCE"], 
-                "BOP": ["TIME_PERIOD", "YEAR", "MONTH", "QUARTER", "LOCATION_NAME", "INDICATOR_NAME",
-                        "INDICATOR_DESCRIPTION", "VALUE", "UNIT", 
-                        "FREQUENCY", "SOURCE"]                      
-            }
-            columns = columns_mapping.get(data_type)
-            if not columns:
-                raise ValueError(f"Invalid data_type '{data_type}'. No column mapping found.")
-                
-   
-                
-            #Construct DataFrame
-            #result["columns_names"] = columns
-            if data:            
-                result["df"] = pd.DataFrame(data, columns=columns)
+        with DatabaseConnection(data_source) as conn:
+            #Fetch data straight into typed columns
+            df = conn.fetch_dataframe(sql, params, columns, output_format)
+            if len(df):
+                result["df"] = df
+                result["info"] = f"Query executed successfully for {data_type}."
             else:
                 logger.warning("No data found for the given parameters")
+                result["info"] = "No data found for the given parameters."
             logger.info(f"Macroeconomics data successfully retrieved.")
-            #print(result["df"].head())
     except Exception as e:
         error_message = f"Error fetching Macroeconomics data: {str(e)}"
         result["debug"] += str(error_message) if error_message else ""
@@ -173,4 +70,104 @@ def read_macroeconomics_data(data_group: str, data_source: str, data_type: str,
     return result
 
 
+async def read_macroeconomics_data_async(data_group: str, data_source: str, data_type: str, data_frequency: str,
+                                         start_period: str, end_period: str, output_format: str = "pandas") -> dict:
+    """
+    Coroutine form of read_macroeconomics_data() for use from an event loop.
 
+    Takes the same arguments (without streaming) and returns the same result
+    dictionary; the extract waits for a free slot on the source's semaphore.
+    """
+    logger = Logger()
+    result = {"info": "", "debug": "", "df": pd.DataFrame()}
+
+    request_error = validate_request(data_group, data_source, data_type, data_frequency)
+    if request_error:
+        result["debug"] += request_error
+        return result
+
+    try:
+        sql, params, columns = build_query(data_source, data_type, data_frequency, start_period, end_period)
+        async with AsyncDatabaseConnection(data_source) as conn:
+            df = await conn.fetch_dataframe(sql, params, columns, output_format)
+        if len(df):
+            result["df"] = df
+            result["info"] = f"Query executed successfully for {data_type}."
+        else:
+            logger.warning("No data found for the given parameters")
+            result["info"] = "No data found for the given parameters."
+        logger.info(f"Macroeconomics data successfully retrieved.")
+    except Exception as e:
+        error_message = f"Error fetching Macroeconomics data: {str(e)}"
+        result["debug"] += error_message
+        logger.error(error_message)
+
+    return result
+
+
+def validate_request(data_group: str, data_source: str, data_type: str, data_frequency: str) -> str:
+    """Return a debug message for an unsupported group, source, type or frequency, or an empty string."""
+    valid_data_sources = ["DWH"]
+    valid_data_group = ["MACROECONOMICS"]
+    valid_data_types =  ["CPI", "BOP", "NATIONAL-ACCOUNTS", "FISCAL", "MONETARY", "INTEREST-RATES", "COMMODITIES-PRICES","REAL-SECTOR"]
+    #valid_data_format = ["WIDE", "LONG"]
+    valid_data_frequencies = ["DAILY","MONTHLY","QUARTERLY","ANNUAL-CALENDAR","ANNUAL-FINANCIAL"]
+
+    if data_source not in valid_data_sources:
+        return f"Invalid data source: {data_source}. "
+    if data_group not in valid_data_group:
+        return f"Invalid data group: {data_group}. "
+    if data_type not in valid_data_types:
+        return f"Invalid data type: {data_type}. "
+    if data_frequency not in valid_data_frequencies:    
+        return f"Invalid data frequency: {data_frequency}. "
+    return ""
+
+
+def get_table_name(data_source: str, data_type: str) -> str:
+    """Return the fact table for a data type."""
+    # Determine schema
+    schema = "DWH." if data_source == "DWH" else ""
+    table_mapping = {
+        "CPI": "FACT_CPI",
+        "BOP": "FACT_BOP"
+        }
+    return f"{schema}{table_mapping.get(data_type)}"
+
+
+def build_query(data_source: str, data_type: str, data_frequency: str, start_period: str, end_period: str) -> tuple:
+    """
+    Build the statement, bind values and column names for a macroeconomics extract.
+
+    Returns:
+        tuple: (sql, params, columns).
+
+    Raises:
+        ValueError: If the data type has no query or column mapping.
+    """
+    table_name = get_table_name(data_source, data_type)
+
+    # Determine the frequency code for the WHERE clause
+    freq_code = {
+        "DAILY": "D", "MONTHLY": "M", "QUARTERLY": "Q",
+        "ANNUAL-CALENDAR": "A", "ANNUAL-FINANCIAL": "F"
+    }.get(data_frequency)
+
+    sql = get_query(MACROECONOMICS_QUERIES, data_type, table_name=table_name)
+    if not sql:
+        raise ValueError(f"Invalid data_type '{data_type}'. No query found.")
+    params = bind_params(sql, start_period=start_period, end_period=end_period, frequency=freq_code)
+
+    #Define columns based on data_type
+    columns_mapping = {
+        "CPI": ["TIME_PERIOD", "YEAR", "MONTH", "LOCATION_NAME", "LOCATION_ISO",
+               "INDICATOR_NAME", "INDICATOR_DESCRIPTION", "VALUE", "UNIT",
+               "FREQUENCY", "SOURCE"],
+        "BOP": ["TIME_PERIOD", "YEAR", "MONTH", "QUARTER", "LOCATION_NAME", "INDICATOR_NAME",
+                "INDICATOR_DESCRIPTION", "VALUE", "UNIT",
+                "FREQUENCY", "SOURCE"]
+    }
+    columns = columns_mapping.get(data_type)
+    if not columns:
+        raise ValueError(f"Invalid data_type '{data_type}'. No column mapping found.")
+    return sql, params, columns
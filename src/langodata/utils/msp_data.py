@@ -1,10 +1,13 @@
 import os
 import pandas as pd
-from langodata.utils.database import DatabaseConnection
+from langodata.utils.database import DatabaseConnection, AsyncDatabaseConnection, stream_query
 from langodata.utils.logger import Logger
+from langodata.utils.query_catalog import MSP_QUERIES, MSP_DEFAULT_QUERY, institution_condition, institution_binds, bind_params, get_query
 
 
-def read_msp_data(data_group: str, data_source: str, data_type: str, bank_code: str, start_period: str, end_period: str) -> dict:
+def read_msp_data(data_group: str, data_source: str, data_type: str, bank_code, start_period: str, end_period: str,
+                  output_format: str = "pandas", chunksize: int = None, stream: bool = False,
+                  arraysize: int = None) -> dict:
     """
     Reads MSP data from the specified data source and returns a result dictionary.
 
@@ -12,9 +15,13 @@ def read_msp_data(data_group: str, data_source: str, data_type: str, bank_code:
         data_group (str): The data group (e.g., "MSP2").
         data_source (str): The data source (e.g., "BSIS" or "EDI").
         data_type (str): The type of data to fetch.
-        bank_code (str): Bank code to filter data. Use '*' for all banks.
-        start_period (str): Start date of the period (YYYY-MM-DD).
-        end_period (str): End date of the period (YYYY-MM-DD).
+        bank_code (str or list): Bank code to filter data, a list of codes, or '*' for all banks.
+        start_period (str): Start date of the period (DD-MON-YYYY).
+        end_period (str): End date of the period (DD-MON-YYYY).
+        output_format (str): "pandas" for a DataFrame or "arrow" for a pyarrow Table.
+        chunksize (int): Rows per batch; when set, "df" is a generator of batches.
+        stream (bool): Stream with the default chunk size when chunksize is not given.
+        arraysize (int): Rows fetched per network round trip while streaming.
 
     Returns:
         dict: Contains Info, Debug, Contains SQL query, and column names.
@@ -25,329 +32,30 @@ def read_msp_data(data_group: str, data_source: str, data_type: str, bank_code:
     
     
     # Validate inputs
-    valid_data_sources = ["BSIS", "EDI"]
-    valid_data_types = [f"{i:02}" for i in range(1, 11)] + ["*", "CONS01", "CONS02", "CONS03", "CONS04","CONS05", "CONS06","CONS07I","CONS07II","CONS07III", "CONS07IV", "CONS08", "CONS09", "CONS10"]
-
-    if data_source not in valid_data_sources:
-        result["debug"] += f"Invalid data source: {data_source}. "
-        return result
-    if data_type not in valid_data_types:
-        result["debug"] += f"Invalid data type: {data_type}. "
+    request_error = validate_request(data_source, data_type)
+    if request_error:
+        result["debug"] += request_error
         return result
 
     
     try:
-    
-        # Determine schema
+        sql, params, columns = build_query(data_source, data_type, bank_code, start_period, end_period)
+
+        if chunksize or stream:
+            #Hand back a generator of batches; the session is held until it is exhausted
+            result["df"] = stream_query(data_source, sql, params, columns, chunksize, arraysize, output_format)
+            result["info"] = "Streaming MSP data in batches."
+            return result
+
         with DatabaseConnection(data_source) as conn:
-    
-            if data_source == "BSIS":
-                schema = "" if "CONS" in data_type else "BSIS_DEV."
-            elif data_source == "EDI":
-                schema = "EDI."
-            else:
-                schema = ""
-            
-            
-            table_mapping = {
-                "01":"01",
-                "CONS01": "01",
-                "02":"02",
-                "CONS02": "02",
-                "03":"03",
-                "CONS03": "03",
-                "04":"04",
-                "CONS04": "04",                             
-                "05":"05",
-                "CONS05": "05",                 
-                "06":"06", 
-                "CONS06": "06", 
-                "07":"07",
-                "CONS07": "07", 
-                "CONS07I": "07", 
-                "CONS07II": "07",
-                "CONS07III": "07",
-                "CONS07IV": "07",
-                "08":"08",
-                "CONS08": "08", 
-                "09":"09",
-                "CONS09": "09", 
-                "10":"10",
-                "CONS10": "10"                 
-                }
-            data_table =    table_mapping.get(data_type)
-            #Define SQL query
-            table_name = f"{schema}MSP2_{data_table}"            
-            condition = "1=1" if bank_code == "*" else f"INSTITUTIONCODE = '{bank_code}'" 
-            
-            #Define SQL query
-            sql_mapping = {
-                "CONS01": f"""SELECT ALL A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.AMOUNT)  AMOUNT  
-                FROM {table_name} A where
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}' 
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by A.DESCRIPTIONNO asc""",
-
-                "01": f"""SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.AMOUNT FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """,
-
-                "CONS02": f"""SELECT ALL A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.AMOUNT)  AMOUNT, sum(A.YR_TO_DATE_AMOUNT) YR_TO_DATE_AMOUNT
-                FROM {table_name} A where
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}' 
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by A.DESCRIPTIONNO asc""", 
-
-                "02": f"""SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.AMOUNT, A.YR_TO_DATE_AMOUNT FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """,
-
-                "CONS03": f"""SELECT ALL  A.REPORTINGDATE, A.DESCRIPTIONNO, A.SECTOR, sum( A.BORROWERS) BORROWERS, sum(A.OUTSTANDING_AMOUNT) OUTSTANDING_AMOUNT, sum( A.CURRENT_AMOUNT) CURRENT_AMOUNT, sum(A.ESM) ESM, sum(A.SUBSTANDARD) SUBSTANDARD, sum(A.DOUBTFUL) DOUBTFUL, sum(A.LOSS) LOSS, sum(A.WRITTENOFF) WRITTENOFF FROM {table_name} A
-                where A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}'
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.SECTOR
-                order by A.DESCRIPTIONNO""" , 
-
-                "03": f"""SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.SECTOR, A.BORROWERS, A.OUTSTANDING_AMOUNT, A.CURRENT_AMOUNT, A.ESM, A.SUBSTANDARD, A.DOUBTFUL, A.LOSS, A.WRITTENOFF FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """,
-
-                "CONS04": f"""SELECT ALL A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.BORROWERS) BORROWERS, sum(A.OUTSTANDING_AMOUNT) OUTSTANDING_AMOUNT, avg(A.WA_IRSLA) WA_IRSLA, avg(A.NIRSLA_LOWEST) NIRSLA_LOWEST, avg(A.NIRSLA_HIGHEST) NIRSLA_HIGHEST,
-                avg(A.WA_IRRBA) WA_IRRBA, avg(A.NIRRBA_LOWEST) NIRRBA_LOWEST, avg(A.NIRRBA_HIGHEST) NIRRBA_HIGHEST FROM {table_name} A 
-                where
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}'     
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS   
-                order by A.DESCRIPTIONNO""",
-
-                "04": f"""SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.BORROWERS, A.OUTSTANDING_AMOUNT, A.WA_IRSLA, A.NIRSLA_LOWEST, A.NIRSLA_HIGHEST,
-                A.WA_IRRBA, A.NIRRBA_LOWEST, A.NIRRBA_HIGHEST FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """,
-                
-                "CONS05": f"""SELECT 
-                ALL     A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.AMOUNT)  AMOUNT 
-                FROM {table_name}  A
-                where
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}'
-                group by 
-                A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by 
-                A.DESCRIPTIONNO""",   
-
-                "05": f"""SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.AMOUNT 
-                FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """,  
-
-                "CONS06": f"""SELECT 
-                ALL     A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, 
-                sum(A.NUMBER_COMPLAINTS) NUMBER_COMPLAINTS, sum(A.VALUE_COMPLAINTS) VALUE_COMPLAINTS, sum(A.COMPLAINTS_IR) COMPLAINTS_IR,
-                sum(A.COMPLAINTS_AGREEMENT) COMPLAINTS_AGREEMENT, sum(A.COMPLAINTS_REPAYMENTS) COMPLAINTS_REPAYMENTS, sum(A.COMPLAINTS_LOAN_ST) COMPLAINTS_LOAN_ST, 
-                sum(A.COMPLAINTS_LOAN_PROC) COMPLAINTS_LOAN_PROC, sum(A.COMPLAINTS_OTHERS) COMPLAINTS_OTHERS  
-                FROM {table_name} A
-                where
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}'
-                group by 
-                A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by 
-                A.DESCRIPTIONNO""", 
-
-                "06": f"""SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, 
-                A.NUMBER_COMPLAINTS, A.VALUE_COMPLAINTS, A.COMPLAINTS_IR,
-                A.COMPLAINTS_AGREEMENT, A.COMPLAINTS_REPAYMENTS, A.COMPLAINTS_LOAN_ST, 
-                A.COMPLAINTS_LOAN_PROC, A.COMPLAINTS_OTHERS 
-                FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """,  
-
-                "CONS07I": f"""SELECT ALL  A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.DEPOSIT_TZS) DEPOSIT_TZS, sum(A.DEPOSIT_FOREIGN_EQV_TZS) DEPOSIT_FOREIGN_EQV_TZS, 
-                sum(A.DEPOSIT_TOTAL) DEPOSIT_TOTAL , sum(A.LOAN_TZS) LOAN_TZS, sum(A.LOAN_FOREIGN_EQV_TZS) LOAN_FOREIGN_EQV_TZS,
-                sum( A.LOAN_TOTAL) LOAN_TOTAL FROM {table_name} A  where
-                A.DESCRIPTIONNO  between 1 and 29 and
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}'
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by A.DESCRIPTIONNO""" , 
-
-                "07": f"""SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, 
-                A.DEPOSIT_TZS, A.DEPOSIT_FOREIGN_EQV_TZS, 
-                A.DEPOSIT_TOTAL , A.LOAN_TZS, A.LOAN_FOREIGN_EQV_TZS,
-                A.LOAN_TOTAL 
-                FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """,     
-
-                "CONS07II": f"""SELECT ALL  A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.DEPOSIT_TZS) DEPOSIT_TZS , sum(A.DEPOSIT_FOREIGN_EQV_TZS) DEPOSIT_FOREIGN_EQV_TZS,
-                sum(A.DEPOSIT_TOTAL) DEPOSIT_TOTAL, sum(A.LOAN_TZS) LOAN_TZS, sum(A.LOAN_FOREIGN_EQV_TZS) LOAN_FOREIGN_EQV_TZS,
-                sum(A.LOAN_TOTAL) LOAN_TOTAL FROM {table_name} A
-                where
-                A.DESCRIPTIONNO  between 1 and 29 and
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}'
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by A.DESCRIPTIONNO""" ,  
-
-                "CONS07III": f"""SELECT ALL     A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.DEPOSIT_TZS) DEPOSIT_TZS, sum(A.DEPOSIT_FOREIGN_EQV_TZS) DEPOSIT_FOREIGN_EQV_TZS, 
-                sum(A.DEPOSIT_TOTAL) DEPOSIT_TOTAL , sum(A.LOAN_TZS) LOAN_TZS, sum(A.LOAN_FOREIGN_EQV_TZS) LOAN_FOREIGN_EQV_TZS,
-                sum( A.LOAN_TOTAL) LOAN_TOTAL FROM {table_name}  A  where
-                A.DESCRIPTIONNO  between 1 and 29 and 
-                A.REPORTINGDATE  BETWEEN '{start_period}' AND '{end_period}'
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by A.DESCRIPTIONNO """ , 
-
-                "CONS07IV": f"""SELECT ALL  A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.DEPOSIT_TZS) DEPOSIT_TZS, sum(A.DEPOSIT_FOREIGN_EQV_TZS) DEPOSIT_FOREIGN_EQV_TZS, 
-                sum(A.DEPOSIT_TOTAL) DEPOSIT_TOTAL , sum(A.LOAN_TZS) LOAN_TZS, sum(A.LOAN_FOREIGN_EQV_TZS) LOAN_FOREIGN_EQV_TZS, sum( A.LOAN_TOTAL) LOAN_TOTAL
-                FROM {table_name} A
-                where
-                A.DESCRIPTIONNO  between 59 and 64 and
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}'
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by A.DESCRIPTIONNO""",
-
-                "CONS08": f"""SELECT ALL A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.AMOUNT) AMOUNT FROM {table_name} A where
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}'
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by A.DESCRIPTIONNO""",
-
-                "08": f"""SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.AMOUNT 
-                FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """,   
-
-                "CONS09": f"""SELECT ALL    A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.LOAN_FEMALE_NUMBER) LOAN_FEMALE_NUMBER, sum(A.LOAN_FEMALE_AMOUNT) LOAN_FEMALE_AMOUNT, 
-                sum(A.LOAN_MALE_NUMBER) LOAN_MALE_NUMBER, sum(A.LOAN_MALE_AMOUNT) LOAN_MALE_AMOUNT, sum( A.LOAN_NUMBER) LOAN_NUMBER, sum(A.LOAN_AMOUNT) LOAN_AMOUNT 
-                FROM {table_name} A where
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}'
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by A.DESCRIPTIONNO""",
-
-                "09": f"""SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.AMOUNT, 
-                A.LOAN_FEMALE_NUMBER, A.LOAN_FEMALE_AMOUNT, 
-                A.LOAN_MALE_NUMBER, A.LOAN_MALE_AMOUNT, A.LOAN_NUMBER, A.LOAN_AMOUNT 
-                FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """, 
-
-                "10": f"""SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, 
-                A.BRANCHES, A.EMPLOYEES,
-                A.COMPULSORY_SAVINGS, A.BORROWERS_TO35YRS_M, A.BORROWERS_TO35YRS_F, A.BORROWERS_ABOVE35YRS_M,
-                A.BORROWERS_TO35YRS_F, A.BORROWERS_ABOVE35YRS_M,A.BORROWERS_ABOVE35YRS_F,
-                A.LOANS_TO35YRS_M, A.LOANS_TO35YRS_F, A.LOANS_ABOVE35YRS_M, 
-                A.LOANS_ABOVE35YRS_F, A.AMOUNT_TO35YRS_M, A.AMOUNT_TO35YRS_F, 
-                A.AMOUNT_ABOVE35YRS_M, A.AMOUNT_ABOVE35YRS_F
-                FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """,
-
-                "CONS10": f"""SELECT ALL    A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, 
-                sum(A.BRANCHES) BRANCHES, sum(A.EMPLOYEES) EMPLOYEES, 
-                sum(A.COMPULSORY_SAVINGS) COMPULSORY_SAVINGS, sum(A.BORROWERS_TO35YRS_M) BORROWERS_TO35YRS_M, 
-                sum(A.BORROWERS_TO35YRS_F) BORROWERS_TO35YRS_F, sum(A.BORROWERS_ABOVE35YRS_M) BORROWERS_ABOVE35YRS_M,sum(A.BORROWERS_ABOVE35YRS_F) BORROWERS_ABOVE35YRS_F,
-                sum(A.LOANS_TO35YRS_M) LOANS_TO35YRS_M, sum(A.LOANS_TO35YRS_F) LOANS_TO35YRS_F, sum( A.LOANS_ABOVE35YRS_M) LOANS_ABOVE35YRS_M, 
-                sum(A.LOANS_ABOVE35YRS_F) LOANS_ABOVE35YRS_F, sum(A.AMOUNT_TO35YRS_M) AMOUNT_TO35YRS_M, sum(A.AMOUNT_TO35YRS_F) AMOUNT_TO35YRS_F, 
-                SUM(A.AMOUNT_ABOVE35YRS_M) AMOUNT_ABOVE35YRS_M, sum(A.AMOUNT_ABOVE35YRS_F) AMOUNT_ABOVE35YRS_F
-                FROM {table_name}  A where
-                A.REPORTINGDATE BETWEEN '{start_period}' AND '{end_period}'
-                group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
-                order by A.DESCRIPTIONNO"""
-                }
-
-            sql = sql_mapping.get(data_type, f"""
-                SELECT A.*,B.INSTITUTIONNAME FROM {table_name} A, MSP_INSTITUTION B
-                WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN '{start_period}' AND '{end_period}'
-                AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
-                ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
-                """)
-            
-  
-            
-            #result['sql_query']= sql
-            
-            
-            #print(f"sql is : {sql}")
-
-
-        
-            #Fetch data
-            data = conn.execute_query(sql)
-     
-
-            #Define columns based on data_type
-            columns_mapping = {
-                "01": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
-                "CONS01": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],                
-                "02": ["INSTITUTIONNAME", "INSTITUTIONCODE",   "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT", "YR_TO_DATE_AMOUNT"],
-                "CONS02": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT","YR_TO_DATE_AMOUNT"],  
-                "03": ["INSTITUTIONNAME", "INSTITUTIONCODE",   "REPORTINGDATE", "DESCRIPTIONNO", "SECTOR", "BORROWERS", "OUTSTANDING_AMOUNT",
-                       "CURRENT_AMOUNT", "ESM", "SUBSTANDARD", "DOUBTFUL", "LOSS", "WRITTENOFF"],
-                "CONS03": ["REPORTINGDATE", "DESCRIPTIONNO", "SECTOR", "BORROWERS", "OUTSTANDING_AMOUNT",
-                       "CURRENT_AMOUNT", "ESM", "SUBSTANDARD", "DOUBTFUL", "LOSS", "WRITTENOFF"],    
-                "04": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "BORROWERS",
-                       "OUTSTANDING_AMOUNT", "WA_IRSLA", "NIRSLA_LOWEST", "NIRSLA_HIGHEST", "WA_IRRBA",
-                       "NIRRBA_LOWEST", "NIRRBA_HIGHEST"],
-                "CONS04": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "BORROWERS",
-                       "OUTSTANDING_AMOUNT", "WA_IRSLA", "NIRSLA_LOWEST", "NIRSLA_HIGHEST", "WA_IRRBA",
-                       "NIRRBA_LOWEST", "NIRRBA_HIGHEST"],       
-                "05": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
-                "CONS05": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
-                "06": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "NUMBER_COMPLAINTS",
-                       "VALUE_COMPLAINTS", "COMPLAINTS_IR", "COMPLAINTS_AGREEMENT", "COMPLAINTS_REPAYMENTS",
-                       "COMPLAINTS_LOAN_ST", "COMPLAINTS_LOAN_PROC", "COMPLAINTS_OTHERS"],
-                "CONS06": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "NUMBER_COMPLAINTS",
-                       "VALUE_COMPLAINTS", "COMPLAINTS_IR", "COMPLAINTS_AGREEMENT", "COMPLAINTS_REPAYMENTS",
-                       "COMPLAINTS_LOAN_ST", "COMPLAINTS_LOAN_PROC", "COMPLAINTS_OTHERS"],
-                "07": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "DEPOSIT_TZS",
-                       "DEPOSIT_FOREIGN_EQV_TZS", "DEPOSIT_TOTAL", "LOAN_TZS", "LOAN_FOREIGN_EQV_TZS", "LOAN_TOTAL"],
-                "CONS07I": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "DEPOSIT_TZS", "DEPOSIT_FOREIGN_EQV_TZS", 
-                            "DEPOSIT_TOTAL" , "LOAN_TZS", "LOAN_FOREIGN_EQV_TZS","LOAN_TOTAL"],
-                "CONS07II": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "DEPOSIT_TZS" , "DEPOSIT_FOREIGN_EQV_TZS",
-                             "DEPOSIT_TOTAL","LOAN_TZS", "LOAN_FOREIGN_EQV_TZS","LOAN_TOTAL"],
-                "CONS07III": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "DEPOSIT_TZS", "DEPOSIT_FOREIGN_EQV_TZS", 
-                              "DEPOSIT_TOTAL" , "LOAN_TZS", "LOAN_FOREIGN_EQV_TZS", "LOAN_TOTAL"],
-                "CONS07IV": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "DEPOSIT_TZS", "DEPOSIT_FOREIGN_EQV_TZS", 
-                             "DEPOSIT_TOTAL" , "LOAN_TZS", "LOAN_FOREIGN_EQV_TZS", "LOAN_TOTAL"],
-                "08": ["INSTITUTIONNAME", "INSTITUTIONCODE",   "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
-                "CONS08": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
-                "09": ["INSTITUTIONNAME", "INSTITUTIONCODE", "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "LOAN_FEMALE_NUMBER",
-                       "LOAN_FEMALE_AMOUNT", "LOAN_MALE_NUMBER", "LOAN_MALE_AMOUNT", "LOAN_NUMBER", "LOAN_AMOUNT"],
-                "CONS09": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "LOAN_FEMALE_NUMBER","LOAN_FEMALE_AMOUNT","LOAN_MALE_NUMBER","LOAN_MALE_AMOUNT","LOAN_NUMBER", "LOAN_AMOUNT"],
-                "10": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "BRANCHES", "EMPLOYEES",
-                       "COMPULSORY_SAVINGS", "BORROWERS_TO35YRS_F", "BORROWERS_TO35YRS_M", "BORROWERS_ABOVE35YRS_F",
-                       "BORROWERS_ABOVE35YRS_M", "LOANS_TO35YRS_F", "LOANS_TO35YRS_M", "LOANS_ABOVE35YRS_F",
-                       "LOANS_ABOVE35YRS_M", "AMOUNT_TO35YRS_F", "AMOUNT_TO35YRS_M", "AMOUNT_ABOVE35YRS_F",
-                       "AMOUNT_ABOVE35YRS_M"],
-                "CONS10": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "BRANCHES","EMPLOYEES","COMPULSORY_SAVINGS","BORROWERS_TO35YRS_M","BORROWERS_TO35YRS_F",        "BORROWERS_ABOVE35YRS_M", "BORROWERS_ABOVE35YRS_F","LOANS_TO35YRS_M","LOANS_TO35YRS_F","LOANS_ABOVE35YRS_M","LOANS_ABOVE35YRS_F",           "AMOUNT_TO35YRS_M","AMOUNT_TO35YRS_F","AMOUNT_ABOVE35YRS_M","AMOUNT_ABOVE35YRS_F"]                       
-
-            }
-            columns = columns_mapping.get(data_type)
-            if not columns:
-                raise ValueError(f"Invalid data_type '{data_type}'. No column mapping found.")
-                
-   
-                
-            #Construct DataFrame
-            #result["columns_names"] = columns
-            if data:            
-                result["df"] = pd.DataFrame(data, columns=columns)
+            #Fetch data straight into typed columns
+            df = conn.fetch_dataframe(sql, params, columns, output_format)
+            if len(df):
+                result["df"] = df
+                result["info"] = f"Query executed successfully for {data_type}."
             else:
                 logger.warning("No data found for the given parameters")
+                result["info"] = "No data found for the given parameters."
             logger.info(f"Data successfully retrieved.")
             #print(result["df"].head())
     except Exception as e:
@@ -360,4 +68,170 @@ def read_msp_data(data_group: str, data_source: str, data_type: str, bank_code:
     return result
 
 
+async def read_msp_data_async(data_group: str, data_source: str, data_type: str, bank_code, start_period: str,
+                              end_period: str, output_format: str = "pandas") -> dict:
+    """
+    Coroutine form of read_msp_data() for use from an event loop.
+
+    Takes the same arguments (without streaming) and returns the same result
+    dictionary; the extract waits for a free slot on the source's semaphore.
+    """
+    logger = Logger()
+    result = {"info": "", "debug": "", "df": pd.DataFrame()}
 
+    request_error = validate_request(data_source, data_type)
+    if request_error:
+        result["debug"] += request_error
+        return result
+
+    try:
+        sql, params, columns = build_query(data_source, data_type, bank_code, start_period, end_period)
+        async with AsyncDatabaseConnection(data_source) as conn:
+            df = await conn.fetch_dataframe(sql, params, columns, output_format)
+        if len(df):
+            result["df"] = df
+            result["info"] = f"Query executed successfully for {data_type}."
+        else:
+            logger.warning("No data found for the given parameters")
+            result["info"] = "No data found for the given parameters."
+        logger.info(f"Data successfully retrieved.")
+    except Exception as e:
+        error_message = f"Error fetching MSP data: {str(e)}"
+        result["debug"] += error_message
+        logger.error(error_message)
+
+    return result
+
+
+def validate_request(data_source: str, data_type: str) -> str:
+    """Return a debug message for an unsupported source or type, or an empty string."""
+    valid_data_sources = ["BSIS", "EDI"]
+    valid_data_types = [f"{i:02}" for i in range(1, 11)] + ["*", "CONS01", "CONS02", "CONS03", "CONS04","CONS05", "CONS06","CONS07I","CONS07II","CONS07III", "CONS07IV", "CONS08", "CONS09", "CONS10"]
+
+    if data_source not in valid_data_sources:
+        return f"Invalid data source: {data_source}. "
+    if data_type not in valid_data_types:
+        return f"Invalid data type: {data_type}. "
+    return ""
+
+
+def build_query(data_source: str, data_type: str, bank_code, start_period: str, end_period: str) -> tuple:
+    """
+    Build the statement, bind values and column names for an MSP extract.
+
+    Returns:
+        tuple: (sql, params, columns).
+
+    Raises:
+        ValueError: If the data type has no column mapping.
+    """
+    # Determine schema and table
+    schema = get_schema(data_source, data_type)
+    table_name = get_table_name(data_type, schema)
+
+    #Define SQL query
+    sql = get_sql_query(data_type, table_name, bank_code)
+    params = bind_params(sql, start_period=start_period, end_period=end_period, **institution_binds(bank_code))
+
+    #Define columns based on data_type
+    columns = get_columns(data_type)
+    if not columns:
+        raise ValueError(f"Invalid data_type '{data_type}'. No column mapping found.")
+    return sql, params, columns
+
+
+def get_schema(data_source: str, data_type: str) -> str:
+    """Determine the schema based on the data source and type."""
+    if data_source == "BSIS":
+        return "" if "CONS" in data_type else "BSIS_DEV."
+    elif data_source == "EDI":
+        return "EDI."
+    return ""
+
+
+def get_table_name(data_type: str, schema: str = "") -> str:
+    """Return the MSP2 return table mapped to the given data type."""
+    table_mapping = {
+        "01":"01",
+        "CONS01": "01",
+        "02":"02",
+        "CONS02": "02",
+        "03":"03",
+        "CONS03": "03",
+        "04":"04",
+        "CONS04": "04",
+        "05":"05",
+        "CONS05": "05",
+        "06":"06",
+        "CONS06": "06",
+        "07":"07",
+        "CONS07": "07",
+        "CONS07I": "07",
+        "CONS07II": "07",
+        "CONS07III": "07",
+        "CONS07IV": "07",
+        "08":"08",
+        "CONS08": "08",
+        "09":"09",
+        "CONS09": "09",
+        "10":"10",
+        "CONS10": "10"
+        }
+    return f"{schema}MSP2_{table_mapping.get(data_type)}"
+
+
+def get_sql_query(data_type: str, table_name: str, bank_code) -> str:
+    """Get the bind-parameterized SQL query for the specified data type."""
+    condition = institution_condition(bank_code, "A.INSTITUTIONCODE")
+    return get_query(MSP_QUERIES, data_type, MSP_DEFAULT_QUERY, table_name=table_name, condition=condition)
+
+
+def get_columns(data_type: str) -> list:
+    """Return column names for the specified data type."""
+    columns_mapping = {
+        "01": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
+        "CONS01": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
+        "02": ["INSTITUTIONNAME", "INSTITUTIONCODE",   "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT", "YR_TO_DATE_AMOUNT"],
+        "CONS02": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT","YR_TO_DATE_AMOUNT"],
+        "03": ["INSTITUTIONNAME", "INSTITUTIONCODE",   "REPORTINGDATE", "DESCRIPTIONNO", "SECTOR", "BORROWERS", "OUTSTANDING_AMOUNT",
+               "CURRENT_AMOUNT", "ESM", "SUBSTANDARD", "DOUBTFUL", "LOSS", "WRITTENOFF"],
+        "CONS03": ["REPORTINGDATE", "DESCRIPTIONNO", "SECTOR", "BORROWERS", "OUTSTANDING_AMOUNT",
+               "CURRENT_AMOUNT", "ESM", "SUBSTANDARD", "DOUBTFUL", "LOSS", "WRITTENOFF"],
+        "04": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "BORROWERS",
+               "OUTSTANDING_AMOUNT", "WA_IRSLA", "NIRSLA_LOWEST", "NIRSLA_HIGHEST", "WA_IRRBA",
+               "NIRRBA_LOWEST", "NIRRBA_HIGHEST"],
+        "CONS04": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "BORROWERS",
+               "OUTSTANDING_AMOUNT", "WA_IRSLA", "NIRSLA_LOWEST", "NIRSLA_HIGHEST", "WA_IRRBA",
+               "NIRRBA_LOWEST", "NIRRBA_HIGHEST"],
+        "05": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
+        "CONS05": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
+        "06": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "NUMBER_COMPLAINTS",
+               "VALUE_COMPLAINTS", "COMPLAINTS_IR", "COMPLAINTS_AGREEMENT", "COMPLAINTS_REPAYMENTS",
+               "COMPLAINTS_LOAN_ST", "COMPLAINTS_LOAN_PROC", "COMPLAINTS_OTHERS"],
+        "CONS06": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "NUMBER_COMPLAINTS",
+               "VALUE_COMPLAINTS", "COMPLAINTS_IR", "COMPLAINTS_AGREEMENT", "COMPLAINTS_REPAYMENTS",
+               "COMPLAINTS_LOAN_ST", "COMPLAINTS_LOAN_PROC", "COMPLAINTS_OTHERS"],
+        "07": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "DEPOSIT_TZS",
+               "DEPOSIT_FOREIGN_EQV_TZS", "DEPOSIT_TOTAL", "LOAN_TZS", "LOAN_FOREIGN_EQV_TZS", "LOAN_TOTAL"],
+        "CONS07I": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "DEPOSIT_TZS", "DEPOSIT_FOREIGN_EQV_TZS",
+                    "DEPOSIT_TOTAL" , "LOAN_TZS", "LOAN_FOREIGN_EQV_TZS","LOAN_TOTAL"],
+        "CONS07II": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "DEPOSIT_TZS" , "DEPOSIT_FOREIGN_EQV_TZS",
+                     "DEPOSIT_TOTAL","LOAN_TZS", "LOAN_FOREIGN_EQV_TZS","LOAN_TOTAL"],
+        "CONS07III": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "DEPOSIT_TZS", "DEPOSIT_FOREIGN_EQV_TZS",
+                      "DEPOSIT_TOTAL" , "LOAN_TZS", "LOAN_FOREIGN_EQV_TZS", "LOAN_TOTAL"],
+        "CONS07IV": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "DEPOSIT_TZS", "DEPOSIT_FOREIGN_EQV_TZS",
+                     "DEPOSIT_TOTAL" , "LOAN_TZS", "LOAN_FOREIGN_EQV_TZS", "LOAN_TOTAL"],
+        "08": ["INSTITUTIONNAME", "INSTITUTIONCODE",   "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
+        "CONS08": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "AMOUNT"],
+        "09": ["INSTITUTIONNAME", "INSTITUTIONCODE", "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "LOAN_FEMALE_NUMBER",
+               "LOAN_FEMALE_AMOUNT", "LOAN_MALE_NUMBER", "LOAN_MALE_AMOUNT", "LOAN_NUMBER", "LOAN_AMOUNT"],
+        "CONS09": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "LOAN_FEMALE_NUMBER","LOAN_FEMALE_AMOUNT","LOAN_MALE_NUMBER","LOAN_MALE_AMOUNT","LOAN_NUMBER", "LOAN_AMOUNT"],
+        "10": ["INSTITUTIONNAME", "INSTITUTIONCODE",  "REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "BRANCHES", "EMPLOYEES",
+               "COMPULSORY_SAVINGS", "BORROWERS_TO35YRS_F", "BORROWERS_TO35YRS_M", "BORROWERS_ABOVE35YRS_F",
+               "BORROWERS_ABOVE35YRS_M", "LOANS_TO35YRS_F", "LOANS_TO35YRS_M", "LOANS_ABOVE35YRS_F",
+               "LOANS_ABOVE35YRS_M", "AMOUNT_TO35YRS_F", "AMOUNT_TO35YRS_M", "AMOUNT_ABOVE35YRS_F",
+               "AMOUNT_ABOVE35YRS_M"],
+        "CONS10": ["REPORTINGDATE", "DESCRIPTIONNO", "PARTICULARS", "BRANCHES","EMPLOYEES","COMPULSORY_SAVINGS","BORROWERS_TO35YRS_M","BORROWERS_TO35YRS_F",        "BORROWERS_ABOVE35YRS_M", "BORROWERS_ABOVE35YRS_F","LOANS_TO35YRS_M","LOANS_TO35YRS_F","LOANS_ABOVE35YRS_M","LOANS_ABOVE35YRS_F",           "AMOUNT_TO35YRS_M","AMOUNT_TO35YRS_F","AMOUNT_ABOVE35YRS_M","AMOUNT_ABOVE35YRS_F"]
+
+    }
+    return columns_mapping.get(data_type)
@@ -0,0 +1,259 @@
+"""
+Period partitioning and institution sharding for large extracts.
+
+A request for [start_period, end_period] is split into contiguous slices
+whose boundaries fall on month ends, the reporting calendar of the MSP and
+ITRS returns. An all-bank request (bank_code='*') can instead be split into
+shards of institution codes. Each part is fetched as an ordinary reader call
+on its own session and the results are concatenated back in plan order.
+"""
+
+import calendar
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from langodata.utils.query_catalog import ExcludedInstitutions
+from langodata.utils.tracing import span, set_metric
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+PERIOD_FORMAT = "%d-%b-%Y"
+
+# ITRS data types whose rows belong to a single reporting date. The pivot and
+# region summaries aggregate across the whole range and must not be split.
+# RATES and TRANSFORMATION_ERRORS number their rows with ROWNUM AS SNO, which
+# would repeat in every slice, and are left out too.
+ITRS_PARTITIONABLE_TYPES = [
+    "OVERALL_ANALYSIS",
+    "URT_PAYMENTS", "URT_RECEIPTS", "ZNZ_PAYMENTS", "ZNZ_RECEIPTS",
+    "URT_PAYMENTS_FINAL", "URT_RECEIPTS_FINAL", "ZNZ_PAYMENTS_FINAL", "ZNZ_RECEIPTS_FINAL",
+]
+
+# ORDER BY of the statements as (columns, ascending), restored once the
+# parts of a request have been concatenated.
+_RAW_ORDER = (["INSTITUTIONNAME", "INSTITUTIONCODE", "SNO", "REPORTINGDATE"], [True, True, True, False])
+_FINAL_ORDER = (["REPORTINGDATE", "SNO"], [False, True])
+ITRS_RESULT_ORDER = {
+    "URT_PAYMENTS": _RAW_ORDER, "URT_RECEIPTS": _RAW_ORDER, "ZNZ_PAYMENTS": _RAW_ORDER, "ZNZ_RECEIPTS": _RAW_ORDER,
+    "URT_PAYMENTS_FINAL": _FINAL_ORDER, "URT_RECEIPTS_FINAL": _FINAL_ORDER,
+    "ZNZ_PAYMENTS_FINAL": _FINAL_ORDER, "ZNZ_RECEIPTS_FINAL": _FINAL_ORDER,
+}
+# MSP returns per institution, and the CONS consolidations across them
+MSP_RESULT_ORDER = (["INSTITUTIONNAME", "INSTITUTIONCODE", "DESCRIPTIONNO"], [True, True, True])
+MSP_CONS_RESULT_ORDER = (["DESCRIPTIONNO"], [True])
+MACROECONOMICS_RESULT_ORDER = {"BOP": (["TIME_PERIOD"], [False])}
+
+
+def format_period(value: datetime) -> str:
+    """Format a date the way the readers bind periods, e.g. 31-JAN-2024."""
+    return value.strftime(PERIOD_FORMAT).upper()
+
+
+def month_end(value: datetime) -> datetime:
+    """Return the last day of the month containing `value`."""
+    return value.replace(day=calendar.monthrange(value.year, value.month)[1])
+
+
+def month_ends(start_period: str, end_period: str) -> list:
+    """Return every month end from the month of start_period to the month of end_period."""
+    current = month_end(datetime.strptime(start_period, PERIOD_FORMAT))
+    last = month_end(datetime.strptime(end_period, PERIOD_FORMAT))
+    ends = []
+    while current <= last:
+        ends.append(current)
+        current = month_end(current + timedelta(days=1))
+    return ends
+
+
+def plan_partitions(start_period: str, end_period: str, partitions: int) -> list:
+    """
+    Split a period range into at most `partitions` contiguous month-aligned slices.
+
+    The slices cover [start_period, end_period] exactly, with no gaps or
+    overlaps: every inner boundary is a month end, the next slice starts the
+    following day, and the first and last slices keep the requested bounds.
+
+    Returns:
+        list: ``(slice_start, slice_end)`` tuples in DD-MON-YYYY format.
+    """
+    if partitions < 1:
+        raise ValueError(f"Invalid partitions: {partitions}")
+    start = datetime.strptime(start_period, PERIOD_FORMAT)
+    end = datetime.strptime(end_period, PERIOD_FORMAT)
+    ends = month_ends(start_period, end_period)
+    if end <= start or len(ends) < 2:
+        return [(start_period, end_period)]
+    partitions = min(partitions, len(ends))
+    size, extra = divmod(len(ends), partitions)
+
+    plan = []
+    slice_start = start
+    index = 0
+    for number in range(partitions):
+        index += size + (1 if number < extra else 0)
+        slice_end = end if number == partitions - 1 else ends[index - 1]
+        plan.append((format_period(slice_start), format_period(slice_end)))
+        slice_start = slice_end + timedelta(days=1)
+    return plan
+
+
+# Data types whose statement filters on the institution code.
+ITRS_SHARDABLE_TYPES = [
+    "URT_PAYMENTS", "URT_RECEIPTS", "ZNZ_PAYMENTS", "ZNZ_RECEIPTS",
+    "URT_PAYMENTS_FINAL", "URT_RECEIPTS_FINAL", "ZNZ_PAYMENTS_FINAL", "ZNZ_RECEIPTS_FINAL",
+]
+
+
+def plan_shards(codes: list, shards: int, residual: bool = False) -> list:
+    """
+    Split institution codes into at most `shards` contiguous, near-equal lists.
+
+    With `residual`, one more shard, ExcludedInstitutions(codes), selects the
+    rows of every institution not in `codes`, so the shards together match an
+    unsharded read of a table that is not joined to the institution list.
+    """
+    if shards < 1:
+        raise ValueError(f"Invalid shards: {shards}")
+    shards = max(1, min(shards, len(codes)))
+    size, extra = divmod(len(codes), shards)
+    plan = []
+    start = 0
+    for number in range(shards):
+        end = start + size + (1 if number < extra else 0)
+        plan.append(list(codes[start:end]))
+        start = end
+    if residual:
+        plan.append(ExcludedInstitutions(codes))
+    return plan
+
+
+def is_shardable(data_group: str, data_type: str) -> bool:
+    """True when the statement for the data type can be restricted to a list of institutions."""
+    if data_group == "MSP":
+        return not data_type.startswith("CONS")
+    if data_group == "ITRS":
+        return data_type in ITRS_SHARDABLE_TYPES
+    return False
+
+
+def needs_residual_shard(data_group: str, data_type: str) -> bool:
+    """True when the statement does not join the institution list, so codes missing from it still have rows."""
+    return data_group == "ITRS" and data_type.endswith("_FINAL")
+
+
+def is_partitionable(data_group: str, data_type: str) -> bool:
+    """True when rows of the data type can be fetched per period slice and concatenated."""
+    if data_group == "MSP":
+        return True
+    if data_group == "ITRS":
+        return data_type in ITRS_PARTITIONABLE_TYPES
+    return False
+
+
+def concat_results(frames: list):
+    """Concatenate pandas DataFrames or pyarrow Tables in the given order."""
+    if pyarrow is not None and isinstance(frames[0], pyarrow.Table):
+        return pyarrow.concat_tables(frames)
+    return pd.concat(frames, ignore_index=True)
+
+
+def result_order(data_group: str, data_type: str) -> tuple:
+    """Return the (columns, ascending) ORDER BY of a data type's statement, or ([], []) when it has none."""
+    if data_group == "ITRS":
+        return ITRS_RESULT_ORDER.get(data_type, ([], []))
+    if data_group == "MSP":
+        return MSP_CONS_RESULT_ORDER if data_type.startswith("CONS") else MSP_RESULT_ORDER
+    if data_group == "MACROECONOMICS":
+        return MACROECONOMICS_RESULT_ORDER.get(data_type, ([], []))
+    return [], []
+
+
+def sort_result(df, data_group: str, data_type: str):
+    """
+    Put concatenated parts back in the ORDER BY of the data type's statement.
+
+    The sort is stable, so rows tied on the ORDER BY keep their part order.
+    Frames of types without a known order, or missing its columns, are
+    returned as they are.
+    """
+    columns, ascending = result_order(data_group, data_type)
+    names = df.column_names if pyarrow is not None and isinstance(df, pyarrow.Table) else list(df.columns)
+    if not columns or not len(df) or not set(columns) <= set(names):
+        return df
+    if pyarrow is not None and isinstance(df, pyarrow.Table):
+        return df.sort_by([(column, "ascending" if up else "descending") for column, up in zip(columns, ascending)])
+    return df.sort_values(columns, ascending=ascending, kind="stable").reset_index(drop=True)
+
+
+def fetch_parts(fetch_part, parts: list, max_workers: int, name: str, describe) -> dict:
+    """
+    Run `fetch_part(*part)` for every part concurrently and merge the results.
+
+    Each call returns a reader result dictionary. The frames are concatenated
+    in plan order, debug messages are joined, and info is only set when every
+    part's query ran (a reader sets info once it has). The plan, with
+    ``describe(part)`` plus rows and elapsed seconds per part, is recorded in
+    the trace metrics as ``<name>s``, ``<name>_workers`` and ``<name>_plan``.
+
+    Returns:
+        dict: A single reader result dictionary for the whole request.
+    """
+    workers = max(1, min(max_workers, len(parts)))
+
+    def timed(*part):
+        started = time.perf_counter()
+        with span(name, **describe(part)):
+            result = fetch_part(*part)
+        return result, time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name) as executor:
+        # Copy the context per part so spans land in the caller's trace
+        futures = [executor.submit(contextvars.copy_context().run, timed, *part) for part in parts]
+        outcomes = [future.result() for future in futures]
+
+    result = {"info": "", "debug": "", "df": pd.DataFrame()}
+    report = []
+    frames = []
+    for part, (part_result, elapsed) in zip(parts, outcomes):
+        df = part_result.get("df")
+        rows = len(df) if hasattr(df, "__len__") else 0
+        if rows:
+            frames.append(df)
+        description = describe(part)
+        if part_result.get("debug"):
+            label = " - ".join(str(value) for value in description.values())
+            result["debug"] += f"[{name} {label}] {part_result['debug']} "
+        report.append({**description, "rows": rows, "elapsed": round(elapsed, 6)})
+    if frames:
+        result["df"] = concat_results(frames)
+    if all(part_result.get("info") for part_result, _ in outcomes):
+        result["info"] = f"Fetched {len(parts)} {name}s."
+
+    set_metric(f"{name}s", len(parts))
+    set_metric(f"{name}_workers", workers)
+    set_metric(f"{name}_plan", report)
+    return result
+
+
+def fetch_partitioned(fetch_slice, plan: list, max_workers: int) -> dict:
+    """Fetch `fetch_slice(slice_start, slice_end)` for every period slice in `plan`."""
+    return fetch_parts(fetch_slice, plan, max_workers, "partition",
+                       lambda part: {"start_period": part[0], "end_period": part[1]})
+
+
+def fetch_sharded(fetch_shard, plan: list, max_workers: int) -> dict:
+    """Fetch `fetch_shard(codes)` for every institution shard in `plan`."""
+    def describe(part):
+        if isinstance(part[0], ExcludedInstitutions):
+            return {"excluded_institutions": len(part[0])}
+        return {"first_institution": part[0][0], "last_institution": part[0][-1], "institutions": len(part[0])}
+
+    return fetch_parts(fetch_shard, [(codes,) for codes in plan], max_workers, "shard", describe)
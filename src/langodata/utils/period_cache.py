@@ -0,0 +1,219 @@
+"""
+Range-aware caching of month-based extracts.
+
+An extract is cached per key ``(data_group, data_type, data_source,
+institution)`` and reporting month. A request for [start_period,
+end_period] is answered from the months already held in memory (the
+result cache) or on disk (the Parquet cache); the months still missing are
+coalesced into gaps of consecutive months, each gap is fetched from Oracle
+with one statement, and everything is merged back in reporting order. So
+after Jan-Jun has been read, a request for Mar-Sep only fetches Jul-Sep.
+
+A month cached for all institutions (bank_code='*') also answers requests
+for one institution or a list of them: the rows are picked through an index
+on INSTITUTIONCODE kept with the cached month, and the month partitioning
+serves as the REPORTINGDATE index.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from langodata.utils.disk_cache import cache_path, is_closed, load_month, store_month
+from langodata.utils.partitioning import PERIOD_FORMAT, format_period, month_ends
+from langodata.utils.result_cache import get_result, lookup_index, store_result
+from langodata.utils.tracing import record_metrics, span
+
+
+# Reporting-date column of every data type whose rows belong to one month.
+PERIOD_COLUMNS = {
+    ("ITRS", "OVERALL_ANALYSIS"): "REPORTINGDATE",
+    ("ITRS", "URT_PAYMENTS"): "REPORTINGDATE",
+    ("ITRS", "URT_RECEIPTS"): "REPORTINGDATE",
+    ("ITRS", "ZNZ_PAYMENTS"): "REPORTINGDATE",
+    ("ITRS", "ZNZ_RECEIPTS"): "REPORTINGDATE",
+    ("ITRS", "URT_PAYMENTS_FINAL"): "REPORTINGDATE",
+    ("ITRS", "URT_RECEIPTS_FINAL"): "REPORTINGDATE",
+    ("ITRS", "ZNZ_PAYMENTS_FINAL"): "REPORTINGDATE",
+    ("ITRS", "ZNZ_RECEIPTS_FINAL"): "REPORTINGDATE",
+    # Extract behind the country/sector pivots (itrs_pivot)
+    ("ITRS", "ITRS_DETAIL"): "REPORTINGDATE",
+    ("MACROECONOMICS", "CPI"): "TIME_PERIOD",
+    ("MACROECONOMICS", "BOP"): "TIME_PERIOD",
+}
+
+# ITRS data types that return an INSTITUTIONCODE column. The *_FINAL tables
+# do not, so an all-bank FINAL extract cannot answer a single-bank request.
+ITRS_INSTITUTION_TYPES = ["URT_PAYMENTS", "URT_RECEIPTS", "ZNZ_PAYMENTS", "ZNZ_RECEIPTS"]
+
+
+def period_column(data_group: str, data_type: str):
+    """Return the reporting-date column for a cacheable data type, or None."""
+    if data_group == "MSP" and data_type != "*":
+        return "REPORTINGDATE"
+    return PERIOD_COLUMNS.get((data_group, data_type))
+
+
+def institution_column(data_group: str, data_type: str):
+    """Return the institution column of an institution-level data type, or None."""
+    if data_group == "MSP" and data_type != "*" and not data_type.startswith("CONS"):
+        return "INSTITUTIONCODE"
+    if data_group == "ITRS" and data_type in ITRS_INSTITUTION_TYPES:
+        return "INSTITUTIONCODE"
+    return None
+
+
+def is_cacheable(data_group: str, data_type: str, bank_code) -> bool:
+    """
+    Month-based extracts can be cached by period.
+
+    ``bank_code`` is one institution, ``'*'`` or a tuple of codes; tuples are
+    only kept in memory. For MACROECONOMICS it is the data frequency.
+    """
+    return isinstance(bank_code, (str, tuple)) and period_column(data_group, data_type) is not None
+
+
+def month_start(month: datetime) -> datetime:
+    return month.replace(day=1)
+
+
+def coalesce_gaps(months: list) -> list:
+    """
+    Group missing month ends into runs of consecutive months.
+
+    Returns:
+        list: One list of month ends per gap, in reporting order.
+    """
+    runs = []
+    for month in months:
+        if runs and runs[-1][-1] + timedelta(days=1) == month_start(month):
+            runs[-1].append(month)
+        else:
+            runs.append([month])
+    return runs
+
+
+def _memory_key(key, month):
+    data_group, data_type, data_source, bank_code = key
+    return ("period", data_group, data_source, data_type, bank_code, f"{month:%Y-%m}")
+
+
+def _load_exact(key, month, use_memory, use_disk):
+    """Return (frame, tier) for a month cached under exactly `key`, or (None, None)."""
+    if use_memory:
+        cached = get_result(_memory_key(key, month), key[0])
+        if cached is not None:
+            return cached["df"], "memory"
+    if use_disk and isinstance(key[3], str) and is_closed(month):
+        df = load_month(cache_path(*key, month))
+        if df is not None:
+            if use_memory:
+                store_result(_memory_key(key, month), {"info": "", "debug": "", "df": df}, keep_empty=True)
+            return df, "disk"
+    return None, None
+
+
+def _select_institutions(key, month, codes, column, use_memory):
+    """Pick the rows of `codes` out of a cached all-bank month, through its index when in memory."""
+    all_banks = _memory_key(key[:3] + ("*",), month)
+    df, index = lookup_index(all_banks, column) if use_memory else (None, None)
+    if df is None:
+        return None
+    positions = [index[code] for code in codes if code in index]
+    if not positions:
+        return df.iloc[0:0]
+    return df.take(np.sort(np.concatenate(positions))).reset_index(drop=True)
+
+
+def _load(key, month, use_memory, use_disk):
+    """Return (frame, tier) for a cached month, or (None, None)."""
+    df, tier = _load_exact(key, month, use_memory, use_disk)
+    if df is not None:
+        return df, tier
+    data_group, data_type, _, bank_code = key
+    column = institution_column(data_group, data_type)
+    if column is None or bank_code == "*":
+        return None, None
+    # Answer from the all-bank month when it is cached
+    superset, _ = _load_exact(key[:3] + ("*",), month, use_memory, use_disk)
+    if superset is None:
+        return None, None
+    codes = [bank_code] if isinstance(bank_code, str) else list(bank_code)
+    df = _select_institutions(key, month, codes, column, use_memory)
+    if df is None:
+        df = superset[superset[column].isin(codes)].reset_index(drop=True)
+    return df, "superset"
+
+
+def _store(key, month, df, use_memory, use_disk):
+    if use_memory:
+        store_result(_memory_key(key, month), {"info": "", "debug": "", "df": df}, keep_empty=True)
+    # An empty month may still be filled by a late return; only the memory
+    # cache, with its TTL, remembers it
+    if use_disk and len(df) and isinstance(key[3], str) and is_closed(month):
+        store_month(cache_path(*key, month), df)
+
+
+def read_periods(fetch_range, key, start_period, end_period, use_memory=True, use_disk=False) -> dict:
+    """
+    Serve a request from cached months and fetch only the missing gaps.
+
+    Args:
+        fetch_range (callable): ``fetch_range(start_period, end_period)``
+            returning a pandas reader result dictionary. Its info is set
+            once the query has run; a result without info is a failed fetch
+            and caches nothing.
+        key (tuple): ``(data_group, data_type, data_source, bank_code)``,
+            with a list of codes passed as a tuple.
+        use_memory (bool): Look up and keep months in the in-process result cache.
+        use_disk (bool): Look up and keep closed months in the Parquet cache.
+
+    Returns:
+        dict: A reader result dictionary covering [start_period, end_period],
+        rows in reporting order.
+    """
+    data_group, data_type = key[0], key[1]
+    column = period_column(data_group, data_type)
+    months = month_ends(start_period, end_period)
+    frames = {}
+    tiers = {"memory": 0, "disk": 0, "superset": 0}
+    for month in months:
+        df, tier = _load(key, month, use_memory, use_disk)
+        if df is not None:
+            frames[month] = df
+            tiers[tier] += 1
+    missing = [month for month in months if month not in frames]
+    gaps = coalesce_gaps(missing)
+    record_metrics(cache_hits=len(frames), cache_misses=len(missing), memory_cache_hits=tiers["memory"],
+                   disk_cache_hits=tiers["disk"], superset_cache_hits=tiers["superset"], cache_gaps=len(gaps))
+
+    result = {"info": "", "debug": "", "df": pd.DataFrame()}
+    for gap in gaps:
+        # Fetch whole months so that every month is cached complete
+        gap_start, gap_end = format_period(month_start(gap[0])), format_period(gap[-1])
+        with span("cache_fill", start_period=gap_start, end_period=gap_end):
+            fetched = fetch_range(gap_start, gap_end)
+        if not fetched.get("info"):
+            result["debug"] += fetched.get("debug") or f"Could not fetch {gap_start} - {gap_end}. "
+            continue
+        df = fetched["df"]
+        if len(df) and column not in df.columns:
+            # Rows that cannot be placed in a month are not cached as "no data"
+            result["debug"] += f"Fetched {gap_start} - {gap_end} without a {column} column. "
+            continue
+        periods = pd.to_datetime(df[column]).dt.to_period("M") if len(df) else None
+        for month in gap:
+            month_df = df[periods == pd.Period(month, "M")] if periods is not None else df.iloc[0:0]
+            frames[month] = month_df.reset_index(drop=True)
+            _store(key, month, frames[month], use_memory, use_disk)
+
+    ordered = [frames[month] for month in months if month in frames and len(frames[month])]
+    if ordered:
+        df = pd.concat(ordered, ignore_index=True)
+        dates = pd.to_datetime(df[column]).dt.normalize()
+        start = datetime.strptime(start_period, PERIOD_FORMAT)
+        end = datetime.strptime(end_period, PERIOD_FORMAT)
+        result["df"] = df[(dates >= start) & (dates <= end)].reset_index(drop=True)
+    result["info"] = f"Served {len(months) - len(missing)} of {len(months)} months from the cache."
+    return result
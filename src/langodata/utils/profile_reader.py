@@ -1,11 +1,12 @@
 import os
 import pandas as pd
-from langodata.utils.database import DatabaseConnection
+from langodata.utils.database import DatabaseConnection, AsyncDatabaseConnection
 from langodata.utils.logger import Logger
+from langodata.utils.query_catalog import PROFILE_QUERY, INSTITUTION_CODES_QUERY, institution_condition, institution_binds, bind_params
 #from utils.license_manager import validate_license, check_license_status
 #from utils.auth_token import authenticate_user
 
-def read_fsp_profile(data_group: str, data_source: str, fsp_code: str) -> dict:
+def read_fsp_profile(data_group: str, data_source: str, fsp_code) -> dict:
     """
     Reads MSP data from the specified data source and returns a result dictionary.
 
@@ -13,7 +14,7 @@ def read_fsp_profile(data_group: str, data_source: str, fsp_code: str) -> dict:
         data_group (str): The data group (e.g., "MSP2").
         data_source (str): The data source (e.g., "BSIS" or "EDI").
         data_type (str): The type of data to fetch.
-        fsp_code (str): Bank code to filter data. Use '*' for all banks.
+        fsp_code (str or list): Bank code to filter data, a list of codes, or '*' for all banks.
 
     Returns:
         dict: Contains Info, Debug, Contains SQL query, and column names.
@@ -24,52 +25,18 @@ def read_fsp_profile(data_group: str, data_source: str, fsp_code: str) -> dict:
 
     
     try:
+        sql, params, columns = build_profile_query(data_group, data_source, fsp_code)
+        result['sql_query']= sql
+
         with DatabaseConnection(data_source) as conn:
-            schema = "BSIS_DEV." if data_source in ["BSIS"] else ""
-                 
-            #Define SQL query 
-            
-            fsp_type_mapping = {
-                "MSP": "MSP_INSTITUTION",
-                "BANK": "INSTITUTION"                 
-            }
-            profile_table = fsp_type_mapping.get(data_group)
-            #Define columns based on data_type
-            columns_mapping = {
-                "MSP": ["ROWNUM", "INSTITUTIONCODE",  "INSTITUTIONNAME" ,  "INSTITUTIONSTATUS" ,  "INCORPORATIONCERTIFICATENO",  "INCORPORATIONDATE" ,  "TIN" ,            "HQADDRESS",  "LICENSENO",  "LICENSINGDATE", "COMMENCEMENTDATE",  "CONTACT_PERSON" ,  "TEL_NO",  "E_MAIL",  "FAXNO" ,  
-                            "POSTAL_ADDRESS" ,  "PHYSICAL_ADDRESS",  "COMPANY_EMAIL",  "CAPITAL_LEVEL" ,  "STATUS_COMMENTS",
-                            "OWNERSHIP" ,  "CATEGORY" ,  "NO_AUTHORISED_SHARE",  "NO_PREFERENCE_SHARE",  "VALUE_AUTHORISED_SHARE",  
-                            "AUDITOR_NAME"  ,  "REG_DATE  ,  REG_USER"],
-                "BANK": ["INSTITUTIONCODE",  "INSTITUTIONNAME" ,  "INSTITUTIONSTATUS" ,  "INCORPORATIONCERTIFICATENO",  "INCORPORATIONDATE" ,              "HQADDRESS",  "LICENSENO",  "LICENSINGDATE", "COMMENCEMENTDATE",  "CONTACT_PERSON" , "FINANCIALYEAR_END", "TEL_NO", "FAXNO", "CABLE_ADDRESS", "E_MAIL",  "CAPITAL_LEVEL",  "APPROVAL_DATE",    "INSTITUTIONTYPE",  "AUDITORCODE",  "AUTHORISED_SHARES" , "USERNAME",
-                "ACCOUNTING_SYSTEM","PHYSICAL_ADDRESS","SHORT_NAME", "STATUS_COMMENTS","CATEGORYNO", "NO_AUTHORISED_SHARE",        
-                "NO_PREFERENCE_SHARE", "VALUE_AUTHORISED_SHARE", "VALUE_PREFERENCE_SHARE", "OWNERSHIP", "CBSBANK_CODE",
-                "SMR_ACCOUNT", "CLEARING_ACCOUNT", "BIC_CODE", "TISS_MEMBER", "ITRS_URT", "ITRS_ZNZ" ]              
-                          
-            }
-            columns = columns_mapping.get(data_group)
-            condition = "1=1" if fsp_code == "*" else f"INSTITUTIONCODE = '{fsp_code}'" 
-            source =  f"""
-                {schema}{profile_table}
-            """            
-            sql = f"""
-                SELECT * FROM {source}
-                WHERE {condition}
-            """
-
-            result['sql_query']= sql
-            
             #Fetch data
-            data = conn.execute_query(sql)
+            data = conn.execute_query(sql, params)
             logger.info("Connected to data source and executed query.")
-            
 
-            if not columns:
-                raise ValueError(f"Invalid data_type '{data_group}'. No column mapping found.")
-                
-            #Construct DataFrame
-            result["columns_names"] = columns
-            result["df"] = pd.DataFrame(data, columns=columns)
-            logger.info("Data successfully retrieved and packed into a DataFrame.")
+        #Construct DataFrame
+        result["columns_names"] = columns
+        result["df"] = pd.DataFrame(data, columns=columns)
+        logger.info("Data successfully retrieved and packed into a DataFrame.")
 
             
     except Exception as e:
@@ -80,4 +47,88 @@ def read_fsp_profile(data_group: str, data_source: str, fsp_code: str) -> dict:
     return result
 
 
+async def read_fsp_profile_async(data_group: str, data_source: str, fsp_code) -> dict:
+    """
+    Coroutine form of read_fsp_profile() for use from an event loop.
+    """
+    logger = Logger()
+    result = {"info": "", "debug": "", "sql_query": "", "columns_names": []}
 
+    try:
+        sql, params, columns = build_profile_query(data_group, data_source, fsp_code)
+        result['sql_query'] = sql
+        async with AsyncDatabaseConnection(data_source) as conn:
+            data = await conn.execute_query(sql, params)
+        result["columns_names"] = columns
+        result["df"] = pd.DataFrame(data, columns=columns)
+        logger.info("Data successfully retrieved and packed into a DataFrame.")
+    except Exception as e:
+        error_message = f"Error: {str(e)}"
+        logger.error(error_message)
+        result["debug"] = error_message
+
+    return result
+
+
+def build_profile_query(data_group: str, data_source: str, fsp_code) -> tuple:
+    """
+    Build the statement, bind values and column names for an FSP profile.
+
+    Returns:
+        tuple: (sql, params, columns).
+
+    Raises:
+        ValueError: If the data group has no column mapping.
+    """
+    schema = "BSIS_DEV." if data_source in ["BSIS"] else ""
+         
+    #Define SQL query 
+    
+    fsp_type_mapping = {
+        "MSP": "MSP_INSTITUTION",
+        "BANK": "INSTITUTION"                 
+    }
+    profile_table = fsp_type_mapping.get(data_group)
+    #Define columns based on data_type
+    columns_mapping = {
+        "MSP": ["ROWNUM", "INSTITUTIONCODE",  "INSTITUTIONNAME" ,  "INSTITUTIONSTATUS" ,  "INCORPORATIONCERTIFICATENO",  "INCORPORATIONDATE" ,  "TIN" ,            "HQADDRESS",  "LICENSENO",  "LICENSINGDATE", "COMMENCEMENTDATE",  "CONTACT_PERSON" ,  "TEL_NO",  "E_MAIL",  "FAXNO" ,  
+                    "POSTAL_ADDRESS" ,  "PHYSICAL_ADDRESS",  "COMPANY_EMAIL",  "CAPITAL_LEVEL" ,  "STATUS_COMMENTS",
+                    "OWNERSHIP" ,  "CATEGORY" ,  "NO_AUTHORISED_SHARE",  "NO_PREFERENCE_SHARE",  "VALUE_AUTHORISED_SHARE",  
+                    "AUDITOR_NAME"  ,  "REG_DATE  ,  REG_USER"],
+        "BANK": ["INSTITUTIONCODE",  "INSTITUTIONNAME" ,  "INSTITUTIONSTATUS" ,  "INCORPORATIONCERTIFICATENO",  "INCORPORATIONDATE" ,              "HQADDRESS",  "LICENSENO",  "LICENSINGDATE", "COMMENCEMENTDATE",  "CONTACT_PERSON" , "FINANCIALYEAR_END", "TEL_NO", "FAXNO", "CABLE_ADDRESS", "E_MAIL",  "CAPITAL_LEVEL",  "APPROVAL_DATE",    "INSTITUTIONTYPE",  "AUDITORCODE",  "AUTHORISED_SHARES" , "USERNAME",
+        "ACCOUNTING_SYSTEM","PHYSICAL_ADDRESS","SHORT_NAME", "STATUS_COMMENTS","CATEGORYNO", "NO_AUTHORISED_SHARE",        
+        "NO_PREFERENCE_SHARE", "VALUE_AUTHORISED_SHARE", "VALUE_PREFERENCE_SHARE", "OWNERSHIP", "CBSBANK_CODE",
+        "SMR_ACCOUNT", "CLEARING_ACCOUNT", "BIC_CODE", "TISS_MEMBER", "ITRS_URT", "ITRS_ZNZ" ]              
+                  
+    }
+    columns = columns_mapping.get(data_group)
+    if not columns:
+        raise ValueError(f"Invalid data_type '{data_group}'. No column mapping found.")
+    condition = institution_condition(fsp_code)
+    sql = PROFILE_QUERY.format(table_name=f"{schema}{profile_table}", condition=condition)
+    params = bind_params(sql, **institution_binds(fsp_code))
+    return sql, params, columns
+
+
+def read_institution_codes(data_group: str, data_source: str) -> list:
+    """
+    Return the sorted institution codes registered for a data group.
+
+    MSP institutions come from MSP_INSTITUTION; ITRS and BANK reporters from
+    INSTITUTION, matching the tables the readers join against.
+
+    Raises:
+        ValueError: If the data group has no institution table.
+    """
+    institution_tables = {
+        "MSP": "MSP_INSTITUTION",
+        "ITRS": "INSTITUTION",
+        "BANK": "INSTITUTION"
+    }
+    table = institution_tables.get(data_group)
+    if not table:
+        raise ValueError(f"No institution table for data group: {data_group}")
+    schema = "BSIS_DEV." if data_source in ["BSIS"] else ""
+    with DatabaseConnection(data_source) as conn:
+        rows = conn.execute_query(INSTITUTION_CODES_QUERY.format(table_name=f"{schema}{table}"))
+    return [row[0] for row in rows]
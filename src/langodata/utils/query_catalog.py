@@ -0,0 +1,472 @@
+"""
+Catalog of the SQL statements behind the MSP, ITRS, macroeconomics and FSP
+profile readers.
+
+Every value that changes between calls (periods, institution codes, frequency)
+is a bind variable, so each statement has one fixed text per table and Oracle
+can share the parsed cursor across banks and periods. Only identifiers that
+cannot be bound, the schema-qualified ``{table_name}`` and the institution
+``{condition}``, are filled in with ``str.format`` from a closed set of values.
+"""
+import re
+
+
+BIND_PATTERN = re.compile(r"(?<!:):([A-Za-z_][A-Za-z0-9_]*)")
+
+
+# Collection type used to bind a list of institution codes in one value.
+INSTITUTION_LIST_TYPE = "SYS.ODCIVARCHAR2LIST"
+
+
+class ExcludedInstitutions(tuple):
+    """Institution codes to leave out: selects every other row, including rows without a code."""
+
+
+def institution_condition(bank_code, column: str = "INSTITUTIONCODE") -> str:
+    """
+    Return the institution predicate; '*' selects all institutions.
+
+    A list or tuple of codes is matched against the single collection bind
+    :bank_codes, so the statement text and the number of round trips do not
+    depend on how many codes are requested. ExcludedInstitutions codes are
+    bound the same way and negated.
+    """
+    if isinstance(bank_code, ExcludedInstitutions):
+        return f"({column} IS NULL OR {column} NOT IN (SELECT COLUMN_VALUE FROM TABLE(:bank_codes)))"
+    if isinstance(bank_code, (list, tuple)):
+        return f"{column} IN (SELECT COLUMN_VALUE FROM TABLE(:bank_codes))"
+    return "1=1" if bank_code == "*" else f"{column} = :bank_code"
+
+
+def institution_binds(bank_code) -> dict:
+    """
+    Return the bind values matching institution_condition() for `bank_code`.
+
+    A code list is passed through as a Python list; DatabaseConnection turns
+    it into an INSTITUTION_LIST_TYPE collection on the executing session.
+    """
+    if isinstance(bank_code, (list, tuple)):
+        return {"bank_codes": [str(code) for code in bank_code]}
+    return {"bank_code": bank_code}
+
+
+def bind_params(sql: str, **values) -> dict:
+    """
+    Return the subset of `values` whose names appear as bind variables in `sql`.
+
+    oracledb rejects named binds that the statement does not use, so callers
+    can pass every candidate value and let the statement pick what it needs.
+    """
+    names = set(BIND_PATTERN.findall(sql))
+    return {name: value for name, value in values.items() if name in names}
+
+
+MSP_QUERIES = {
+    "CONS01": """SELECT ALL A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.AMOUNT)  AMOUNT
+    FROM {table_name} A where
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by A.DESCRIPTIONNO asc""",
+
+    "01": """SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.AMOUNT FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+    """,
+
+    "CONS02": """SELECT ALL A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.AMOUNT)  AMOUNT, sum(A.YR_TO_DATE_AMOUNT) YR_TO_DATE_AMOUNT
+    FROM {table_name} A where
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by A.DESCRIPTIONNO asc""",
+
+    "02": """SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.AMOUNT, A.YR_TO_DATE_AMOUNT FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+    """,
+
+    "CONS03": """SELECT ALL  A.REPORTINGDATE, A.DESCRIPTIONNO, A.SECTOR, sum( A.BORROWERS) BORROWERS, sum(A.OUTSTANDING_AMOUNT) OUTSTANDING_AMOUNT, sum( A.CURRENT_AMOUNT) CURRENT_AMOUNT, sum(A.ESM) ESM, sum(A.SUBSTANDARD) SUBSTANDARD, sum(A.DOUBTFUL) DOUBTFUL, sum(A.LOSS) LOSS, sum(A.WRITTENOFF) WRITTENOFF FROM {table_name} A
+    where A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.SECTOR
+    order by A.DESCRIPTIONNO""" ,
+
+    "03": """SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.SECTOR, A.BORROWERS, A.OUTSTANDING_AMOUNT, A.CURRENT_AMOUNT, A.ESM, A.SUBSTANDARD, A.DOUBTFUL, A.LOSS, A.WRITTENOFF FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+    """,
+
+    "CONS04": """SELECT ALL A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.BORROWERS) BORROWERS, sum(A.OUTSTANDING_AMOUNT) OUTSTANDING_AMOUNT, avg(A.WA_IRSLA) WA_IRSLA, avg(A.NIRSLA_LOWEST) NIRSLA_LOWEST, avg(A.NIRSLA_HIGHEST) NIRSLA_HIGHEST,
+    avg(A.WA_IRRBA) WA_IRRBA, avg(A.NIRRBA_LOWEST) NIRRBA_LOWEST, avg(A.NIRRBA_HIGHEST) NIRRBA_HIGHEST FROM {table_name} A
+    where
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by A.DESCRIPTIONNO""",
+
+    "04": """SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.BORROWERS, A.OUTSTANDING_AMOUNT, A.WA_IRSLA, A.NIRSLA_LOWEST, A.NIRSLA_HIGHEST,
+    A.WA_IRRBA, A.NIRRBA_LOWEST, A.NIRRBA_HIGHEST FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+    """,
+
+    "CONS05": """SELECT
+    ALL     A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.AMOUNT)  AMOUNT
+    FROM {table_name}  A
+    where
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by
+    A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by
+    A.DESCRIPTIONNO""",
+
+    "05": """SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.AMOUNT
+    FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+    """,
+
+    "CONS06": """SELECT
+    ALL     A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS,
+    sum(A.NUMBER_COMPLAINTS) NUMBER_COMPLAINTS, sum(A.VALUE_COMPLAINTS) VALUE_COMPLAINTS, sum(A.COMPLAINTS_IR) COMPLAINTS_IR,
+    sum(A.COMPLAINTS_AGREEMENT) COMPLAINTS_AGREEMENT, sum(A.COMPLAINTS_REPAYMENTS) COMPLAINTS_REPAYMENTS, sum(A.COMPLAINTS_LOAN_ST) COMPLAINTS_LOAN_ST,
+    sum(A.COMPLAINTS_LOAN_PROC) COMPLAINTS_LOAN_PROC, sum(A.COMPLAINTS_OTHERS) COMPLAINTS_OTHERS
+    FROM {table_name} A
+    where
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by
+    A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by
+    A.DESCRIPTIONNO""",
+
+    "06": """SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS,
+    A.NUMBER_COMPLAINTS, A.VALUE_COMPLAINTS, A.COMPLAINTS_IR,
+    A.COMPLAINTS_AGREEMENT, A.COMPLAINTS_REPAYMENTS, A.COMPLAINTS_LOAN_ST,
+    A.COMPLAINTS_LOAN_PROC, A.COMPLAINTS_OTHERS
+    FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+    """,
+
+    "CONS07I": """SELECT ALL  A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.DEPOSIT_TZS) DEPOSIT_TZS, sum(A.DEPOSIT_FOREIGN_EQV_TZS) DEPOSIT_FOREIGN_EQV_TZS,
+    sum(A.DEPOSIT_TOTAL) DEPOSIT_TOTAL , sum(A.LOAN_TZS) LOAN_TZS, sum(A.LOAN_FOREIGN_EQV_TZS) LOAN_FOREIGN_EQV_TZS,
+    sum( A.LOAN_TOTAL) LOAN_TOTAL FROM {table_name} A  where
+    A.DESCRIPTIONNO  between 1 and 29 and
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by A.DESCRIPTIONNO""" ,
+
+    "07": """SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS,
+    A.DEPOSIT_TZS, A.DEPOSIT_FOREIGN_EQV_TZS,
+    A.DEPOSIT_TOTAL , A.LOAN_TZS, A.LOAN_FOREIGN_EQV_TZS,
+    A.LOAN_TOTAL
+    FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+    """,
+
+    "CONS07II": """SELECT ALL  A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.DEPOSIT_TZS) DEPOSIT_TZS , sum(A.DEPOSIT_FOREIGN_EQV_TZS) DEPOSIT_FOREIGN_EQV_TZS,
+    sum(A.DEPOSIT_TOTAL) DEPOSIT_TOTAL, sum(A.LOAN_TZS) LOAN_TZS, sum(A.LOAN_FOREIGN_EQV_TZS) LOAN_FOREIGN_EQV_TZS,
+    sum(A.LOAN_TOTAL) LOAN_TOTAL FROM {table_name} A
+    where
+    A.DESCRIPTIONNO  between 1 and 29 and
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by A.DESCRIPTIONNO""" ,
+
+    "CONS07III": """SELECT ALL     A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.DEPOSIT_TZS) DEPOSIT_TZS, sum(A.DEPOSIT_FOREIGN_EQV_TZS) DEPOSIT_FOREIGN_EQV_TZS,
+    sum(A.DEPOSIT_TOTAL) DEPOSIT_TOTAL , sum(A.LOAN_TZS) LOAN_TZS, sum(A.LOAN_FOREIGN_EQV_TZS) LOAN_FOREIGN_EQV_TZS,
+    sum( A.LOAN_TOTAL) LOAN_TOTAL FROM {table_name}  A  where
+    A.DESCRIPTIONNO  between 1 and 29 and
+    A.REPORTINGDATE  BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by A.DESCRIPTIONNO """ ,
+
+    "CONS07IV": """SELECT ALL  A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.DEPOSIT_TZS) DEPOSIT_TZS, sum(A.DEPOSIT_FOREIGN_EQV_TZS) DEPOSIT_FOREIGN_EQV_TZS,
+    sum(A.DEPOSIT_TOTAL) DEPOSIT_TOTAL , sum(A.LOAN_TZS) LOAN_TZS, sum(A.LOAN_FOREIGN_EQV_TZS) LOAN_FOREIGN_EQV_TZS, sum( A.LOAN_TOTAL) LOAN_TOTAL
+    FROM {table_name} A
+    where
+    A.DESCRIPTIONNO  between 59 and 64 and
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by A.DESCRIPTIONNO""",
+
+    "CONS08": """SELECT ALL A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.AMOUNT) AMOUNT FROM {table_name} A where
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by A.DESCRIPTIONNO""",
+
+    "08": """SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.AMOUNT
+    FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+    """,
+
+    "CONS09": """SELECT ALL    A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, sum(A.LOAN_FEMALE_NUMBER) LOAN_FEMALE_NUMBER, sum(A.LOAN_FEMALE_AMOUNT) LOAN_FEMALE_AMOUNT,
+    sum(A.LOAN_MALE_NUMBER) LOAN_MALE_NUMBER, sum(A.LOAN_MALE_AMOUNT) LOAN_MALE_AMOUNT, sum( A.LOAN_NUMBER) LOAN_NUMBER, sum(A.LOAN_AMOUNT) LOAN_AMOUNT
+    FROM {table_name} A where
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by A.DESCRIPTIONNO""",
+
+    "09": """SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS, A.AMOUNT,
+    A.LOAN_FEMALE_NUMBER, A.LOAN_FEMALE_AMOUNT,
+    A.LOAN_MALE_NUMBER, A.LOAN_MALE_AMOUNT, A.LOAN_NUMBER, A.LOAN_AMOUNT
+    FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+    """,
+
+    "10": """SELECT ALL B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS,
+    A.BRANCHES, A.EMPLOYEES,
+    A.COMPULSORY_SAVINGS, A.BORROWERS_TO35YRS_M, A.BORROWERS_TO35YRS_F, A.BORROWERS_ABOVE35YRS_M,
+    A.BORROWERS_TO35YRS_F, A.BORROWERS_ABOVE35YRS_M,A.BORROWERS_ABOVE35YRS_F,
+    A.LOANS_TO35YRS_M, A.LOANS_TO35YRS_F, A.LOANS_ABOVE35YRS_M,
+    A.LOANS_ABOVE35YRS_F, A.AMOUNT_TO35YRS_M, A.AMOUNT_TO35YRS_F,
+    A.AMOUNT_ABOVE35YRS_M, A.AMOUNT_ABOVE35YRS_F
+    FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+    """,
+
+    "CONS10": """SELECT ALL    A.REPORTINGDATE, A.DESCRIPTIONNO, A.PARTICULARS,
+    sum(A.BRANCHES) BRANCHES, sum(A.EMPLOYEES) EMPLOYEES,
+    sum(A.COMPULSORY_SAVINGS) COMPULSORY_SAVINGS, sum(A.BORROWERS_TO35YRS_M) BORROWERS_TO35YRS_M,
+    sum(A.BORROWERS_TO35YRS_F) BORROWERS_TO35YRS_F, sum(A.BORROWERS_ABOVE35YRS_M) BORROWERS_ABOVE35YRS_M,sum(A.BORROWERS_ABOVE35YRS_F) BORROWERS_ABOVE35YRS_F,
+    sum(A.LOANS_TO35YRS_M) LOANS_TO35YRS_M, sum(A.LOANS_TO35YRS_F) LOANS_TO35YRS_F, sum( A.LOANS_ABOVE35YRS_M) LOANS_ABOVE35YRS_M,
+    sum(A.LOANS_ABOVE35YRS_F) LOANS_ABOVE35YRS_F, sum(A.AMOUNT_TO35YRS_M) AMOUNT_TO35YRS_M, sum(A.AMOUNT_TO35YRS_F) AMOUNT_TO35YRS_F,
+    SUM(A.AMOUNT_ABOVE35YRS_M) AMOUNT_ABOVE35YRS_M, sum(A.AMOUNT_ABOVE35YRS_F) AMOUNT_ABOVE35YRS_F
+    FROM {table_name}  A where
+    A.REPORTINGDATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    group by A.REPORTINGDATE,  A.DESCRIPTIONNO, A.PARTICULARS
+    order by A.DESCRIPTIONNO"""
+}
+
+MSP_DEFAULT_QUERY = """
+    SELECT A.*,B.INSTITUTIONNAME FROM {table_name} A, MSP_INSTITUTION B
+    WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    AND A.INSTITUTIONCODE=B.INSTITUTIONCODE
+    ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO asc
+"""
+
+ITRS_QUERIES = {
+    "RATES": """
+        SELECT ROWNUM AS SNO, A.RA_DATE AS REPORTING_DATE, A.CU_CODE AS CURRENCY,
+               B.CU_DESC AS DESCRIPTION, A.RA_SRATE AS TZS_RATE, A.RA_DRATE AS USD_RATE
+        FROM {table_name} A, ITRS_FI_CURR B
+        WHERE A.RA_DATE BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+          AND A.CU_CODE = B.CU_CODE
+        ORDER BY A.CU_CODE
+    """,
+    "MONITORING": """
+        SELECT ROWNUM AS SNO, A."RETURN NAME", A."EDI RECORDS", A."LAST EDI UPDATE",
+               A."BSIS RECORDS", A."TRANSFORMED RECORDS", A."LAST MIGRATION",
+               TO_CHAR(ROUND(A."MIGRATION PERCENTAGE", 0)) || '%' AS MIGRATION_PERCENTAGE,
+               A."LAST TRANSFORMATION",
+               TO_CHAR(ROUND(A."TRANSFORMATION PERCENTAGE", 0)) || '%' AS TRANSFORMATION_PERCENTAGE,
+               TO_CHAR(ROUND(A."COMPLETION PERCENTAGE", 0)) || '%' AS COMPLETION_PERCENTAGE
+        FROM {table_name} A
+    """,
+    "OVERALL_ANALYSIS": """
+        SELECT *
+        FROM {table_name}
+        WHERE reportingdate BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    """,
+    "TRANSFORMATION_ERRORS": """
+        SELECT ROWNUM AS SNO, ERROR_DATE, ERROR_DETAILS, ERROR_TYPE, ERROR_ID
+        FROM (
+            SELECT ERROR_DATE, ERROR_DETAILS, ERROR_TYPE, ID AS ERROR_ID
+            FROM {table_name}
+            WHERE LAST_DAY(TO_DATE(ERROR_DATE, 'DD-MM-YY') - 31)
+                  BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+            ORDER BY ERROR_DATE DESC
+        )
+    """,
+    "URT_PAYMENTS": """
+        SELECT B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.DESCRIPTIONNO AS SNO, A.REPORTINGDATE,A.PURPOSE, A.PU_CODE AS CODE, A.SECTOR, A.COUNTRY, A.CURRENCY, A.AMOUNT
+        FROM {table_name} A, INSTITUTION B
+        JOIN {table_name}_INSTITUTION B ON A.INSTITUTIONCODE = B.INSTITUTIONCODE
+        WHERE {condition} AND A.INSTITUTIONCODE=B.INSTITUTIONCODE AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+        ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO, A.REPORTINGDATE DESC
+    """,
+    "URT_RECEIPTS": """
+        SELECT B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.DESCRIPTIONNO AS SNO, A.REPORTINGDATE,A.PURPOSE, A.PU_CODE AS CODE, A.SECTOR, A.COUNTRY, A.CURRENCY, A.AMOUNT
+        FROM {table_name} A, INSTITUTION B
+        JOIN {table_name}_INSTITUTION B ON A.INSTITUTIONCODE = B.INSTITUTIONCODE
+        WHERE {condition} AND A.INSTITUTIONCODE=B.INSTITUTIONCODE AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+        ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO, A.REPORTINGDATE DESC
+    """,
+    "ZNZ_PAYMENTS": """
+        SELECT B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.DESCRIPTIONNO AS SNO, A.REPORTINGDATE,A.PURPOSE, A.PU_CODE AS CODE, A.SECTOR, A.COUNTRY, A.CURRENCY, A.AMOUNT
+        FROM {table_name} A, INSTITUTION B
+        JOIN {table_name}_INSTITUTION B ON A.INSTITUTIONCODE = B.INSTITUTIONCODE
+        WHERE {condition} AND A.INSTITUTIONCODE=B.INSTITUTIONCODE AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+        ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO, A.REPORTINGDATE DESC
+    """,
+    "ZNZ_RECEIPTS": """
+        SELECT B.INSTITUTIONNAME, A.INSTITUTIONCODE, A.DESCRIPTIONNO AS SNO, A.REPORTINGDATE,A.PURPOSE, A.PU_CODE AS CODE, A.SECTOR, A.COUNTRY, A.CURRENCY, A.AMOUNT
+        FROM {table_name} A, INSTITUTION B
+        JOIN {table_name}_INSTITUTION B ON A.INSTITUTIONCODE = B.INSTITUTIONCODE
+        WHERE {condition} AND A.INSTITUTIONCODE=B.INSTITUTIONCODE AND TRUNC(A.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+        ORDER BY B.INSTITUTIONNAME, A.INSTITUTIONCODE,A.DESCRIPTIONNO, A.REPORTINGDATE DESC
+    """,
+    "URT_PAYMENTS_FINAL": """
+        SELECT DESCRIPTIONNO AS SNO, REPORTINGDATE, PURPOSE, PU_CODE AS CODE, SECTOR, COUNTRY, CURRENCY,
+               AMOUNT_IN_ORIG_CURRENCY, AMOUNT_IN_USD_EQV, AMOUNT_IN_TZS_EQV
+        FROM {table_name}
+        WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+        ORDER BY REPORTINGDATE DESC, SNO
+    """,
+    "URT_RECEIPTS_FINAL": """
+        SELECT DESCRIPTIONNO AS SNO, REPORTINGDATE, PURPOSE, PU_CODE AS CODE, SECTOR, COUNTRY, CURRENCY,
+               AMOUNT_IN_ORIG_CURRENCY, AMOUNT_IN_USD_EQV, AMOUNT_IN_TZS_EQV
+        FROM {table_name}
+        WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+        ORDER BY REPORTINGDATE DESC, SNO
+    """,
+    "ZNZ_PAYMENTS_FINAL": """
+        SELECT DESCRIPTIONNO AS SNO, REPORTINGDATE, PURPOSE, PU_CODE AS CODE, SECTOR, COUNTRY, CURRENCY,
+               AMOUNT_IN_ORIG_CURRENCY, AMOUNT_IN_USD_EQV, AMOUNT_IN_TZS_EQV
+        FROM {table_name}
+        WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+        ORDER BY REPORTINGDATE DESC, SNO
+    """,
+    "ZNZ_RECEIPTS_FINAL": """
+        SELECT DESCRIPTIONNO AS SNO, REPORTINGDATE, PURPOSE, PU_CODE AS CODE, SECTOR, COUNTRY, CURRENCY,
+               AMOUNT_IN_ORIG_CURRENCY, AMOUNT_IN_USD_EQV, AMOUNT_IN_TZS_EQV
+        FROM {table_name}
+        WHERE {condition} AND TRUNC(REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+        ORDER BY REPORTINGDATE DESC, SNO
+    """
+}
+
+MACROECONOMICS_QUERIES = {
+    "CPI": """
+        SELECT
+            T.TIME_PERIOD,
+            T.YEAR,
+            T.MONTH,
+            L.LOCATION_NAME,
+            L.LOCATION_ISO,
+            I.INDICATOR_NAME,
+            I.DESCRIPTION AS INDICATOR_DESCRIPTION,
+            F.VALUE,
+            U.UNIT,
+            FR.FREQUENCY,
+            S.SOURCE
+    FROM {table_name} F
+    JOIN DWH.DIM_TIME T       ON F.TIME_ID = T.TIME_ID
+    JOIN DWH.DIM_LOCATION L   ON F.LOCATION_ID = L.LOCATION_ID
+    JOIN DWH.DIM_INDICATOR I  ON F.INDICATOR_ID = I.INDICATOR_ID
+    JOIN DWH.DIM_UNITS U      ON F.UNIT_ID = U.UNIT_ID
+    JOIN DWH.DIM_FREQ FR      ON F.FREQ_ID = FR.FREQ_ID
+    JOIN DWH.DIM_SOURCES S    ON F.SOURCE_ID = S.SOURCE_ID
+    WHERE
+        T.TIME_PERIOD BETWEEN :start_period AND :end_period
+        AND FR.FREQUENCY = :frequency -- Takes 'M' from 'MONTHLY', 'Q' from 'QUARTERLY'
+    """,
+
+    "BOP": """
+        SELECT
+            T.TIME_PERIOD,
+            T.YEAR,
+            T.MONTH,
+            T.QUARTER,
+            L.LOCATION_NAME,
+            I.INDICATOR_NAME,
+            I.DESCRIPTION AS INDICATOR_DESCRIPTION,
+            F.VALUE,
+            U.UNIT,
+            FR.FREQUENCY,
+            S.SOURCE
+    FROM {table_name} F
+    JOIN DWH.DIM_TIME T        ON F.TIME_ID = T.TIME_ID
+    JOIN DWH.DIM_LOCATION L    ON F.LOCATION_ID = L.LOCATION_ID
+    JOIN DWH.DIM_INDICATOR I   ON F.INDICATOR_ID = I.INDICATOR_ID
+    JOIN DWH.DIM_UNITS U       ON F.UNIT_ID = U.UNIT_ID
+    JOIN DWH.DIM_FREQ FR       ON F.FREQ_ID = FR.FREQ_ID
+    JOIN DWH.DIM_SOURCES S     ON F.SOURCE_ID = S.SOURCE_ID
+        WHERE
+            T.TIME_PERIOD BETWEEN :start_period AND :end_period
+            AND FR.FREQUENCY = :frequency -- Balance of Payments is often reported Quarterly ('Q')
+            ORDER BY T.TIME_PERIOD DESC"""
+}
+
+BOP_TEMPLATE_QUERY = """
+    SELECT DESCRIPTIONNO, PURPOSE, RECEIPTS_CODE, PAYMENTS_CODE
+    FROM {table_name}
+    ORDER BY DESCRIPTIONNO ASC
+"""
+
+# USD totals of every purpose code of one ITRS FINAL table on one reporting
+# date, in one grouped scan.
+BOP_SUMS_QUERY = """
+    SELECT PU_CODE, SUM(NVL(AMOUNT_IN_USD_EQV, 0)) AS AMOUNT
+    FROM {table_name}
+    WHERE TRUNC(REPORTINGDATE) = TO_DATE(:reporting_date, 'DD-MON-YYYY')
+    GROUP BY PU_CODE
+"""
+
+# USD totals of every purpose code and reporting date of one ITRS FINAL table, in one grouped scan.
+BOP_SERIES_QUERY = """
+    SELECT TRUNC(REPORTINGDATE) AS REPORTINGDATE, PU_CODE, SUM(NVL(AMOUNT_IN_USD_EQV, 0)) AS AMOUNT
+    FROM {table_name}
+    WHERE TRUNC(REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    GROUP BY TRUNC(REPORTINGDATE), PU_CODE
+"""
+
+# Compact ITRS_DETAIL extract behind every country/sector pivot, one row per
+# reporting date, country, sector, purpose and location.
+ITRS_DETAIL_EXTRACT_QUERY = """
+    SELECT TRUNC(REPORTINGDATE) AS REPORTINGDATE, COUNTRY, SECTOR, PURPOSE, TRANSACTION_LOCATION,
+           SUM(AMOUNT_IN_TZS_EQV) AS AMOUNT_TZS, SUM(AMOUNT_IN_USD_EQV) AS AMOUNT_USD
+    FROM {table_name}
+    WHERE reportingdate BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+    GROUP BY TRUNC(REPORTINGDATE), COUNTRY, SECTOR, PURPOSE, TRANSACTION_LOCATION
+"""
+
+# ITRS exchange rates from a reporting date onwards, for the incremental rates store.
+RATES_SINCE_QUERY = """
+    SELECT A.RA_DATE AS REPORTING_DATE, A.CU_CODE AS CURRENCY, B.CU_DESC AS DESCRIPTION,
+           A.RA_SRATE AS TZS_RATE, A.RA_DRATE AS USD_RATE
+    FROM {table_name} A, ITRS_FI_CURR B
+    WHERE A.RA_DATE >= TO_DATE(:since, 'DD-MON-YYYY')
+      AND A.CU_CODE = B.CU_CODE
+"""
+
+# Authorised MSP submissions per institution, return and reporting date, for
+# the cache invalidator.
+SUBMISSION_CHANGES_QUERY = """
+    SELECT A.BANKCODE AS INSTITUTIONCODE, UPPER(TRIM(C.SUBMISSIONNAME)) AS SUBMISSIONNAME,
+           TRUNC(B.REPORTINGDATE) AS REPORTINGDATE, A.AUTHORIZEDDATE
+    FROM {schema}BSIS_SUBMISSION_STATUS@BSIS_TO_EDI A, {schema}BSIS_SUBMISSION_PERIOD@BSIS_TO_EDI B,
+         {schema}BSIS_SUBMISSION@BSIS_TO_EDI C
+    WHERE A.PERIODID = B.PERIODID AND A.SUBMISSIONID = C.SUBMISSIONID
+      AND A.AUTHORIZEDDATE IS NOT NULL
+      AND TRUNC(B.REPORTINGDATE) BETWEEN TO_DATE(:start_period, 'DD-MON-YYYY') AND TO_DATE(:end_period, 'DD-MON-YYYY')
+"""
+
+INSTITUTION_CODES_QUERY = """
+    SELECT INSTITUTIONCODE FROM {table_name}
+    ORDER BY INSTITUTIONCODE
+"""
+
+PROFILE_QUERY = """
+    SELECT * FROM {table_name}
+    WHERE {condition}
+"""
+
+
+def get_query(catalog: dict, data_type: str, default: str = None, **identifiers) -> str:
+    """Look up `data_type` in `catalog` and fill in the table/condition identifiers."""
+    template = catalog.get(data_type, default)
+    if template is None:
+        return None
+    return template.format(**identifiers)
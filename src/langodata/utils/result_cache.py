@@ -0,0 +1,205 @@
+"""
+In-process LRU cache of read_data() and read_profile() results.
+
+Entries are keyed by the request tuple and accounted by their in-memory size
+(``memory_usage(deep=True)`` for DataFrames, ``nbytes`` for Arrow tables).
+The least recently used entries are evicted once RESULT_CACHE_MAX_BYTES is
+exceeded, and every entry expires after the TTL of its data group. Cached
+frames are handed out as copy-on-write views, so a caller modifying its
+result never changes what the next caller gets.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from langodata.utils.tracing import record_metrics, result_size
+
+
+# Seconds a cached result stays valid, per data group; override with e.g.
+# RESULT_CACHE_TTL_ITRS, or at runtime through configure_result_cache().
+DEFAULT_TTL = {
+    "MSP": 3600,
+    "ITRS": 900,
+    "MACROECONOMICS": 86400,
+    "SUBMISSIONS": 300,
+}
+DEFAULT_TTL_SECONDS = int(os.getenv("RESULT_CACHE_TTL", "600"))
+
+_settings = {
+    "enabled": os.getenv("LANGODATA_RESULT_CACHE", "false").strip().lower() in ("1", "true", "yes"),
+    "max_bytes": int(os.getenv("RESULT_CACHE_MAX_BYTES", str(512 * 1024 ** 2))),
+    "copy_on_write": os.getenv("RESULT_CACHE_COPY_ON_WRITE", "true").strip().lower() not in ("0", "false", "no"),
+    "ttl": {},
+}
+_entries = OrderedDict()
+_counters = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+_current_bytes = 0
+_cache_lock = threading.Lock()
+
+
+def configure_result_cache(enabled: bool = None, max_bytes: int = None, ttl: dict = None,
+                           copy_on_write: bool = None):
+    """
+    Change the in-process result cache settings.
+
+    Args:
+        enabled (bool): Turn the cache on or off (LANGODATA_RESULT_CACHE).
+        max_bytes (int): Memory budget for all cached results.
+        ttl (dict): Seconds to keep results, keyed by data group.
+        copy_on_write (bool): Hand out copy-on-write views (True) or the
+            cached objects themselves (False).
+
+    Raises:
+        ValueError: If max_bytes or a TTL is negative.
+    """
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError(f"Invalid max_bytes: {max_bytes}")
+    if ttl and any(seconds < 0 for seconds in ttl.values()):
+        raise ValueError(f"Invalid ttl: {ttl}")
+    with _cache_lock:
+        if enabled is not None:
+            _settings["enabled"] = enabled
+        if max_bytes is not None:
+            _settings["max_bytes"] = max_bytes
+        if copy_on_write is not None:
+            _settings["copy_on_write"] = copy_on_write
+        if ttl:
+            _settings["ttl"].update(ttl)
+        _evict_over_budget()
+
+
+def result_cache_enabled() -> bool:
+    return _settings["enabled"]
+
+
+def group_ttl(data_group: str) -> int:
+    """TTL in seconds for a data group."""
+    if data_group in _settings["ttl"]:
+        return _settings["ttl"][data_group]
+    value = os.getenv(f"RESULT_CACHE_TTL_{data_group.replace('-', '_')}")
+    return int(value) if value else DEFAULT_TTL.get(data_group, DEFAULT_TTL_SECONDS)
+
+
+def _copy_on_write_active() -> bool:
+    """pandas 3 always copies on write; pandas 2 does when mode.copy_on_write is set."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def _view(df):
+    """Return a result that a caller can modify without touching the cached one."""
+    if not isinstance(df, pd.DataFrame) or not _settings["copy_on_write"]:
+        # Arrow tables are immutable and can be shared as they are
+        return df
+    return df.copy(deep=not _copy_on_write_active())
+
+
+def _remove(key):
+    global _current_bytes
+    entry = _entries.pop(key)
+    _current_bytes -= entry["size"]
+
+
+def _evict_over_budget():
+    while _entries and _current_bytes > _settings["max_bytes"]:
+        _remove(next(iter(_entries)))
+        _counters["evictions"] += 1
+
+
+def get_result(key, data_group: str):
+    """
+    Return a cached feedback dictionary for `key`, or None.
+
+    The entry becomes the most recently used; expired entries are dropped.
+    """
+    with _cache_lock:
+        entry = _entries.get(key)
+        if entry is not None and time.monotonic() - entry["stored"] > group_ttl(data_group):
+            _remove(key)
+            _counters["expired"] += 1
+            entry = None
+        if entry is None:
+            _counters["misses"] += 1
+            record_metrics(result_cache_misses=1)
+            return None
+        _entries.move_to_end(key)
+        _counters["hits"] += 1
+    record_metrics(result_cache_hits=1)
+    return {"info": entry["info"], "debug": entry["debug"], "df": _view(entry["df"])}
+
+
+def store_result(key, feedback: dict, keep_empty: bool = False):
+    """
+    Cache a successful, materialised feedback dictionary under `key`.
+
+    Failed and streamed results are not cached, nor is a result larger than
+    the whole budget; empty results only with ``keep_empty``. Returns the
+    feedback to hand to the caller.
+    """
+    global _current_bytes
+    df = feedback.get("df")
+    if feedback.get("debug") or not hasattr(df, "__len__") or (len(df) == 0 and not keep_empty):
+        return feedback
+    size = result_size(df)
+    if size > _settings["max_bytes"]:
+        return feedback
+    with _cache_lock:
+        if key in _entries:
+            _remove(key)
+        _entries[key] = {"info": feedback.get("info", ""), "debug": "", "df": df,
+                         "size": size, "stored": time.monotonic(), "stored_at": time.time()}
+        _current_bytes += size
+        _evict_over_budget()
+    return dict(feedback, df=_view(df))
+
+
+def lookup_index(key, column: str):
+    """
+    Return the cached frame under `key` and the row positions of each value of `column`.
+
+    The index is built on first use and kept with the entry, so it is evicted
+    and expired together with the frame. Returns (None, None) when `key` is
+    not cached. The frame returned is the cached object and must not be modified.
+    """
+    with _cache_lock:
+        entry = _entries.get(key)
+        if entry is None or column not in getattr(entry["df"], "columns", ()):
+            return None, None
+        indexes = entry.setdefault("indexes", {})
+        if column not in indexes:
+            indexes[column] = entry["df"].groupby(column, sort=False).indices
+        return entry["df"], indexes[column]
+
+
+def cached_keys(kind: str) -> list:
+    """Return ``(key, stored_at)`` for every entry whose key starts with `kind`, e.g. "period"."""
+    with _cache_lock:
+        return [(key, entry["stored_at"]) for key, entry in _entries.items() if key[0] == kind]
+
+
+def discard_result(key) -> bool:
+    """Drop one entry; returns False when it was not cached."""
+    with _cache_lock:
+        if key not in _entries:
+            return False
+        _remove(key)
+        return True
+
+
+def clear_result_cache(data_group: str = None):
+    """Drop every cached result, or only those of one data group."""
+    with _cache_lock:
+        for key in [key for key in _entries if data_group is None or key[1] == data_group]:
+            _remove(key)
+
+
+def result_cache_stats() -> dict:
+    """Return entry count, bytes used and hit, miss, eviction and expiry counters."""
+    with _cache_lock:
+        return {"entries": len(_entries), "bytes": _current_bytes,
+                "max_bytes": _settings["max_bytes"], **_counters}
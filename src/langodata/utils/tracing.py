@@ -0,0 +1,140 @@
+"""
+Lightweight per-phase tracing for the data readers.
+
+read_data() opens a trace for each call; code running inside it wraps its
+phases in span() and reports counters with record_metrics(). Without an
+active trace both are no-ops, so DatabaseConnection can be traced without
+threading a tracer through every reader signature.
+
+Finished traces can be appended to a local JSON Lines file, one span per
+line, by setting LANGODATA_TRACE_FILE or calling set_trace_file().
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+
+_current_trace = contextvars.ContextVar("langodata_trace", default=None)
+_trace_file = os.getenv("LANGODATA_TRACE_FILE")
+_export_lock = threading.Lock()
+
+
+class Trace:
+    """Spans and counters collected while serving one request."""
+
+    def __init__(self, name, **attributes):
+        self.trace_id = uuid.uuid4().hex
+        self.name = name
+        self.attributes = attributes
+        self.spans = []
+        self.metrics = {}
+        self.started = time.perf_counter()
+        self.elapsed = None
+        self._lock = threading.Lock()
+
+    def add_span(self, name, elapsed, attributes):
+        with self._lock:
+            self.spans.append({"name": name, "elapsed": elapsed, **attributes})
+
+    def add_metrics(self, **values):
+        with self._lock:
+            for key, value in values.items():
+                self.metrics[key] = self.metrics.get(key, 0) + value
+
+    def set_metric(self, key, value):
+        with self._lock:
+            self.metrics[key] = value
+
+    def timings(self) -> dict:
+        """Seconds spent per phase; repeated phases are summed."""
+        timings = {}
+        with self._lock:
+            for span_record in self.spans:
+                timings[span_record["name"]] = timings.get(span_record["name"], 0.0) + span_record["elapsed"]
+        timings["total"] = self.elapsed if self.elapsed is not None else time.perf_counter() - self.started
+        return {name: round(seconds, 6) for name, seconds in timings.items()}
+
+    def summary(self) -> dict:
+        """Return the ``timings`` and ``metrics`` sections added to reader feedback."""
+        with self._lock:
+            metrics = dict(self.metrics)
+        return {"timings": self.timings(), "metrics": metrics}
+
+
+def current_trace():
+    """Return the trace active in this context, or None."""
+    return _current_trace.get()
+
+
+def set_trace_file(path):
+    """Append finished traces to `path` as JSON Lines; None disables export."""
+    global _trace_file
+    _trace_file = path
+
+
+@contextmanager
+def start_trace(name, **attributes):
+    """Make a new Trace current for the duration of the block and export it on exit."""
+    trace = Trace(name, **attributes)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        trace.elapsed = time.perf_counter() - trace.started
+        _current_trace.reset(token)
+        if _trace_file:
+            export_trace(trace, _trace_file)
+
+
+@contextmanager
+def span(name, **attributes):
+    """Time a phase of the current trace; does nothing when no trace is active."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, time.perf_counter() - started, attributes)
+
+
+def record_metrics(**values):
+    """Add counters such as rows, bytes or round_trips to the current trace."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add_metrics(**values)
+
+
+def set_metric(key, value):
+    """Store a non-additive value, such as a partition plan, in the current trace's metrics."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.set_metric(key, value)
+
+
+def result_size(result) -> int:
+    """Approximate in-memory size in bytes of a DataFrame or pyarrow Table."""
+    if hasattr(result, "nbytes"):
+        return int(result.nbytes)
+    if hasattr(result, "memory_usage"):
+        return int(result.memory_usage(deep=True).sum())
+    return 0
+
+
+def export_trace(trace, path):
+    """Append every span of `trace` to `path`, one JSON object per line."""
+    with _export_lock:
+        with open(path, "a") as handle:
+            for span_record in trace.spans:
+                handle.write(json.dumps({"trace_id": trace.trace_id, "trace": trace.name,
+                                         **trace.attributes, **span_record}, default=str) + "\n")
+            handle.write(json.dumps({"trace_id": trace.trace_id, "trace": trace.name, **trace.attributes,
+                                     "name": "total", "elapsed": trace.elapsed,
+                                     "metrics": trace.metrics}, default=str) + "\n")
@@ -0,0 +1,24 @@
+class RecordingConnection:
+    """
+    Base for the DatabaseConnection stand-ins of the reader tests: records
+    every statement with its binds and answers it with ``answer()``, which
+    each test module implements for the statements of the reader under test.
+    """
+
+    def __init__(self):
+        self.statements = []
+        self.params = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def fetch_dataframe(self, query, params=None, columns=None, output_format="pandas"):
+        self.statements.append(query)
+        self.params.append(params)
+        return self.answer(query, params, columns)
+
+    def answer(self, query, params, columns):
+        raise NotImplementedError
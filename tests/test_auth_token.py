@@ -0,0 +1,57 @@
+from langodata.utils import auth_token
+
+
+def test_cached_token_is_shared_and_renewed(tmp_path, monkeypatch):
+    """
+    A token written by one process is picked up from the cache file without
+    prompting, and renewal keeps the original login time.
+    """
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.setattr(auth_token, "TOKEN_CACHE_FILE", str(tmp_path / "token"))
+    monkeypatch.delenv("USER_TOKEN", raising=False)
+
+    token = auth_token.generate_token("ANALYST")
+    auth_token.store_token(token)
+    monkeypatch.delenv("USER_TOKEN")
+
+    assert auth_token.get_cached_token() == token
+    renewed = auth_token.renew_token(token)
+    assert auth_token.verify_token(renewed)["auth_time"] == auth_token.verify_token(token)["auth_time"]
+
+
+def test_non_interactive_login_does_not_prompt(tmp_path, monkeypatch):
+    """
+    Without a token, credentials or a terminal, authentication fails fast.
+    """
+    monkeypatch.setattr(auth_token, "TOKEN_CACHE_FILE", str(tmp_path / "token"))
+    monkeypatch.delenv("USER_TOKEN", raising=False)
+    monkeypatch.delenv("LANGODATA_USERNAME", raising=False)
+    monkeypatch.setattr(auth_token.sys, "stdin", None)
+    monkeypatch.setattr("builtins.input", lambda *a: (_ for _ in ()).throw(AssertionError("prompted")))
+
+    assert auth_token.authenticate_user("BSIS") is None
+
+
+def test_refresh_adopts_a_token_renewed_by_another_process(tmp_path, monkeypatch):
+    """
+    A later-expiring token in the cache file is adopted instead of renewing,
+    even while USER_TOKEN still holds the old, valid token.
+    """
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.setattr(auth_token, "TOKEN_CACHE_FILE", str(tmp_path / "token"))
+    token = auth_token.generate_token("ANALYST")
+    auth_token.store_token(token)
+
+    renewed = []
+    renew = auth_token.renew_token
+    monkeypatch.setattr(auth_token, "renew_token", lambda old: renewed.append(old) or renew(old))
+    assert auth_token.verify_token(auth_token.refresh_token(token))
+    assert renewed == [token]
+
+    monkeypatch.setattr(auth_token, "TOKEN_LIFETIME_MINUTES", 45)
+    other = auth_token.generate_token("ANALYST")
+    with open(auth_token.TOKEN_CACHE_FILE, "w") as handle:
+        handle.write(other)
+    monkeypatch.setenv("USER_TOKEN", token)
+    assert auth_token.refresh_token(token) == other
+    assert renewed == [token]
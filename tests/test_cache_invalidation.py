@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from langodata.utils import cache_invalidation, data_reader, itrs_data, result_cache
+from tests.fakes import RecordingConnection
+
+
+class FakeSubmissionLog(RecordingConnection):
+    """Answers the submission log query with the authorisations reported within the bound periods."""
+
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+
+    def answer(self, query, params, columns):
+        assert "BSIS_SUBMISSION_STATUS" in query
+        start, end = (pd.to_datetime(params[bound], format="%d-%b-%Y") for bound in ("start_period", "end_period"))
+        return pd.DataFrame([row for row in self.rows if start <= row[2] <= end], columns=columns)
+
+
+def test_only_changed_partitions_are_evicted(monkeypatch):
+    """
+    A newer LAST TRANSFORMATION evicts that FINAL table's months, and a newer
+    AUTHORIZEDDATE evicts only the matching institution and month.
+    """
+    def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+        dates = pd.date_range(start_period, end_period, freq="ME")
+        return {"info": "Fetched.", "debug": "",
+                "df": pd.DataFrame({"REPORTINGDATE": dates, "INSTITUTIONCODE": bank_code})}
+
+    later = datetime.now() + timedelta(hours=1)
+    monitoring = pd.DataFrame({"RETURN NAME": ["URT Payments", "ZNZ Receipts"],
+                               "LAST MIGRATION": [later, datetime(2020, 1, 1)],
+                               "LAST TRANSFORMATION": [later, datetime(2020, 1, 1)]})
+    submissions = FakeSubmissionLog([("M100", "MSP2_02", datetime(2024, 1, 31), later),
+                                     ("M200", "UNKNOWN 02", datetime(2024, 1, 31), later),
+                                     ("M100", "MSP2_02", datetime(2023, 12, 31), later)])
+    monkeypatch.setattr(cache_invalidation, "DatabaseConnection", lambda data_source: submissions)
+
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_msp_data", fake_reader)
+    monkeypatch.setattr(data_reader, "read_itrs_data", fake_reader)
+    monkeypatch.setattr(cache_invalidation, "cached_months", lambda: [])
+    monkeypatch.setattr(cache_invalidation, "read_itrs_data",
+                        lambda *args: {"info": "Fetched.", "debug": "", "df": monitoring})
+    monkeypatch.setattr(result_cache, "_settings", dict(result_cache._settings, enabled=True, ttl={}))
+    result_cache.clear_result_cache()
+
+    for data_type in ("URT_PAYMENTS_FINAL", "ZNZ_RECEIPTS_FINAL"):
+        data_reader.read_data("ITRS", "BSIS", data_type, "*", "01-JAN-2024", "29-FEB-2024")
+    for bank_code in ("M100", "M200"):
+        data_reader.read_data("MSP", "BSIS", "02", bank_code, "01-JAN-2024", "29-FEB-2024")
+
+    feedback = cache_invalidation.invalidate_stale_partitions()
+
+    evicted = set(zip(feedback["df"]["data_type"], feedback["df"]["institution"], feedback["df"]["month"]))
+    assert evicted == {("URT_PAYMENTS_FINAL", "*", "2024-01"), ("URT_PAYMENTS_FINAL", "*", "2024-02"),
+                       ("02", "M100", "2024-01")}
+    assert result_cache.result_cache_stats()["entries"] == 5
+    assert submissions.params == [{"start_period": "01-JAN-2024", "end_period": "29-FEB-2024"}]
+    assert "BSIS_DEV.BSIS_SUBMISSION_STATUS@BSIS_TO_EDI" in submissions.statements[0]
+    result_cache.clear_result_cache()
+
+
+def test_untracked_partitions_age_out(monkeypatch):
+    """OVERALL_ANALYSIS has no change source and is evicted by age only."""
+    monkeypatch.setattr(cache_invalidation, "UNTRACKED_MAX_AGE", 3600)
+    partition = {"data_group": "ITRS", "data_type": "OVERALL_ANALYSIS", "month": "2024-01",
+                 "cached_at": datetime.now() - timedelta(hours=2)}
+
+    assert cache_invalidation.is_stale(partition, {}, {})
+    assert not cache_invalidation.is_stale(dict(partition, cached_at=datetime.now()), {}, {})
+    assert not cache_invalidation.is_stale(dict(partition, data_type="URT_PAYMENTS_FINAL"), {}, {})
+
+
+def test_monitoring_table_name_is_formatted():
+    """The ITRS prefix is filled into the MONITORING table name rather than left as '{itrs_prefix}'."""
+    assert itrs_data.get_table_name("MONITORING", "BSIS_DEV.") == "SYS.ITRS_MONITORING"
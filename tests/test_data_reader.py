@@ -0,0 +1,45 @@
+import threading
+import time
+
+import pandas as pd
+
+from langodata.utils import data_reader
+
+
+def test_read_many_validates_once_and_runs_concurrently(monkeypatch):
+    """
+    A batch authenticates once per data group, runs extracts in parallel and
+    returns feedback keyed by request, with per-request errors.
+    """
+    env_checks = []
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.pop()
+        if bank_code == "BAD":
+            raise RuntimeError("ORA-00942")
+        return {"info": "", "debug": "", "df": pd.DataFrame({"TYPE": [data_type], "BANK": [bank_code]})}
+
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: env_checks.append(data_group))
+    monkeypatch.setattr(data_reader, "read_msp_data", fake_reader)
+    monkeypatch.setattr(data_reader, "source_pool_size", lambda data_source: 3)
+
+    requests = [("MSP", "BSIS", f"{t:02}", bank, "31-JAN-2024", "31-JAN-2024")
+                for t in range(1, 5) for bank in ("M100", "M200")]
+    requests.append({"data_group": "MSP", "data_source": "BSIS", "data_type": "01", "bank_code": "BAD",
+                     "start_period": "31-JAN-2024", "end_period": "31-JAN-2024"})
+    results = data_reader.read_many(requests, max_workers=8)
+
+    assert env_checks == ["MSP"]
+    assert len(results) == 9
+    assert 1 < max(peak) <= 3
+    good = results[("MSP", "BSIS", "03", "M200", "31-JAN-2024", "31-JAN-2024")]
+    assert good["df"]["TYPE"][0] == "03" and "total" in good["timings"]
+    assert "ORA-00942" in results[("MSP", "BSIS", "01", "BAD", "31-JAN-2024", "31-JAN-2024")]["debug"]
@@ -0,0 +1,367 @@
+import pytest
+
+from langodata.utils import database
+from langodata.utils.decryption import encrypt
+
+
+class FakePool:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.min = kwargs.get("min")
+        self.max = kwargs.get("max")
+        self.increment = kwargs.get("increment")
+        self.opened = self.min
+        self.busy = 0
+        self.closed = False
+
+    def acquire(self):
+        self.busy += 1
+        return object()
+
+    def release(self, conn):
+        self.busy -= 1
+
+    def close(self, force=False):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pools(monkeypatch):
+    created = []
+
+    def create_pool(**kwargs):
+        pool = FakePool(**kwargs)
+        created.append(pool)
+        return pool
+
+    for user_env, password_env, dsn_env in database.CREDENTIAL_ENV.values():
+        monkeypatch.setenv(user_env, encrypt("user"))
+        monkeypatch.setenv(password_env, encrypt("secret"))
+        monkeypatch.setenv(dsn_env, "localhost/XE")
+    monkeypatch.delenv("DB_POOL_ENABLED", raising=False)
+    monkeypatch.setattr(database.oracledb, "create_pool", create_pool)
+    database.close_pools()
+    database._pool_settings.clear()
+    yield created
+    database.close_pools()
+    database._pool_settings.clear()
+
+
+def test_one_pool_per_source_is_reused(fake_pools):
+    """
+    Repeated connections to the same source share one lazily created pool
+    and hand their sessions back on exit.
+    """
+    for _ in range(3):
+        with database.DatabaseConnection("BSIS"):
+            pass
+    with database.DatabaseConnection("EDI"):
+        pass
+
+    assert len(fake_pools) == 2, "Expected one pool per data source"
+    stats = database.pool_stats()
+    assert stats["BSIS"]["acquired"] == 3
+    assert stats["BSIS"]["released"] == 3
+    assert stats["BSIS"]["busy"] == 0
+
+
+def test_configure_pool_overrides_environment(fake_pools, monkeypatch):
+    """
+    Explicit pool options win over DB_POOL_* environment defaults.
+    """
+    monkeypatch.setenv("DB_POOL_MAX", "8")
+    database.configure_pool("DWH", min=2, increment=2)
+
+    with database.DatabaseConnection("DWH"):
+        pass
+
+    kwargs = fake_pools[0].kwargs
+    assert (kwargs["min"], kwargs["max"], kwargs["increment"]) == (2, 8, 2)
+
+    with pytest.raises(ValueError):
+        database.configure_pool("DWH", max=10)
+
+
+class FakeSessionCursor:
+    def __init__(self, executed):
+        self.executed = executed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement):
+        self.executed.append(statement)
+
+
+class FakeSession:
+    def __init__(self):
+        self.executed = []
+        self.module = None
+
+    def cursor(self):
+        return FakeSessionCursor(self.executed)
+
+    def close(self):
+        pass
+
+
+def test_standalone_connection_gets_the_pooled_session_setup(fake_pools, monkeypatch):
+    """
+    With pooling disabled a connection still pins NLS_DATE_FORMAT and runs
+    the configured session callback, so dates behave the same either way.
+    """
+    sessions = []
+    monkeypatch.setenv("DB_POOL_ENABLED", "false")
+    monkeypatch.setattr(database.oracledb, "connect", lambda **kwargs: sessions.append(FakeSession()) or sessions[-1])
+    database.configure_pool("BSIS", session_callback=lambda connection, tag: connection.executed.append("CALLBACK"))
+
+    with database.DatabaseConnection("BSIS"):
+        pass
+
+    assert sessions[0].executed == ["ALTER SESSION SET NLS_DATE_FORMAT = 'DD-MON-YYYY'", "CALLBACK"]
+    assert sessions[0].module == database.APP_NAME and not fake_pools
+
+
+class FakeArrowSession:
+    """An oracledb session on the Arrow fetch path, answering every statement with typed columns."""
+
+    def fetch_df_all(self, statement=None, parameters=None, arraysize=None):
+        import pyarrow
+        return pyarrow.table({"INSTITUTIONCODE": ["M100", "M200"], "AMOUNT": [1.5, 2.5]})
+
+
+def test_fetch_dataframe_returns_typed_columns():
+    """
+    The columnar fetch path names columns from the reader mapping and keeps
+    numeric columns numeric for both pandas and Arrow output.
+    """
+    pytest.importorskip("pyarrow")
+    conn = database.DatabaseConnection("UNKNOWN")
+    conn.conn = FakeArrowSession()
+
+    df = conn.fetch_dataframe("SELECT 1 FROM DUAL", columns=["CODE", "VALUE"])
+    table = conn.fetch_dataframe("SELECT 1 FROM DUAL", output_format="arrow")
+
+    assert list(df.columns) == ["CODE", "VALUE"]
+    assert df["VALUE"].dtype == "float64"
+    assert table.num_rows == 2
+    assert table.column_names == ["INSTITUTIONCODE", "AMOUNT"]
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.description = [("INSTITUTIONCODE",), ("AMOUNT",)]
+        self.fetch_sizes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params):
+        return self
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+class FakeCursorConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+def test_iter_dataframes_yields_bounded_batches():
+    """
+    Streaming fetches rows in chunks and never yields more than chunksize rows.
+    """
+    cursor = FakeCursor([(f"M{i}", float(i)) for i in range(10)])
+    conn = database.DatabaseConnection("UNKNOWN")
+    conn.conn = FakeCursorConnection(cursor)
+
+    batches = list(conn.iter_dataframes("SELECT 1 FROM DUAL", chunksize=4, arraysize=2))
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert cursor.arraysize == 2
+    assert list(batches[0].columns) == ["INSTITUTIONCODE", "AMOUNT"]
+
+
+class FakeAsyncCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    async def execute(self, statement, parameters=None):
+        self.connection.pool.statements.append(statement)
+
+
+class FakeAsyncConnection:
+    def __init__(self, pool, session_id):
+        self.pool = pool
+        self.module = None
+        self.session_id = session_id
+        self.serial_num = 1
+
+    def cursor(self):
+        return FakeAsyncCursor(self)
+
+    async def fetch_df_all(self, statement=None, parameters=None, arraysize=None):
+        import asyncio
+        import pyarrow
+        self.pool.in_flight += 1
+        self.pool.peak = max(self.pool.peak, self.pool.in_flight)
+        await asyncio.sleep(0.01)
+        self.pool.in_flight -= 1
+        return pyarrow.table({"INSTITUTIONCODE": [parameters.get("bank_code")], "AMOUNT": [1.0]})
+
+
+class FakeAsyncPool:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.in_flight = 0
+        self.peak = 0
+        self.statements = []
+        self.closed = False
+        self.idle = []
+        self.opened = 0
+
+    async def acquire(self):
+        if self.idle:
+            return self.idle.pop()
+        self.opened += 1
+        return FakeAsyncConnection(self, self.opened)
+
+    async def release(self, conn):
+        self.idle.append(conn)
+
+    async def close(self, force=False):
+        self.closed = True
+
+
+def test_async_reads_share_pool_with_bounded_concurrency(fake_pools, monkeypatch):
+    """
+    Many concurrent async extracts run over one asyncio pool per source and
+    never exceed the configured number in flight.
+    """
+    import asyncio
+    from langodata.utils.msp_data import read_msp_data_async
+
+    pytest.importorskip("pyarrow")
+    created = []
+    monkeypatch.setattr(database.oracledb, "create_pool_async",
+                        lambda **kwargs: created.append(FakeAsyncPool(**kwargs)) or created[-1])
+    monkeypatch.setenv("DB_ASYNC_CONCURRENCY", "2")
+
+    async def run():
+        results = await asyncio.gather(*[
+            read_msp_data_async("MSP", "BSIS", "01", f"M{i}", "31-JAN-2024", "31-JAN-2024") for i in range(6)
+        ])
+        await database.close_async_pools()
+        return results
+
+    results = asyncio.run(run())
+
+    assert [result["df"]["INSTITUTIONCODE"][0] for result in results] == [f"M{i}" for i in range(6)]
+    assert len(created) == 1
+    assert created[0].peak == 2
+
+
+def test_async_sessions_get_the_session_setup_and_a_pool_per_loop(fake_pools, monkeypatch):
+    """
+    Async sessions get the NLS_DATE_FORMAT the readers' date binds rely on,
+    once per session however often it is acquired, and a second event loop
+    gets its own pool rather than replacing the first.
+    """
+    import asyncio
+
+    created = []
+    monkeypatch.setattr(database.oracledb, "create_pool_async",
+                        lambda **kwargs: created.append(FakeAsyncPool(**kwargs)) or created[-1])
+
+    async def run():
+        for _ in range(3):
+            async with database.AsyncDatabaseConnection("BSIS") as conn:
+                module = conn.conn.module
+        return module, database.get_async_pool("BSIS", None, None, None)
+
+    first_module, first_pool = asyncio.run(run())
+    second_module, second_pool = asyncio.run(run())
+
+    assert first_module == second_module == database.APP_NAME
+    assert first_pool.statements == ["ALTER SESSION SET NLS_DATE_FORMAT = 'DD-MON-YYYY'"]
+    assert second_pool is not first_pool and len(created) == 2
+    assert list(database._async_pools.values()) == [second_pool]
+    database._async_pools.clear()
+    database._async_sessions.clear()
+
+
+class FakeCollectionType:
+    def newobject(self, values):
+        return ("COLLECTION", tuple(values))
+
+
+class FakeCollectionSession(FakeArrowSession):
+    """Hands out the institution list collection type and records what was executed."""
+
+    def __init__(self):
+        self.executed = []
+
+    def gettype(self, name):
+        assert name == database.INSTITUTION_LIST_TYPE
+        return FakeCollectionType()
+
+    def fetch_df_all(self, statement=None, parameters=None, arraysize=None):
+        self.executed.append((statement, parameters))
+        return super().fetch_df_all(statement, parameters, arraysize)
+
+
+def test_code_list_is_bound_as_one_collection():
+    """
+    A list of bank codes becomes a single collection bind, so the statement
+    is the same one round trip for 2 or 200 institutions.
+    """
+    from langodata.utils import msp_data
+
+    pytest.importorskip("pyarrow")
+    conn = database.DatabaseConnection("UNKNOWN")
+    conn.conn = FakeCollectionSession()
+
+    for codes in (["M100", "M200"], [f"M{i}" for i in range(200)]):
+        sql, params, columns = msp_data.build_query("BSIS", "02", codes, "31-JAN-2024", "31-JAN-2024")
+        conn.fetch_dataframe(sql, params, columns)
+
+    (first_sql, first_params), (second_sql, second_params) = conn.conn.executed
+    assert first_sql == second_sql
+    assert first_params["bank_codes"] == ("COLLECTION", ("M100", "M200"))
+    assert len(second_params["bank_codes"][1]) == 200
+
+
+def test_statement_stats_stay_bounded(monkeypatch):
+    """
+    Round trips are counted exactly at arraysize multiples, and a statement
+    run with ever new binds keeps at most MAX_BIND_SETS of them.
+    """
+    assert [database._round_trips(rows, 100) for rows in (0, 1, 100, 101, 200)] == [1, 1, 1, 2, 2]
+
+    monkeypatch.setattr(database, "MAX_BIND_SETS", 5)
+    database.reset_statement_stats()
+    for number in range(20):
+        database._record_statement("SELECT 1 FROM DUAL WHERE X = :x", {"x": number})
+
+    stats = database.statement_stats()["SELECT 1 FROM DUAL WHERE X = :x"]
+    assert stats["executions"] == 20 and stats["distinct_binds"] == 5
+    database.reset_statement_stats()
@@ -0,0 +1,89 @@
+import os
+
+import pandas as pd
+import pytest
+
+from langodata.utils import data_reader, disk_cache, period_cache
+
+
+def test_closed_months_are_served_from_disk(monkeypatch, tmp_path):
+    """
+    A repeated read fetches only the open months from Oracle; closed months
+    come back from Parquet files and are reported as cache hits.
+    """
+    pytest.importorskip("pyarrow")
+    calls = []
+
+    def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+        calls.append((start_period, end_period))
+        dates = pd.date_range(start_period, end_period, freq="ME")
+        return {"info": "Fetched.", "debug": "", "df": pd.DataFrame({"REPORTINGDATE": dates, "AMOUNT": 1.0})}
+
+    monkeypatch.setattr(disk_cache, "DISK_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(period_cache, "is_closed", lambda month, today=None: month < pd.Timestamp("2024-03-01"))
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_msp_data", fake_reader)
+
+    first = data_reader.read_data("MSP", "BSIS", "02", "M100", "01-JAN-2024", "30-APR-2024", cache=True)
+    calls.clear()
+    second = data_reader.read_data("MSP", "BSIS", "02", "M100", "31-JAN-2024", "30-APR-2024", cache=True)
+
+    assert first["metrics"]["cache_misses"] == 4
+    assert second["metrics"]["cache_hits"] == 2
+    assert calls == [("01-MAR-2024", "30-APR-2024")]
+    assert list(second["df"]["REPORTINGDATE"].dt.month) == [1, 2, 3, 4]
+    assert len(list(tmp_path.rglob("*.parquet"))) == 2
+
+    assert disk_cache.evict(0) == 2
+
+
+
+def test_empty_months_and_misshapen_fetches_are_not_kept_on_disk(monkeypatch, tmp_path):
+    """
+    A closed month without rows is not written to disk, so a late return is
+    picked up by the next process, and rows lacking the period column are a
+    failed fetch rather than an empty month.
+    """
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(disk_cache, "DISK_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(period_cache, "is_closed", lambda month, today=None: True)
+    key = ("MSP", "02", "BSIS", "M100")
+
+    def fetch_january_only(start_period, end_period):
+        return {"info": "Fetched.", "debug": "", "df": pd.DataFrame({"REPORTINGDATE": [pd.Timestamp("2024-01-31")],
+                                                                     "AMOUNT": [1.0]})}
+
+    result = period_cache.read_periods(fetch_january_only, key, "01-JAN-2024", "29-FEB-2024",
+                                       use_memory=False, use_disk=True)
+    assert len(result["df"]) == 1
+    assert len(list(tmp_path.rglob("*.parquet"))) == 1
+
+    def fetch_without_dates(start_period, end_period):
+        return {"info": "Fetched.", "debug": "", "df": pd.DataFrame({"AMOUNT": [1.0]})}
+
+    failed = period_cache.read_periods(fetch_without_dates, key, "01-MAR-2024", "31-MAR-2024",
+                                       use_memory=False, use_disk=True)
+    assert "without a REPORTINGDATE column" in failed["debug"]
+    assert len(list(tmp_path.rglob("*.parquet"))) == 1
+
+
+def test_writes_only_walk_the_cache_when_it_may_be_over_its_limit(monkeypatch, tmp_path):
+    """
+    Writes add to a running size; the directory is walked on the first write
+    and when that size crosses DISK_CACHE_MAX_BYTES, which then evicts.
+    """
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(disk_cache, "DISK_CACHE_DIR", str(tmp_path))
+    walks = []
+    walk = os.walk
+    monkeypatch.setattr(disk_cache.os, "walk", lambda top: walks.append(top) or walk(top))
+    df = pd.DataFrame({"AMOUNT": [1.0]})
+
+    for month in (1, 2, 3):
+        disk_cache.store_month(str(tmp_path / f"2024-{month:02}.parquet"), df)
+    assert len(walks) == 1
+
+    monkeypatch.setattr(disk_cache, "DISK_CACHE_MAX_BYTES", 3 * os.path.getsize(tmp_path / "2024-01.parquet"))
+    disk_cache.store_month(str(tmp_path / "2024-04.parquet"), df)
+    assert len(walks) == 2
+    assert len(list(tmp_path.rglob("*.parquet"))) == 3
@@ -0,0 +1,33 @@
+import json
+import os
+import subprocess
+import sys
+
+# Seconds `import langodata.utils` may take in a fresh interpreter.
+IMPORT_BUDGET = float(os.getenv("LANGODATA_IMPORT_BUDGET", "0.25"))
+
+HEAVY_MODULES = ["pandas", "oracledb", "cryptography", "requests", "jwt", "pytz", "unittest", "dotenv"]
+
+BENCHMARK = f"""
+import json, sys, time
+start = time.perf_counter()
+import langodata.utils
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def test_package_import_is_lazy_and_within_budget():
+    """
+    Importing the package must not load the heavy dependencies or read the
+    environment, and must finish within IMPORT_BUDGET seconds.
+    """
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env = dict(os.environ, PYTHONPATH=src)
+    env.pop("ENCRYPTION_KEY", None)
+    output = subprocess.run([sys.executable, "-c", BENCHMARK], env=env, cwd=src,
+                            capture_output=True, text=True, check=True).stdout
+    result = json.loads(output)
+
+    assert result["loaded"] == [], f"Eagerly imported: {result['loaded']}"
+    assert result["elapsed"] < IMPORT_BUDGET, f"Import took {result['elapsed']:.3f}s"
@@ -0,0 +1,135 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from langodata.utils import itrs_bop, itrs_data
+from tests.fakes import RecordingConnection
+
+
+class FakeBopConnection(RecordingConnection):
+    """
+    Answers the BOP template and the grouped scans of the FINAL tables.
+
+    `sums` maps a table to its PU_CODE totals, or for the series to those
+    totals per reporting date.
+    """
+
+    def __init__(self, sums):
+        super().__init__()
+        self.sums = sums
+
+    def answer(self, query, params, columns):
+        if "BOP_TEMPLATE" in query:
+            return pd.DataFrame([(1, "Direct insurance", 2206100, 3206100),
+                                 (2, "Life insurance", 2206110, 3206110),
+                                 (3, "Non-life insurance", 2206120, 3206120)], columns=columns)
+        assert "GROUP BY" in query and "PU_CODE" in query
+        table = next(name for name in self.sums if name in query)
+        if "GROUP BY TRUNC(REPORTINGDATE)" in query:
+            start, end = (pd.to_datetime(params[bound], format="%d-%b-%Y") for bound in ("start_period", "end_period"))
+            rows = [(pd.Timestamp(date), code, amount) for date, amounts in self.sums[table].items()
+                    for code, amount in amounts.items() if start <= pd.Timestamp(date) <= end]
+            return pd.DataFrame(rows, columns=columns)
+        return pd.DataFrame(list(self.sums[table].items()), columns=columns)
+
+
+def connect_bop(monkeypatch, sums):
+    conn = FakeBopConnection(sums)
+    monkeypatch.setattr(itrs_bop, "DatabaseConnection", lambda data_source: conn)
+    return conn
+
+
+def test_bop_uses_one_grouped_scan_per_table(monkeypatch):
+    """
+    The BOP type costs three statements however long the template is, and
+    nested payments and receipts aggregates are filled from their components.
+    """
+    conn = connect_bop(monkeypatch, {"URT_RECEIPTS_FINAL": {"2206110": 5.0, "2206120": 7.0},
+                                     "URT_PAYMENTS_FINAL": {"3206110": 2.0}})
+
+    result = itrs_data.read_itrs_data("ITRS", "BSIS", "BOP", "*", "01-JAN-2024", "31-JAN-2024")
+
+    df = result["df"].set_index("DESCRIPTIONNO")
+    assert len(conn.statements) == 3
+    assert conn.params[1:] == [{"reporting_date": "31-JAN-2024"}] * 2
+    assert (df["REG_DATE"] == pd.Timestamp("2024-01-31")).all()
+    assert list(df["RECEIPTS_AMOUNT"]) == [12.0, 5.0, 7.0]
+    assert list(df["PAYMENTS_AMOUNT"]) == [2.0, 2.0, 0.0]
+    assert df.loc[1, "NET_AMOUNT"] == 10.0
+
+
+def test_bop_series_builds_every_period_from_one_scan_per_table(monkeypatch):
+    """Each reporting date up to end_period gets its own statement, in long or wide form."""
+    conn = connect_bop(monkeypatch, {
+        "URT_RECEIPTS_FINAL": {"2024-01-31": {"2206110": 5.0, "2206120": 7.0},
+                               "2024-02-29": {"2206110": 1.0},
+                               "2024-03-31": {"2206110": 9.0}},
+        "URT_PAYMENTS_FINAL": {"2024-02-29": {"3206110": 2.0}}})
+
+    long = itrs_data.read_itrs_data("ITRS", "BSIS", "BOP_SERIES", "*", "01-JAN-2024", "29-FEB-2024")["df"]
+    wide = itrs_data.read_itrs_data("ITRS", "BSIS", "BOP_SERIES_WIDE", "*", "01-JAN-2024", "29-FEB-2024")["df"]
+
+    assert len(conn.statements) == 6
+    assert list(long["REG_DATE"].unique()) == [pd.Timestamp("2024-01-31"), pd.Timestamp("2024-02-29")]
+    assert list(long["RECEIPTS_AMOUNT"]) == [12.0, 5.0, 7.0, 1.0, 1.0, 0.0]
+    assert list(long["NET_AMOUNT"]) == [12.0, 5.0, 7.0, -1.0, -1.0, 0.0]
+    assert wide.loc[pd.Timestamp("2024-02-29"), ("PAYMENTS_AMOUNT", 1)] == 2.0
+
+
+def test_bop_regions_consolidates_urt_and_znz_without_a_third_scan(monkeypatch):
+    conn = connect_bop(monkeypatch, {
+        "URT_RECEIPTS_FINAL": {"2206110": 5.0}, "URT_PAYMENTS_FINAL": {"3206110": 2.0},
+        "ZNZ_RECEIPTS_FINAL": {"2206110": 1.0, "2206120": 3.0}, "ZNZ_PAYMENTS_FINAL": {}})
+
+    result = itrs_data.read_itrs_data("ITRS", "BSIS", "BOP_REGIONS", "*", "31-JAN-2024", "31-JAN-2024")
+
+    df = result["df"].set_index(["REGION", "DESCRIPTIONNO"])
+    assert len(conn.statements) == 5
+    assert df.loc[("URT", 1), "RECEIPTS_AMOUNT"] == 5.0
+    assert df.loc[("ZNZ", 1), "RECEIPTS_AMOUNT"] == 4.0
+    assert list(df.loc["CONSOLIDATED", "RECEIPTS_AMOUNT"]) == [9.0, 6.0, 3.0]
+    assert df.loc[("CONSOLIDATED", 1), "NET_AMOUNT"] == 7.0
+
+
+# Seconds the default plan may take to roll up ROLLUP_PERIODS periods.
+ROLLUP_BUDGET = float(os.getenv("LANGODATA_ROLLUP_BUDGET", "0.1"))
+ROLLUP_PERIODS = 120
+
+
+def test_rollup_plan_compiles_nested_groups_bottom_up():
+    """
+    Aggregates of aggregates are summed after their components, the last
+    definition of an aggregate wins and cycles are rejected.
+    """
+    groups = [{"Top": {"payments_codes": [20, 30], "receipts_codes": [], "aggregate_code": 10}},
+              {"Outer": {"Inner": {"payments_codes": [21, 22], "receipts_codes": [121],
+                                   "aggregate_code": 20, "aggregate_receipts_code": 120}}},
+              {"Old": {"payments_codes": [99], "receipts_codes": [], "aggregate_code": 30}},
+              {"New": {"payments_codes": [31], "receipts_codes": [], "aggregate_code": 30}}]
+    plan = itrs_bop.compile_account_groups(groups)
+
+    payments = plan.apply(pd.Series({21: 1.0, 22: 2.0, 31: 4.0, 99: 8.0}), "PAYMENTS")
+    receipts = plan.apply(pd.Series({120: 6.0}), "RECEIPTS")
+
+    assert payments[20] == 3.0 and payments[30] == 4.0 and payments[10] == 7.0
+    assert receipts[120] == 6.0
+    with pytest.raises(ValueError):
+        itrs_bop.compile_account_groups([{"A": {"payments_codes": [2], "aggregate_code": 1}},
+                                         {"B": {"payments_codes": [1], "aggregate_code": 2}}])
+
+
+def test_rollup_of_all_groups_over_many_periods_is_within_budget():
+    plan = itrs_bop.default_plan()
+    codes = sorted({child for levels in plan.levels.values() for edges in levels for child in edges["CHILD"]})
+    amounts = pd.DataFrame(np.random.default_rng(0).random((len(codes), ROLLUP_PERIODS)), index=codes)
+    plan.apply(amounts, "PAYMENTS")
+
+    start = time.perf_counter()
+    for direction in itrs_bop.DIRECTIONS:
+        plan.apply(amounts, direction)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < ROLLUP_BUDGET, f"Rollup took {elapsed:.3f}s"
@@ -0,0 +1,67 @@
+import pandas as pd
+
+from langodata.utils import itrs_data, itrs_pivot, result_cache
+from tests.fakes import RecordingConnection
+
+
+class FakeExtractConnection(RecordingConnection):
+    """Answers the ITRS_DETAIL extract with the rows reported within the bound periods."""
+
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+
+    def answer(self, query, params, columns):
+        assert "ITRS_DETAIL" in query
+        start, end = (pd.to_datetime(params[bound], format="%d-%b-%Y") for bound in ("start_period", "end_period"))
+        return pd.DataFrame([row for row in self.rows if start <= row[0] <= end], columns=columns)
+
+
+def test_pivots_share_one_extract_and_keep_equal_amounts(monkeypatch):
+    """
+    Equal amounts of one country and sector are added up rather than
+    collapsed, and the TZS and USD pivots are computed from one scan.
+    """
+    january = pd.Timestamp("2024-01-31")
+    conn = FakeExtractConnection([(january, "KENYA", "BANKS", "PAYMENT", "URT", 100.0, 1.0),
+                                  (january, "KENYA", "BANKS", "PAYMENT", "URT", 100.0, 1.0),
+                                  (january, "KENYA", "BANKS", "RECEIPTS", "ZANZIBAR", 50.0, 0.5),
+                                  (january, "UGANDA", "OTHER", "RECEIPTS", "URT", 20.0, 0.2)])
+    monkeypatch.setattr(itrs_pivot, "DatabaseConnection", lambda data_source: conn)
+    monkeypatch.setattr(result_cache, "_settings", dict(result_cache._settings, enabled=True, ttl={}))
+    result_cache.clear_result_cache()
+
+    tzs = itrs_data.read_itrs_data("ITRS", "BSIS", "COUNTRIES_SECTORS_TZS", "*", "01-JAN-2024", "31-JAN-2024")["df"]
+    usd = itrs_data.read_itrs_data("ITRS", "BSIS", "CONSOLIDATED_USD", "*", "01-JAN-2024", "31-JAN-2024")["df"]
+
+    assert len(conn.statements) == 1
+    assert list(tzs.columns) == ["COUNTRY", "SECTOR"] + itrs_pivot.LOCATION_PURPOSES
+    assert list(tzs["COUNTRY"]) == ["KENYA", "UGANDA"]
+    assert tzs.loc[0, "PAYMENT -URT"] == 200.0 and tzs.loc[0, "RECEIPTS -ZANZIBAR"] == 50.0
+    assert pd.isna(tzs.loc[1, "PAYMENT -URT"])
+    assert usd.loc[0, "PAYMENT -URT"] == 2.0
+    result_cache.clear_result_cache()
+
+
+def test_regions_count_shared_members_in_every_bloc(monkeypatch):
+    """
+    Tanzania adds to both EAC and SADC, a registered bloc is aggregated with
+    the others, and OTHER collects the countries of no bloc when asked for.
+    """
+    january = pd.Timestamp("2024-01-31")
+    extract = pd.DataFrame([(january, "TANZANIA", "BANKS", "PAYMENT", "URT", 10.0, 0.1),
+                            (january, "KENYA", "BANKS", "PAYMENT", "URT", 5.0, 0.05),
+                            (january, "EGYPT", "BANKS", "RECEIPTS", "URT", 7.0, 0.07)],
+                           columns=itrs_pivot.EXTRACT_COLUMNS)
+    monkeypatch.setattr(itrs_pivot, "REGION_MEMBERS", dict(itrs_pivot.REGION_MEMBERS))
+    itrs_pivot.register_region("COMESA", ["Kenya", "Egypt"])
+
+    table = itrs_pivot.pivot_regions(extract, "TZS", include_other=True).set_index("REGION_GROUPING")
+
+    assert list(table.index) == ["COMESA", "EAC", "SADC"]
+    assert table.loc["EAC", "PAYMENT_URT"] == 15.0 and table.loc["SADC", "PAYMENT_URT"] == 10.0
+    assert table.loc["COMESA", "RECEIPTS_URT"] == 7.0 and table.loc["EAC", "RECEIPTS_URT"] == 0.0
+
+    monkeypatch.setattr(itrs_pivot, "REGION_MEMBERS", {"EAC": ["TANZANIA"]})
+    other = itrs_pivot.pivot_regions(extract, "TZS", include_other=True).set_index("REGION_GROUPING")
+    assert other.loc["OTHER", "PAYMENT_URT"] == 5.0 and other.loc["OTHER", "RECEIPTS_URT"] == 7.0
@@ -0,0 +1,106 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from langodata.utils import itrs_rates
+from tests.fakes import RecordingConnection
+
+
+class FakeRatesConnection(RecordingConnection):
+    """
+    Answers the rates query with the rows on or after :since, after `delay`
+    seconds, or fails with `error` while it is set.
+    """
+
+    def __init__(self, rows, delay=0.0):
+        super().__init__()
+        self.rows = rows
+        self.delay = delay
+        self.error = None
+
+    def answer(self, query, params, columns):
+        assert "ITRS_FI_RATE" in query
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return pd.DataFrame([row for row in self.rows if pd.Timestamp(row[0]) >= pd.Timestamp(params["since"])],
+                            columns=columns)
+
+
+def connect_rates(monkeypatch, rows, delay=0.0):
+    conn = FakeRatesConnection(rows, delay)
+    monkeypatch.setattr(itrs_rates, "DatabaseConnection", lambda data_source: conn)
+    monkeypatch.setattr(itrs_rates, "_stores", {})
+    monkeypatch.setattr(itrs_rates, "_failures", {})
+    return conn
+
+
+def test_rates_refresh_incrementally_and_convert_as_of(monkeypatch):
+    """
+    A refresh only reads from the last stored date, and amounts convert
+    with the rate in force on their reporting date.
+    """
+    rows = [("2024-01-02", "EUR", "Euro", 2800.0, 1.10),
+            ("2024-01-02", "USD", "US Dollar", 2500.0, 1.0),
+            ("2024-01-05", "EUR", "Euro", 2900.0, 1.12)]
+    conn = connect_rates(monkeypatch, rows)
+
+    itrs_rates.refresh_rates("BSIS")
+    rows.append(("2024-01-08", "EUR", "Euro", 3000.0, 1.15))
+    itrs_rates.refresh_rates("BSIS")
+
+    extract = pd.DataFrame({"CURRENCY": ["EUR", "EUR", "USD", "GBP"],
+                            "REPORTINGDATE": pd.to_datetime(["2024-01-04", "2024-01-31", "2024-01-31", "2024-01-31"]),
+                            "AMOUNT_IN_ORIG_CURRENCY": [10.0, 10.0, 4.0, 1.0]})
+    usd = itrs_rates.convert_currency(extract, "USD")
+    tzs = itrs_rates.convert_currency(usd, "TZS", from_unit="USD")
+
+    assert [params["since"] for params in conn.params] == ["01-JAN-2000", "05-JAN-2024"]
+    assert len(itrs_rates.get_rates("BSIS")) == 4
+    assert list(usd["AMOUNT_IN_USD_EQV"])[:3] == [11.0, 11.5, 4.0]
+    assert pd.isna(usd.loc[3, "AMOUNT_IN_USD_EQV"])
+    assert list(tzs["AMOUNT_IN_TZS_EQV"].round(6))[:3] == [28000.0, 30000.0, 10000.0]
+    assert "AMOUNT_IN_ORIG_CURRENCY" in tzs and len(extract.columns) == 3
+
+
+def test_failed_refresh_backs_off_and_totals_convert_at_one_date(monkeypatch):
+    """
+    While Oracle is down a lookup does not try it again within the backoff,
+    and pivot totals convert between USD and TZS at the USD rates of a date.
+    """
+    conn = connect_rates(monkeypatch, [("2024-01-02", "USD", "US Dollar", 2500.0, 1.0),
+                                       ("2024-02-01", "USD", "US Dollar", 2600.0, 1.0)])
+    conn.error = ConnectionError("ORA-12541: no listener")
+
+    for _ in range(3):
+        with pytest.raises(ValueError, match="no listener"):
+            itrs_rates.get_rates("BSIS")
+    assert len(conn.statements) == 1
+
+    conn.error = None
+    monkeypatch.setattr(itrs_rates, "RATES_RETRY_BACKOFF", -1)
+    pivot = pd.DataFrame({"COUNTRY": ["KENYA"], "PAYMENT -URT": [2.0]})
+    tzs = itrs_rates.convert_totals(pivot, ["PAYMENT -URT"], "TZS", "USD", "31-JAN-2024")
+
+    assert tzs.loc[0, "PAYMENT -URT"] == 5000.0 and pivot.loc[0, "PAYMENT -URT"] == 2.0
+    with pytest.raises(ValueError):
+        itrs_rates.convert_totals(pivot, ["PAYMENT -URT"], "ORIG", "USD", "31-JAN-2024")
+
+
+def test_concurrent_lookups_share_one_refresh(monkeypatch):
+    """
+    Lookups that find the store stale at the same time wait for one refresh
+    rather than each reading the rates from Oracle.
+    """
+    conn = connect_rates(monkeypatch, [("2024-01-02", "USD", "US Dollar", 2500.0, 1.0)], delay=0.05)
+
+    threads = [threading.Thread(target=itrs_rates.get_rates, args=("BSIS",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(conn.statements) == 1
+    assert len(itrs_rates.get_rates("BSIS")) == 1
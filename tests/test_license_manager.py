@@ -0,0 +1,30 @@
+from langodata.utils import license_manager
+
+
+def test_license_is_validated_once_per_session(monkeypatch):
+    """
+    Repeated license checks reuse the cached verdict instead of generating
+    and decrypting the license on every call.
+    """
+    for name, value in {"ISSUE_DATE": "01-Jan-2099", "VALIDITY_DAYS": "30", "BSIS_USER": "u",
+                        "BSIS_PASS": "p", "EDI_USER": "u", "EDI_PASS": "p"}.items():
+        monkeypatch.setenv(name, value)
+    calls = []
+    generate_license = license_manager.generate_license
+
+    def counting_generate_license(date, days_to_expire):
+        calls.append(date)
+        return generate_license(date, days_to_expire)
+
+    monkeypatch.setattr(license_manager, "generate_license", counting_generate_license)
+    license_manager.clear_license_session()
+
+    for _ in range(5):
+        license_manager.validate_license()
+        assert license_manager.check_license_status()
+    assert len(calls) == 1, "Expected a single license derivation per session"
+
+    monkeypatch.setenv("VALIDITY_DAYS", "60")
+    license_manager.validate_license()
+    assert len(calls) == 2, "Changing the license environment must revalidate"
+    license_manager.clear_license_session()
@@ -0,0 +1,135 @@
+import pandas as pd
+
+from langodata.utils import data_reader
+from langodata.utils.partitioning import plan_partitions
+
+
+def test_plan_covers_range_on_month_ends():
+    """
+    Slices are contiguous, end on month ends and keep the requested bounds.
+    """
+    plan = plan_partitions("15-JAN-2023", "10-JUN-2023", 3)
+
+    assert plan == [
+        ("15-JAN-2023", "28-FEB-2023"),
+        ("01-MAR-2023", "30-APR-2023"),
+        ("01-MAY-2023", "10-JUN-2023"),
+    ]
+    assert plan_partitions("31-JAN-2024", "31-JAN-2024", 4) == [("31-JAN-2024", "31-JAN-2024")]
+
+
+def test_read_data_keeps_statement_order_across_partitions(monkeypatch):
+    """
+    A partitioned read returns the rows in the statement's ORDER BY, here
+    REPORTINGDATE DESC, SNO, rather than slice by slice, and reports the plan.
+    """
+    def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+        return {"info": "", "debug": "", "df": pd.DataFrame({"SNO": [1, 2],
+                                                             "REPORTINGDATE": [pd.Timestamp(end_period)] * 2})}
+
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_itrs_data", fake_reader)
+
+    feedback = data_reader.read_data("ITRS", "BSIS", "URT_PAYMENTS_FINAL", "*", "01-JAN-2023", "31-DEC-2023",
+                                     partitions=12, partition_workers=4)
+
+    df = feedback["df"]
+    assert list(df["REPORTINGDATE"].dt.strftime("%d-%b-%Y").str.upper())[:3] == ["31-DEC-2023"] * 2 + ["30-NOV-2023"]
+    assert list(df["SNO"])[:3] == [1, 2, 1]
+    assert feedback["metrics"]["partitions"] == 12
+    assert [entry["rows"] for entry in feedback["metrics"]["partition_plan"]] == [2] * 12
+
+    pivot = data_reader.read_data("ITRS", "BSIS", "CONSOLIDATED_TZS", "*", "01-JAN-2023", "31-DEC-2023", partitions=4)
+    assert "cannot be partitioned" in pivot["debug"]
+    rates = data_reader.read_data("ITRS", "BSIS", "RATES", "*", "01-JAN-2023", "31-DEC-2023", partitions=4)
+    assert "cannot be partitioned" in rates["debug"]
+
+
+def test_msp_partitions_are_merged_in_statement_order(monkeypatch):
+    """
+    Partitioned MSP reads come back as a serial read would: by institution
+    and description number, and the CONS consolidations by description number.
+    """
+    def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+        df = pd.DataFrame({"INSTITUTIONNAME": ["Alpha", "Beta"], "INSTITUTIONCODE": ["M100", "M200"],
+                           "REPORTINGDATE": [pd.Timestamp(end_period)] * 2, "DESCRIPTIONNO": [2, 1]})
+        if data_type.startswith("CONS"):
+            df = df.drop(columns=["INSTITUTIONNAME", "INSTITUTIONCODE"]).sort_values("DESCRIPTIONNO")
+        return {"info": "", "debug": "", "df": df}
+
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_msp_data", fake_reader)
+
+    returns = data_reader.read_data("MSP", "BSIS", "01", "*", "01-JAN-2024", "31-MAR-2024", partitions=3)
+    cons = data_reader.read_data("MSP", "BSIS", "CONS01", "*", "01-JAN-2024", "31-MAR-2024", partitions=3)
+
+    assert list(returns["df"]["INSTITUTIONCODE"]) == ["M100"] * 3 + ["M200"] * 3
+    assert list(returns["df"]["REPORTINGDATE"].dt.month) == [1, 2, 3, 1, 2, 3]
+    assert list(cons["df"]["DESCRIPTIONNO"]) == [1, 1, 1, 2, 2, 2]
+    assert list(cons["df"]["REPORTINGDATE"].dt.month) == [1, 2, 3, 1, 2, 3]
+
+
+def test_all_bank_read_is_sharded_by_institution(monkeypatch):
+    """
+    A sharded all-bank read passes each shard's codes to the reader, which
+    binds them as one collection, and merges the shards in order.
+    """
+    from langodata.utils import msp_data
+
+    seen = []
+
+    def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+        sql, params, columns = msp_data.build_query(data_source, data_type, bank_code, start_period, end_period)
+        seen.append((sql, params))
+        return {"info": "", "debug": "", "df": pd.DataFrame({"INSTITUTIONCODE": bank_code})}
+
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_institution_codes", lambda group, source: [f"M{i}" for i in range(7)])
+    monkeypatch.setattr(data_reader, "read_msp_data", fake_reader)
+
+    feedback = data_reader.read_data("MSP", "BSIS", "02", "*", "01-JAN-2024", "31-MAR-2024", shards=3)
+
+    assert list(feedback["df"]["INSTITUTIONCODE"]) == [f"M{i}" for i in range(7)]
+    assert [entry["institutions"] for entry in feedback["metrics"]["shard_plan"]] == [3, 2, 2]
+    assert {sql for sql, params in seen} == {seen[0][0]}, "Every shard should share one statement text"
+    assert "A.INSTITUTIONCODE IN (SELECT COLUMN_VALUE FROM TABLE(:bank_codes))" in seen[0][0]
+    assert sorted(params["bank_codes"] for sql, params in seen)[0] == ["M0", "M1", "M2"]
+
+
+def test_sharded_final_read_keeps_institutions_missing_from_the_list(monkeypatch):
+    """
+    FINAL tables are not joined to INSTITUTION, so a residual shard picks up
+    rows of unlisted or missing codes and the merged result, in the
+    statement's order, equals the unsharded read.
+    """
+    from langodata.utils import itrs_data
+    from langodata.utils.query_catalog import ExcludedInstitutions
+
+    rows = pd.DataFrame({"INSTITUTIONCODE": ["B1", "B2", "X9", None, "B3"],
+                         "SNO": [1, 2, 3, 4, 5],
+                         "REPORTINGDATE": pd.to_datetime(["2024-01-31", "2024-02-29", "2024-02-29",
+                                                          "2024-01-31", "2024-02-29"])})
+    seen = []
+
+    def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+        sql, params, columns = itrs_data.build_query(data_source, data_type, bank_code, start_period, end_period)
+        seen.append(sql)
+        if bank_code == "*":
+            selected = rows
+        elif isinstance(bank_code, ExcludedInstitutions):
+            selected = rows[~rows["INSTITUTIONCODE"].isin(params["bank_codes"])]
+        else:
+            selected = rows[rows["INSTITUTIONCODE"].isin(params["bank_codes"])]
+        return {"info": "", "debug": "", "df": selected.reset_index(drop=True)}
+
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_institution_codes", lambda group, source: ["B1", "B2", "B3"])
+    monkeypatch.setattr(data_reader, "read_itrs_data", fake_reader)
+
+    sharded = data_reader.read_data("ITRS", "BSIS", "URT_PAYMENTS_FINAL", "*", "01-JAN-2024", "29-FEB-2024", shards=2)
+    whole = rows.sort_values(["REPORTINGDATE", "SNO"], ascending=[False, True]).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(sharded["df"], whole)
+    assert sharded["metrics"]["shard_plan"][-1]["excluded_institutions"] == 3
+    assert any("INSTITUTIONCODE IS NULL OR INSTITUTIONCODE NOT IN (SELECT COLUMN_VALUE FROM TABLE(:bank_codes))"
+               in sql for sql in seen)
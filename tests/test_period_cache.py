@@ -0,0 +1,89 @@
+import pandas as pd
+
+from langodata.utils import data_reader, result_cache
+
+
+def test_overlapping_request_fetches_only_the_gap(monkeypatch):
+    """
+    After Jan-Jun has been read, Mar-Sep only fetches Jul-Sep and returns
+    the months merged in reporting order.
+    """
+    calls = []
+
+    def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+        calls.append((start_period, end_period))
+        dates = pd.date_range(start_period, end_period, freq="ME")
+        return {"info": "Fetched.", "debug": "", "df": pd.DataFrame({"REPORTINGDATE": dates, "AMOUNT": 1.0})}
+
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_msp_data", fake_reader)
+    monkeypatch.setattr(result_cache, "_settings", dict(result_cache._settings, enabled=True, ttl={}))
+    result_cache.clear_result_cache()
+
+    data_reader.read_data("MSP", "BSIS", "02", "M100", "31-JAN-2024", "30-JUN-2024")
+    feedback = data_reader.read_data("MSP", "BSIS", "02", "M100", "31-MAR-2024", "30-SEP-2024")
+
+    assert calls == [("01-JAN-2024", "30-JUN-2024"), ("01-JUL-2024", "30-SEP-2024")]
+    assert list(feedback["df"]["REPORTINGDATE"].dt.month) == [3, 4, 5, 6, 7, 8, 9]
+    assert feedback["metrics"]["memory_cache_hits"] == 4
+    assert feedback["metrics"]["cache_gaps"] == 1
+    result_cache.clear_result_cache()
+
+
+def test_institution_request_is_answered_from_all_bank_extract(monkeypatch):
+    """
+    Once MSP 01 has been read for every institution, a request for one or
+    several codes over a narrower period is filtered locally.
+    """
+    calls = []
+
+    def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+        calls.append(bank_code)
+        dates = pd.date_range(start_period, end_period, freq="ME")
+        rows = [(code, date) for date in dates for code in ("M100", "M200", "M300")]
+        return {"info": "Fetched.", "debug": "", "df": pd.DataFrame(rows, columns=["INSTITUTIONCODE", "REPORTINGDATE"])}
+
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_msp_data", fake_reader)
+    monkeypatch.setattr(result_cache, "_settings", dict(result_cache._settings, enabled=True, ttl={}))
+    result_cache.clear_result_cache()
+
+    data_reader.read_data("MSP", "BSIS", "01", "*", "01-JAN-2024", "31-MAR-2024")
+    single = data_reader.read_data("MSP", "BSIS", "01", "M200", "01-FEB-2024", "31-MAR-2024")
+    several = data_reader.read_data("MSP", "BSIS", "01", ["M300", "M100"], "01-JAN-2024", "31-JAN-2024")
+
+    assert calls == ["*"]
+    assert list(single["df"]["INSTITUTIONCODE"]) == ["M200", "M200"]
+    assert single["metrics"]["superset_cache_hits"] == 2
+    assert list(several["df"]["INSTITUTIONCODE"]) == ["M100", "M300"]
+    result_cache.clear_result_cache()
+
+
+def test_empty_months_are_cached_and_failed_fetches_are_not(monkeypatch):
+    """
+    A query that ran and found nothing is remembered even though the
+    macroeconomics reader reports its SQL in debug; a failed one is retried.
+    """
+    calls = []
+
+    def fake_reader(data_group, data_source, data_type, data_frequency, start_period, end_period, **options):
+        calls.append((start_period, end_period))
+        if len(calls) == 1:
+            return {"info": "", "debug": "Error fetching Macroeconomics data: ORA-03113", "df": pd.DataFrame()}
+        return {"info": "No data found for the given parameters.", "debug": "SQL query: SELECT ...",
+                "df": pd.DataFrame()}
+
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_macroeconomics_data", fake_reader)
+    monkeypatch.setattr(result_cache, "_settings", dict(result_cache._settings, enabled=True, ttl={}))
+    result_cache.clear_result_cache()
+
+    failed = data_reader.read_data("MACROECONOMICS", "DWH", "CPI", "MONTHLY", "01-JAN-2024", "31-MAR-2024")
+    empty = data_reader.read_data("MACROECONOMICS", "DWH", "CPI", "MONTHLY", "01-JAN-2024", "31-MAR-2024")
+    cached = data_reader.read_data("MACROECONOMICS", "DWH", "CPI", "MONTHLY", "01-JAN-2024", "31-MAR-2024")
+
+    assert "ORA-03113" in failed["debug"]
+    assert "SQL query" not in empty["debug"]
+    assert len(calls) == 2
+    assert cached["metrics"]["memory_cache_hits"] == 3
+    result_cache.clear_result_cache()
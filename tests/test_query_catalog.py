@@ -0,0 +1,38 @@
+from langodata.utils import itrs_data, msp_data
+from langodata.utils.query_catalog import bind_params, MSP_QUERIES, ITRS_QUERIES
+
+
+def test_statement_text_does_not_depend_on_bank_or_period():
+    """
+    Two different banks must produce the same SQL text so Oracle can share
+    the parsed cursor; only the bind values differ.
+    """
+    table_name = msp_data.get_table_name("02", "BSIS_DEV.")
+    first = msp_data.get_sql_query("02", table_name, "M100")
+    second = msp_data.get_sql_query("02", table_name, "M200")
+
+    assert first == second, "SQL text should not embed the bank code"
+    assert bind_params(first, start_period="31-JAN-2024", end_period="30-JUN-2024", bank_code="M100") == {
+        "start_period": "31-JAN-2024",
+        "end_period": "30-JUN-2024",
+        "bank_code": "M100",
+    }
+
+
+def test_bind_params_drops_unused_names():
+    """
+    All-bank queries have no :bank_code placeholder, so it must not be bound.
+    """
+    table_name = itrs_data.get_table_name("URT_PAYMENTS_FINAL", "BSIS_DEV.")
+    sql = itrs_data.get_sql_query("URT_PAYMENTS_FINAL", table_name, "*")
+
+    params = bind_params(sql, start_period="31-JAN-2024", end_period="31-JAN-2024", bank_code="*")
+    assert "bank_code" not in params
+
+
+def test_catalog_has_no_inline_literals_for_periods():
+    """
+    Catalog statements must reference periods through bind variables only.
+    """
+    for sql in list(MSP_QUERIES.values()) + list(ITRS_QUERIES.values()):
+        assert "{start_period}" not in sql and "{end_period}" not in sql
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from langodata.utils import data_reader, result_cache
+
+
+def test_result_cache_evicts_by_bytes_and_protects_cached_frames(monkeypatch):
+    """
+    Repeated reads are served from memory as independent copies, and the
+    least recently used result is dropped once the byte budget is exceeded.
+    """
+    calls = []
+
+    def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+        calls.append(data_type)
+        return {"info": "", "debug": "", "df": pd.DataFrame({"RATE": [float(i) for i in range(100)]})}
+
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_itrs_data", fake_reader)
+    monkeypatch.setattr(result_cache, "_settings", dict(result_cache._settings, ttl={}))
+    result_cache.clear_result_cache()
+    size = int(pd.DataFrame({"RATE": [0.0] * 100}).memory_usage(deep=True).sum())
+    result_cache.configure_result_cache(enabled=True, max_bytes=2 * size)
+
+    first = data_reader.read_data("ITRS", "BSIS", "CONSOLIDATED_TZS", "*", "01-JAN-2024", "31-JAN-2024")
+    first["df"].loc[0, "RATE"] = -1.0
+    again = data_reader.read_data("ITRS", "BSIS", "CONSOLIDATED_TZS", "*", "01-JAN-2024", "31-JAN-2024")
+    data_reader.read_data("ITRS", "BSIS", "CONSOLIDATED_TZS", "*", "01-FEB-2024", "29-FEB-2024")
+    data_reader.read_data("ITRS", "BSIS", "CONSOLIDATED_TZS", "*", "01-MAR-2024", "31-MAR-2024")
+
+    assert again["metrics"]["result_cache_hits"] == 1
+    assert again["df"].loc[0, "RATE"] == 0.0
+    assert len(calls) == 3
+    stats = result_cache.result_cache_stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 1
+    result_cache.clear_result_cache()
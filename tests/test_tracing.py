@@ -0,0 +1,48 @@
+import json
+
+import pandas as pd
+import pytest
+
+from langodata.utils import data_reader, tracing
+from langodata.utils.database import DatabaseConnection
+
+
+class FakeArrowSession:
+    """Answers every statement with three rows in one fetch, so the counters are known."""
+
+    def fetch_df_all(self, statement=None, parameters=None, arraysize=None):
+        import pyarrow
+        return pyarrow.table({"INSTITUTIONCODE": ["M100", "M200", "M300"], "AMOUNT": [1.0, 2.0, 3.0]})
+
+
+def fake_reader(data_group, data_source, data_type, bank_code, start_period, end_period, **options):
+    conn = DatabaseConnection("UNKNOWN")
+    conn.conn = FakeArrowSession()
+    return {"info": "", "debug": "", "df": conn.fetch_dataframe("SELECT 1 FROM DUAL")}
+
+
+def test_read_data_reports_phase_timings_and_metrics(tmp_path, monkeypatch):
+    """
+    Feedback carries elapsed time per phase plus fetch counters, and the
+    spans are exported to the trace file.
+    """
+    pytest.importorskip("pyarrow")
+
+    trace_file = tmp_path / "trace.jsonl"
+    monkeypatch.setattr(data_reader, "validate_environment", lambda data_group: None)
+    monkeypatch.setattr(data_reader, "read_msp_data", fake_reader)
+    tracing.set_trace_file(str(trace_file))
+    try:
+        feedback = data_reader.read_data("MSP", "BSIS", "02", "*", "31-JAN-2024", "31-JAN-2024")
+    finally:
+        tracing.set_trace_file(None)
+
+    assert isinstance(feedback["df"], pd.DataFrame)
+    assert {"handler", "fetch", "dataframe", "total"} <= set(feedback["timings"])
+    assert feedback["metrics"]["rows"] == 3
+    assert feedback["metrics"]["round_trips"] == 1
+    assert feedback["metrics"]["bytes"] > 0
+
+    spans = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert {span["name"] for span in spans} >= {"handler", "fetch", "total"}
+    assert len({span["trace_id"] for span in spans}) == 1